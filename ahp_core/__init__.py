@@ -0,0 +1,55 @@
+"""
+Core AHP math shared by the desktop GUI and the web backend.
+
+Only NumPy is imported eagerly. SciPy is loaded lazily, only when an
+eigenvector cannot be found by power iteration (see eigen.py), which keeps
+GUI and Django startup free of SciPy's import cost.
+"""
+from .consistency import (
+    CR_THRESHOLD,
+    RANDOM_INDEX,
+    calculate_consistency_index,
+    calculate_consistency_ratio,
+    calculate_lambda_max,
+    check_consistency,
+    random_index,
+)
+from .eigen import batched_principal_eigenvectors, principal_eigenvector
+from .matrix import (
+    build_comparison_matrix,
+    calculate_rankings,
+    calculate_weights_eigenvector,
+    calculate_weights_geometric_mean,
+)
+from .scales import (
+    GRADE_VALUES,
+    JUDGMENT_VALUES,
+    SCALE_TYPES,
+    UNCLAMPED_JUDGMENT_VALUES,
+    UNIFIED_TABLE,
+    integer_by_scale,
+    unify,
+)
+
+__all__ = [
+    'CR_THRESHOLD',
+    'GRADE_VALUES',
+    'JUDGMENT_VALUES',
+    'RANDOM_INDEX',
+    'SCALE_TYPES',
+    'UNCLAMPED_JUDGMENT_VALUES',
+    'UNIFIED_TABLE',
+    'batched_principal_eigenvectors',
+    'build_comparison_matrix',
+    'calculate_consistency_index',
+    'calculate_consistency_ratio',
+    'calculate_lambda_max',
+    'calculate_rankings',
+    'calculate_weights_eigenvector',
+    'calculate_weights_geometric_mean',
+    'check_consistency',
+    'integer_by_scale',
+    'principal_eigenvector',
+    'random_index',
+    'unify',
+]
@@ -0,0 +1,121 @@
+"""
+Import-time benchmark guarding GUI and backend startup.
+
+Each target is imported in a fresh interpreter several times; the fastest
+run is compared against its budget, and the run fails if SciPy was pulled
+in at import time. Exits non-zero on any failure so it can gate CI:
+
+    python -m ahp_core.benchmark
+    python -m ahp_core.benchmark --repeat 10 --budget backend=1500
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPOSITORY_ROOT = Path(__file__).resolve().parent.parent
+BACKEND_DIR = REPOSITORY_ROOT / 'web-ahp-app' / 'backend'
+
+# Code timed in the child process, per target
+TARGETS = {
+    'ahp_core': 'import ahp_core',
+    'gui': 'import gui.app',
+    'backend': (
+        'import django; django.setup(); '
+        'import comparisons.urls, comparisons.aggregation, comparisons.compute'
+    ),
+}
+
+# Default budgets in milliseconds for the fastest run
+BUDGETS = {
+    'ahp_core': 300,
+    'gui': 800,
+    'backend': 2500,
+}
+
+CHILD = '''
+import json, sys, time
+start = time.perf_counter()
+exec({code!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "scipy": "scipy" in sys.modules}}))
+'''
+
+
+def measure(target, repeat):
+    """
+    Import a target in `repeat` fresh interpreters.
+
+    Returns:
+        Tuple of (fastest time in ms, whether any run loaded SciPy)
+    """
+    env = dict(os.environ, PYTHONPATH=str(REPOSITORY_ROOT))
+    cwd = REPOSITORY_ROOT
+    if target == 'backend':
+        env.setdefault('DJANGO_SETTINGS_MODULE', 'ahp_project.settings')
+        cwd = BACKEND_DIR
+
+    timings, scipy_loaded = [], False
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', CHILD.format(code=TARGETS[target])],
+            cwd=cwd, env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        timings.append(result['ms'])
+        scipy_loaded = scipy_loaded or result['scipy']
+
+    return min(timings), scipy_loaded
+
+
+def parse_budget(value):
+    target, _, ms = value.partition('=')
+    if target not in TARGETS or not ms:
+        raise argparse.ArgumentTypeError(
+            f"Expected TARGET=MS with TARGET one of {', '.join(TARGETS)}"
+        )
+    return target, float(ms)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('targets', nargs='*', metavar='TARGET',
+                        help=f"Targets to benchmark: {', '.join(TARGETS)} (default: all)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Fresh interpreters per target (default: 5)')
+    parser.add_argument('--budget', type=parse_budget, action='append', default=[],
+                        metavar='TARGET=MS', help='Override a target budget')
+    args = parser.parse_args(argv)
+
+    unknown = set(args.targets) - set(TARGETS)
+    if unknown:
+        parser.error(f"unknown targets: {', '.join(sorted(unknown))}")
+
+    budgets = dict(BUDGETS, **dict(args.budget))
+    failed = False
+
+    for target in args.targets or TARGETS:
+        try:
+            ms, scipy_loaded = measure(target, args.repeat)
+        except subprocess.CalledProcessError as error:
+            print(f"{target:10} FAILED to import\n{error.stderr}")
+            failed = True
+            continue
+
+        problems = []
+        if ms > budgets[target]:
+            problems.append(f"over budget of {budgets[target]:.0f} ms")
+        if scipy_loaded:
+            problems.append("SciPy imported eagerly")
+        failed = failed or bool(problems)
+
+        status = '; '.join(problems) if problems else 'ok'
+        print(f"{target:10} {ms:8.1f} ms  {status}")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
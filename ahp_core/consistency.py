@@ -0,0 +1,86 @@
+"""
+Consistency metrics of pairwise comparison matrices.
+"""
+import numpy as np
+
+
+# Random Index values for consistency checking (Saaty)
+RANDOM_INDEX = {
+    1: 0.00, 2: 0.00, 3: 0.58, 4: 0.90, 5: 1.12,
+    6: 1.24, 7: 1.32, 8: 1.41, 9: 1.45, 10: 1.49,
+    11: 1.51, 12: 1.48, 13: 1.56, 14: 1.57, 15: 1.59
+}
+
+# Random Index for matrices larger than the table
+RANDOM_INDEX_DEFAULT = 1.49
+
+# Acceptance threshold for the consistency ratio
+CR_THRESHOLD = 0.10
+
+
+def random_index(n):
+    """Random Index for an n×n matrix."""
+    return RANDOM_INDEX.get(n, RANDOM_INDEX_DEFAULT)
+
+
+def calculate_lambda_max(comparison_matrix, weights):
+    """
+    Calculate lambda max (principal eigenvalue) as the mean of (A·w)_i / w_i.
+
+    Args:
+        comparison_matrix: n×n numpy array
+        weights: weight vector
+
+    Returns:
+        float: Lambda max value
+    """
+    comparison_matrix = np.asarray(comparison_matrix, dtype=float)
+    weighted_sum = comparison_matrix @ weights
+    return float(np.mean(weighted_sum / weights))
+
+
+def calculate_consistency_index(lambda_max, n):
+    """
+    Consistency Index CI = (λ_max - n) / (n - 1), 0 for n ≤ 1.
+    """
+    if n <= 1:
+        return 0.0
+    return (lambda_max - n) / (n - 1)
+
+
+def calculate_consistency_ratio(CI, n):
+    """
+    Consistency Ratio CR = CI / RI, 0 where RI is 0 (n ≤ 2).
+    """
+    RI = random_index(n)
+    return CI / RI if RI > 0 else 0.0
+
+
+def check_consistency(comparison_matrix, weights, threshold=CR_THRESHOLD):
+    """
+    Check consistency of pairwise comparisons.
+
+    Args:
+        comparison_matrix: n×n numpy array
+        weights: weight vector
+        threshold: Largest acceptable CR
+
+    Returns:
+        dict: Consistency metrics
+            - lambda_max: Principal eigenvalue
+            - CI: Consistency Index
+            - CR: Consistency Ratio
+            - is_consistent: Boolean (CR ≤ threshold)
+    """
+    n = len(weights)
+
+    lambda_max = calculate_lambda_max(comparison_matrix, weights)
+    CI = calculate_consistency_index(lambda_max, n)
+    CR = calculate_consistency_ratio(CI, n)
+
+    return {
+        'lambda_max': float(lambda_max),
+        'CI': float(CI),
+        'CR': float(CR),
+        'is_consistent': bool(CR <= threshold),
+    }
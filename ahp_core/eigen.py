@@ -0,0 +1,74 @@
+"""
+Principal eigenvectors of pairwise comparison matrices.
+
+Positive matrices are solved by (batched) power iteration in NumPy. SciPy's
+general eigen solver is imported only for matrices power iteration cannot
+handle: ones with non-positive entries or that do not converge.
+"""
+import numpy as np
+
+
+def _eig_principal(matrix):
+    """Principal eigenvector and eigenvalue with SciPy's general solver."""
+    from scipy import linalg
+
+    eigenvalues, eigenvectors = linalg.eig(matrix)
+    index = np.argmax(eigenvalues.real)
+    vector = np.abs(eigenvectors[:, index].real)
+
+    return vector / vector.sum(), float(eigenvalues[index].real)
+
+
+def batched_principal_eigenvectors(matrices, tol=1e-12, max_iter=500):
+    """
+    Principal eigenvectors of a stack of positive matrices by power iteration.
+
+    Args:
+        matrices: (..., n, n) stack of positive reciprocal matrices
+        tol: Convergence tolerance on the weight vectors
+        max_iter: Maximum number of iterations
+
+    Returns:
+        Tuple of (weights, lambda_max) with shapes (..., n) and (...)
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    positive = np.all(matrices > 0, axis=(-2, -1))
+
+    # Row geometric means are the exact answer for consistent matrices
+    safe = np.where(positive[..., None, None], matrices, 1.0)
+    weights = np.exp(np.log(safe).mean(axis=-1))
+    weights /= weights.sum(axis=-1, keepdims=True)
+    change = np.full(positive.shape, np.inf)
+
+    for _ in range(max_iter):
+        product = np.einsum('...ij,...j->...i', safe, weights)
+        new_weights = product / product.sum(axis=-1, keepdims=True)
+        change = np.max(np.abs(new_weights - weights), axis=-1)
+        weights = new_weights
+        if np.all(change < tol):
+            break
+
+    # With Σw = 1, Aw = λw gives λ = Σ(Aw)
+    lambda_max = np.einsum('...ij,...j->...', safe, weights)
+
+    # Matrices power iteration cannot handle go to the general solver
+    for index in zip(*np.nonzero(~positive | ~(change < tol))):
+        weights[index], lambda_max[index] = _eig_principal(matrices[index])
+
+    return weights, lambda_max
+
+
+def principal_eigenvector(matrix, tol=1e-12, max_iter=500):
+    """
+    Principal eigenvector (normalized to sum 1) and eigenvalue of a matrix.
+
+    Args:
+        matrix: n×n comparison matrix
+
+    Returns:
+        Tuple of (weights, lambda_max)
+    """
+    weights, lambda_max = batched_principal_eigenvectors(
+        np.asarray(matrix, dtype=float)[None], tol, max_iter
+    )
+    return weights[0], float(lambda_max[0])
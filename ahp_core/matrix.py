@@ -0,0 +1,70 @@
+"""
+Comparison matrices and the weights derived from them.
+"""
+import numpy as np
+
+from .eigen import principal_eigenvector
+
+
+def build_comparison_matrix(n, comparisons):
+    """
+    Build n×n reciprocal comparison matrix from a comparison list.
+
+    Args:
+        n: Number of alternatives
+        comparisons: List of tuples (index_a, index_b, value)
+
+    Returns:
+        numpy.ndarray: n×n comparison matrix (missing pairs are 1)
+    """
+    matrix = np.ones((n, n))
+
+    for i, j, value in comparisons:
+        matrix[i, j] = value
+        matrix[j, i] = 1.0 / value if value > 0 else 1.0
+
+    return matrix
+
+
+def calculate_weights_eigenvector(comparison_matrix):
+    """
+    Calculate weights using eigenvector method (principal eigenvector).
+
+    Args:
+        comparison_matrix: n×n numpy array
+
+    Returns:
+        numpy.ndarray: Normalized weight vector (sum = 1)
+    """
+    weights, _ = principal_eigenvector(comparison_matrix)
+    return weights
+
+
+def calculate_weights_geometric_mean(comparison_matrix):
+    """
+    Calculate weights using the row geometric mean method.
+
+    Args:
+        comparison_matrix: n×n numpy array
+
+    Returns:
+        numpy.ndarray: Normalized weight vector (sum = 1)
+    """
+    comparison_matrix = np.asarray(comparison_matrix, dtype=float)
+    geometric_means = np.exp(np.log(comparison_matrix).mean(axis=1))
+    return geometric_means / np.sum(geometric_means)
+
+
+def calculate_rankings(weights):
+    """
+    Calculate rankings from weights (1 = highest weight).
+
+    Args:
+        weights: numpy array of weights
+
+    Returns:
+        numpy.ndarray: Rankings (1-indexed)
+    """
+    rankings = np.empty(len(weights), dtype=int)
+    rankings[np.argsort(-np.asarray(weights))] = np.arange(1, len(weights) + 1)
+    return rankings
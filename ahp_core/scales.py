@@ -0,0 +1,112 @@
+"""
+Scale transformations of judgments, shared by the GUI and the backend.
+
+A judgment is a position on a scale string of g gradations; positions are
+unified onto the cardinal range [1.5, 9.5] and then transformed by one of
+the five scale types. Every (scale_type, gradations, position) value is
+precomputed once into read-only lookup tables; integer_by_scale applies
+the same transformation to arbitrary arrays.
+
+The web application clamps unified values to 1-9 before transforming them
+while the desktop application does not (the top position of a 9-gradation
+string unifies to 9.06), so the judgment table exists in both variants.
+"""
+import numpy as np
+
+
+# Scale types: 1 Integer, 2 Balanced, 3 Power, 4 Ma-Zheng, 5 Donegan
+SCALE_TYPES = (1, 2, 3, 4, 5)
+MAX_GRADATIONS = 9
+
+# Bounds of the cardinal range gradations are unified onto
+UNIFY_LOWER = 1.5
+UNIFY_UPPER = 9.5
+
+# Donegan's atanh argument is clamped to keep the value finite
+DONEGAN_CLAMP = 0.999
+
+
+def unify(position, gradations):
+    """
+    Unify a gradation position onto the cardinal scale [1.5, 9.5].
+
+    M_i^n = l + (i - 0.5) * (p - l) / n
+
+    Args:
+        position: 1-based gradation position (scalar or array)
+        gradations: Number of gradations of the scale string
+
+    Returns:
+        Unified value(s) in the range [1.5, 9.5]
+    """
+    return UNIFY_LOWER + (np.asarray(position) - 0.5) * (UNIFY_UPPER - UNIFY_LOWER) / gradations
+
+
+def integer_by_scale(grades, scale_type, clamp=True):
+    """
+    Transform grades (1-9, possibly unified fractions) by a scale type.
+
+    Args:
+        grades: Grade value or array of grade values
+        scale_type: Scale type (1-5); unknown types act as Integer
+        clamp: Clamp grades to 1-9 first (web application behaviour)
+
+    Returns:
+        float for a scalar grade, otherwise numpy.ndarray of the same shape
+    """
+    grades = np.asarray(grades, dtype=float)
+    if clamp:
+        grades = np.clip(grades, 1, 9)
+
+    if scale_type == 2:  # Balanced: w / (1 - w), w = 0.5 + (g - 1) * 0.05
+        w = 0.5 + (grades - 1) * 0.05
+        values = w / (1 - w)
+    elif scale_type == 3:  # Power
+        values = np.power(9.0, (grades - 1) / 8)
+    elif scale_type == 4:  # Ma-Zheng
+        values = 9 / (9 + 1 - grades)
+    elif scale_type == 5:  # Donegan
+        arg = np.clip((grades - 1) / 14 * np.sqrt(3), -DONEGAN_CLAMP, DONEGAN_CLAMP)
+        values = np.exp(np.arctanh(arg))
+    else:  # Integer
+        values = grades.copy()
+
+    return float(values) if values.ndim == 0 else values
+
+
+def _build_tables():
+    """
+    Precompute the unify and judgment lookup tables.
+
+    Returns:
+        Tuple of read-only arrays, NaN where unused:
+            - unified: (10, 10) unified value of [gradations, position]
+            - grade_values: (6, 10) value of integer [scale_type, grade]
+            - judgment_values: (6, 10, 10) value of [scale_type, gradations, position]
+            - unclamped_judgment_values: the same without clamping to 1-9
+    """
+    size = MAX_GRADATIONS + 1
+    gradations, positions = np.meshgrid(np.arange(size), np.arange(size), indexing='ij')
+    used = (positions >= 1) & (positions <= gradations)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        unified = np.where(used, unify(positions, gradations), np.nan)
+
+    grade_values = np.full((max(SCALE_TYPES) + 1, size), np.nan)
+    judgment_values = np.full((max(SCALE_TYPES) + 1, size, size), np.nan)
+    unclamped_judgment_values = judgment_values.copy()
+    for scale_type in SCALE_TYPES:
+        grade_values[scale_type, 1:] = integer_by_scale(np.arange(1, size), scale_type)
+        judgment_values[scale_type][used] = integer_by_scale(unified[used], scale_type)
+        unclamped_judgment_values[scale_type][used] = integer_by_scale(
+            unified[used], scale_type, clamp=False
+        )
+
+    tables = unified, grade_values, judgment_values, unclamped_judgment_values
+    for table in tables:
+        table.setflags(write=False)
+
+    return tables
+
+
+UNIFIED_TABLE, GRADE_VALUES, JUDGMENT_VALUES, UNCLAMPED_JUDGMENT_VALUES = _build_tables()
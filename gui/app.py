@@ -9,6 +9,7 @@ import numpy as np
 import math
 from typing import List, Optional, Tuple
 
+from ahp_core.scales import GRADE_VALUES, UNCLAMPED_JUDGMENT_VALUES, integer_by_scale
 from gui.scales import get_scale, get_all_scale_names, ScaleType
 from gui.calculations import (
     calculate_weights_eigenvector,
@@ -759,19 +760,7 @@ class ComparisonPanel(ttk.Frame):
 
     def integer_by_scale(self, data: float) -> float:
         """Apply scale transformation"""
-        result = data
-        scale_type = self.scale_type_var.get()
-
-        if scale_type == 2:  # Balanced
-            result = (0.5 + (data - 1) * 0.05) / (0.5 - (data - 1) * 0.05)
-        elif scale_type == 3:  # Power
-            result = math.pow(9, (data - 1) / 8)
-        elif scale_type == 4:  # Ma-Zheng
-            result = 9 / (9 + 1 - data)
-        elif scale_type == 5:  # Dodd
-            result = math.exp(math.atanh((data - 1) / 14 * math.sqrt(3)))
-
-        return result
+        return integer_by_scale(data, self.scale_type_var.get(), clamp=False)
 
     def in_range(self, value: int, min_val: int, max_val: int) -> bool:
         """Helper function equivalent to Delphi's InRange"""
@@ -815,9 +804,11 @@ class ComparisonPanel(ttk.Frame):
         else:
             ii = li
 
-        sum_w = 0.0
-        for i in range(1, ii + 1):
-            sum_w += self.integer_by_scale(1.5 + (i - 0.5) * (9.5 - 1.5) / ii)
+        # Grade values come from the precomputed scale tables
+        scale_type = self.scale_type_var.get()
+        grade_values = GRADE_VALUES[scale_type]
+        position_values = UNCLAMPED_JUDGMENT_VALUES[scale_type, li]
+        sum_w = float(UNCLAMPED_JUDGMENT_VALUES[scale_type, ii, 1:ii + 1].sum())
 
         # Build panels
         wi = 0  # Width accumulator
@@ -861,7 +852,7 @@ class ComparisonPanel(ttk.Frame):
                 # Calculate width based on complex algorithm
                 if scale_str in ['23459', '25679', '2589']:
                     # Special handling for these scales
-                    if self.scale_type_var.get() == 1:  # Integer
+                    if scale_type == 1:  # Integer
                         width = panel_scale_width * 16 // 9 // 6
 
                     pos = scale_str.index(grade_char) + 1  # 1-based position
@@ -875,36 +866,34 @@ class ComparisonPanel(ttk.Frame):
                     elif scale_str == '2589' and pos < 3:
                         is_grouped = True
 
-                    if is_grouped and self.scale_type_var.get() != 1:
+                    if is_grouped and scale_type != 1:
                         # Grouped panels з сучасним дизайном
                         if (scale_str in ['25679', '2589']) and grade_char == '2':
                             width = round(panel_scale_width / 2 * 16 / 9 / sum_w *
-                                        (self.integer_by_scale(2) + self.integer_by_scale(3) +
-                                         self.integer_by_scale(4)))
+                                        grade_values[2:5].sum())
                         elif (scale_str in ['23459', '2589']) and grade_char == '5':
                             width = round(panel_scale_width / 2 * 16 / 9 / sum_w *
-                                        (self.integer_by_scale(5) + self.integer_by_scale(6) +
-                                         self.integer_by_scale(7)))
+                                        grade_values[5:8].sum())
                         elif (scale_str in ['23459', '25679']) and grade_char == '9':
                             width = round(panel_scale_width / 2 * 16 / 9 / sum_w *
-                                        (self.integer_by_scale(8) + self.integer_by_scale(9)))
+                                        grade_values[8:10].sum())
                         new_pin.config(bg=COLORS['border'], fg=COLORS['text_primary'])
                     else:
                         # Active panels з сучасним дизайном
-                        if self.scale_type_var.get() == 1:  # Integer
+                        if scale_type == 1:  # Integer
                             width = width // (len(scale_str) - 2)
                         else:
                             width = round(panel_scale_width * 16 / 9 / 2 / sum_w *
-                                        self.integer_by_scale(grade))
+                                        grade_values[grade])
                         new_pin.config(bg=COLORS['accent'], fg='white', activebackground=COLORS['accent_light'])
                 else:
                     # Regular scale з сучасним дизайном
-                    if self.scale_type_var.get() == 1:  # Integer
+                    if scale_type == 1:  # Integer
                         width = panel_scale_width / 2 * 16 / 9 / li
                         width = int(width)
                     else:
                         width = round(panel_scale_width / 2 * 16 / 9 / sum_w *
-                                    self.integer_by_scale(1.5 + (li - i - 0.5) * (9.5 - 1.5) / li))
+                                    position_values[li - i])
                     new_pin.config(bg=COLORS['accent'], fg='white', activebackground=COLORS['accent_light'])
 
                 wi += width
@@ -2,6 +2,8 @@
 Модуль для роботи зі шкалами оцінювання та уніфікації
 """
 
+from functools import lru_cache
+
 import numpy as np
 
 
@@ -55,12 +57,13 @@ class ScaleType:
 
 
 class Scale:
-    """Базовий клас для шкал оцінювання"""
+    """Базовий клас для шкал оцінювання (значення лише для читання)"""
 
     def __init__(self, name, gradations):
         self.name = name
         self.gradations = gradations
-        self.values = self._calculate_values()
+        self.values = np.array(self._calculate_values(), dtype=float)
+        self.values.setflags(write=False)
 
     def _calculate_values(self):
         """Розрахувати значення для кожної градації"""
@@ -210,8 +213,9 @@ class DoneganScale(Scale):
             return [all_values[i] for i in indices]
 
 
+@lru_cache(maxsize=None)
 def get_scale(scale_name, gradations=3):
-    """Фабрика для створення об'єктів шкал
+    """Отримати спільний екземпляр шкали (створюється один раз)
 
     Args:
         scale_name: Назва шкали
@@ -1,5 +1,13 @@
 """
 ASGI config for ahp_project.
+
+Serves the API and the Server-Sent Events streams of project changes
+(GET /api/projects/<id>/events/, see comparisons/streams.py), e.g.:
+
+    uvicorn ahp_project.asgi:application --workers 1
+
+Events fan out in-process with the default EVENT_BROKER, so run a single
+worker process unless a shared broker is configured.
 """
 
 import os
@@ -6,6 +6,8 @@ from pathlib import Path
 from datetime import timedelta
 import os
 
+from corsheaders.defaults import default_headers
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -112,6 +114,13 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    # Binary renderers for matrix-heavy clients (see comparisons/renderers.py)
+    'DEFAULT_RENDERER_CLASSES': (
+        'rest_framework.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+        'comparisons.renderers.MessagePackRenderer',
+        'comparisons.renderers.ArrayRenderer',
+    ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
@@ -141,3 +150,34 @@ CORS_ALLOWED_ORIGINS = os.environ.get(
 ).split(',')
 
 CORS_ALLOW_CREDENTIALS = True
+
+# Conditional GETs of project read endpoints (ETag / If-None-Match)
+CORS_EXPOSE_HEADERS = ['ETag']
+CORS_ALLOW_HEADERS = (*default_headers, 'if-none-match')
+
+# Compute pool for CPU-heavy solves (see comparisons/compute.py)
+# Jobs up to COMPUTE_INLINE_MAX_SIZE matrix elements run inline in the request;
+# larger ones go to COMPUTE_POOL_SIZE worker processes (0 runs everything inline).
+# Every server process starts its own pool on its first large job, so size it as
+# cpu_count // server workers.
+COMPUTE_POOL_SIZE = int(os.environ.get('COMPUTE_POOL_SIZE', 2))
+COMPUTE_INLINE_MAX_SIZE = int(os.environ.get('COMPUTE_INLINE_MAX_SIZE', 20000))
+# Jobs waiting for a pool worker. The limit is per server process: once
+# COMPUTE_POOL_SIZE + COMPUTE_QUEUE_SIZE jobs (10 by default) are running or
+# waiting in a process, further large solves in that process answer 503.
+COMPUTE_QUEUE_SIZE = int(os.environ.get('COMPUTE_QUEUE_SIZE', 8))
+COMPUTE_TIMEOUT = float(os.environ.get('COMPUTE_TIMEOUT', 30))
+
+# Client for batched solves (see comparisons/compute_client.py): in-process by
+# default, or the standalone compute service (python -m comparisons.compute_service)
+COMPUTE_CLIENT = os.environ.get('COMPUTE_CLIENT', 'comparisons.compute_client.LocalComputeClient')
+COMPUTE_SERVICE_URL = os.environ.get('COMPUTE_SERVICE_URL', 'http://127.0.0.1:8100/')
+COMPUTE_SERVICE_TIMEOUT = float(os.environ.get('COMPUTE_SERVICE_TIMEOUT', 30))
+COMPUTE_SERVICE_FALLBACK = os.environ.get('COMPUTE_SERVICE_FALLBACK', 'True') == 'True'
+
+# Server-Sent Events of project changes (see comparisons/events.py); streams are
+# served by the ASGI application only. The local broker fans out in-process.
+EVENT_BROKER = os.environ.get('EVENT_BROKER', 'comparisons.events.LocalEventBroker')
+EVENT_STREAM_KEEPALIVE = float(os.environ.get('EVENT_STREAM_KEEPALIVE', 15))
+EVENT_STREAM_TIMEOUT = float(os.environ.get('EVENT_STREAM_TIMEOUT', 300))
+EVENT_STREAM_QUEUE_SIZE = int(os.environ.get('EVENT_STREAM_QUEUE_SIZE', 100))
@@ -0,0 +1,14 @@
+"""
+Pairwise comparison app.
+
+The AHP math is shared with the desktop application through the ahp_core
+package at the repository root, which is added to the import path here so
+manage.py, the WSGI/ASGI entry points and compute workers all find it.
+"""
+import sys
+from pathlib import Path
+
+REPOSITORY_ROOT = str(Path(__file__).resolve().parents[3])
+
+if REPOSITORY_ROOT not in sys.path:
+    sys.path.append(REPOSITORY_ROOT)
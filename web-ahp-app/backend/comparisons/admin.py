@@ -16,6 +16,8 @@ class ProjectAdmin(admin.ModelAdmin):
 @admin.register(Comparison)
 class ComparisonAdmin(admin.ModelAdmin):
     list_display = ['project', 'index_a', 'index_b', 'value', 'direction', 'reliability']
+    # Project.__str__ shows the owner's username
+    list_select_related = ['project__user']
     list_filter = ['direction', 'created_at']
     search_fields = ['project__title']
     readonly_fields = ['created_at', 'updated_at']
@@ -24,6 +26,7 @@ class ComparisonAdmin(admin.ModelAdmin):
 @admin.register(Result)
 class ResultAdmin(admin.ModelAdmin):
     list_display = ['project', 'is_consistent', 'consistency_ratio', 'lambda_max', 'created_at']
+    list_select_related = ['project__user']
     list_filter = ['is_consistent', 'created_at']
     search_fields = ['project__title']
     readonly_fields = ['created_at', 'updated_at']
@@ -1,9 +1,24 @@
 """
 Aggregation algorithms for collaborative expert decision-making.
-Implements AIJ (Aggregation of Individual Judgments) method.
+Implements AIJ (Aggregation of Individual Judgments) and AIP (Aggregation
+of Individual Priorities) methods, flat or over a tree of expert groups.
 """
-from typing import Dict, List, Tuple, TYPE_CHECKING
-from .models import Project, Comparison, ProjectCollaborator, AggregatedResult
+import hashlib
+import math
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max, Sum
+from django.utils import timezone
+
+from .models import (
+    Project, Comparison, ProjectCollaborator, AggregatedResult,
+    ConsensusRound, Feedback, Result
+)
 
 if TYPE_CHECKING:
     import numpy as np
@@ -27,36 +42,682 @@ def calculate_eigenvector_weights(matrix) -> Tuple:
             "Install it with: pip install numpy scipy"
         )
 
+    from ahp_core import (
+        calculate_consistency_index, calculate_consistency_ratio,
+        principal_eigenvector,
+    )
+
     n = len(matrix)
+    weights, lambda_max = principal_eigenvector(matrix)
+    CI = calculate_consistency_index(lambda_max, n)
+    CR = calculate_consistency_ratio(CI, n)
+
+    return weights, lambda_max, CI, CR
+
+
+# Comparison columns needed to place and convert a judgment
+JUDGMENT_COLUMNS = (
+    'user_id', 'index_a', 'index_b', 'value',
+    'scale_type', 'scale_str', 'gradations'
+)
+
+
+def log_judgment_rows(project: Project, rows: List[Tuple]) -> Tuple:
+    """
+    Convert comparison rows to log judgments on the project's scale.
+
+    Judgments are re-expressed on the project's scale type, so experts who
+    answered on different scales are aggregated on a common scale. The
+    conversion is one lookup-table gather for all rows (see
+    scales.convert_log_judgments); the grade position count of a judgment is
+    the length of its scale string, which is what the value was computed from.
+
+    Args:
+        project: Project instance
+        rows: Tuples of JUDGMENT_COLUMNS
+
+    Returns:
+        Tuple of (user_ids, index_a, index_b, log_values) arrays, without
+        judgments that point past the current alternatives list
+    """
+    import numpy as np
+    from .scales import convert_log_judgments
+
+    n = len(project.alternatives)
+
+    if not rows:
+        empty = np.zeros(0, dtype=int)
+        return empty, empty, empty, np.zeros(0)
+
+    user_ids, index_a, index_b, values, scale_types, scale_strs, gradations = (
+        np.array(column) for column in zip(*rows)
+    )
+
+    valid = (index_a < n) & (index_b < n)
+    user_ids, index_a, index_b = user_ids[valid], index_a[valid], index_b[valid]
+
+    values = values[valid].astype(float)
+    log_values = np.log(np.where(values > 0, values, 1.0))
+
+    grade_positions = np.char.str_len(scale_strs[valid].astype(str))
+    grade_positions = np.where(grade_positions > 0, grade_positions, gradations[valid])
+    log_values = convert_log_judgments(
+        log_values, scale_types[valid], grade_positions, project.scale_type
+    )
+
+    return user_ids, index_a, index_b, log_values
+
+
+def load_expert_log_tensor(project: Project, expert_ids: List[int]) -> Tuple:
+    """
+    Load all experts' comparisons with a single query into a log tensor.
+
+    Args:
+        project: Project instance
+        expert_ids: List of user IDs; tensor axis 0 follows this order
+
+    Returns:
+        Tuple of (log_tensor, mask): (k, n, n) numpy array of log judgments
+        on the project scale and (k, n, n) boolean mask of the judgments
+        actually made
+    """
+    import numpy as np
+    from .group_calculations import build_judgment_mask, build_log_tensor
+
+    n = len(project.alternatives)
+    rows = list(
+        Comparison.objects.filter(
+            project=project,
+            user_id__in=expert_ids
+        ).values_list(*JUDGMENT_COLUMNS)
+    )
+
+    if not rows:
+        shape = (len(expert_ids), n, n)
+        return np.zeros(shape), np.zeros(shape, dtype=bool)
+
+    user_ids, index_a, index_b, log_values = log_judgment_rows(project, rows)
+
+    # Map user IDs to tensor positions
+    ids = np.array(expert_ids)
+    order = np.argsort(ids)
+    positions = order[np.searchsorted(ids, user_ids, sorter=order)]
+
+    log_tensor = build_log_tensor(n, len(expert_ids), positions, index_a, index_b, log_values)
+    mask = build_judgment_mask(n, len(expert_ids), positions, index_a, index_b)
+
+    return log_tensor, mask
+
+
+AGGREGATION_METHODS = ('AIJ', 'AIP')
+
+# How each expert's influence on the group result is determined
+WEIGHTING_SCHEMES = ('equal', 'competence', 'cr', 'gci')
+
+
+def derive_expert_weights(weighting: str, log_tensor, competences: List[float],
+                          consistency: Dict = None):
+    """
+    Derive expert weights for weighted aggregation.
+
+    Args:
+        weighting: 'equal', 'competence', 'cr' or 'gci'
+        log_tensor: (k, n, n) log tensor of expert judgments
+        competences: Explicit competence value per expert
+        consistency: Optional output of batched_consistency to reuse
+
+    Returns:
+        Normalized numpy array of expert weights, or None for equal weights
+    """
+    from .group_calculations import (
+        CR_THRESHOLD, batched_consistency, gci_threshold,
+        individual_gci, normalize_expert_weights, weights_from_inconsistency
+    )
+
+    if weighting not in WEIGHTING_SCHEMES:
+        raise ValueError(
+            f"Unknown weighting '{weighting}'. "
+            f"Use one of: {', '.join(WEIGHTING_SCHEMES)}"
+        )
+
+    if weighting == 'equal':
+        return None
+
+    if weighting == 'competence':
+        return normalize_expert_weights(competences, log_tensor.shape[0])
+
+    if weighting == 'cr':
+        if consistency is None:
+            consistency = batched_consistency(log_tensor)
+        return weights_from_inconsistency(consistency['CR'], CR_THRESHOLD)
+
+    n = log_tensor.shape[-1]
+    return weights_from_inconsistency(individual_gci(log_tensor), gci_threshold(n))
+
+
+# Upper bound on bootstrap resamples per request
+MAX_BOOTSTRAP_SAMPLES = 10000
+
+
+def load_experts(project_id: int, include_partial: bool = False) -> Tuple:
+    """
+    Load the experts to aggregate and their log tensor.
+
+    Args:
+        project_id: ID of the project
+        include_partial: Also include active experts who have made at
+            least one comparison but have not completed yet
+
+    Returns:
+        Tuple of (expert_ids, competences, log_tensor, mask)
+    """
+    # Get project
+    project = Project.objects.get(id=project_id)
+    n = len(project.alternatives)
+
+    if n < 2:
+        raise ValueError("Project must have at least 2 alternatives")
+
+    # Get all users who have completed comparisons (and active ones if partial)
+    statuses = ['active', 'completed'] if include_partial else ['completed']
+    collaborators = ProjectCollaborator.objects.filter(
+        project=project,
+        status__in=statuses
+    )
+
+    experts = list(collaborators.values_list('user_id', 'competence'))
+
+    expert_ids = [user_id for user_id, _ in experts]
+    competences = [competence for _, competence in experts]
+
+    # Stack all experts' judgments into one (k, n, n) log tensor
+    log_tensor, mask = load_expert_log_tensor(project, expert_ids)
+
+    if include_partial:
+        # Experts who have not judged anything yet carry no information
+        judged = mask.any(axis=(1, 2))
+        expert_ids = [user_id for user_id, kept in zip(expert_ids, judged) if kept]
+        competences = [competence for competence, kept in zip(competences, judged) if kept]
+        log_tensor, mask = log_tensor[judged], mask[judged]
+
+    if len(expert_ids) == 0:
+        raise ValueError("No completed comparisons to aggregate")
+
+    return expert_ids, competences, log_tensor, mask
+
+
+def analyze_outliers(project_id: int, include_partial: bool = False) -> Dict:
+    """
+    Score every expert's distance from the leave-one-out group matrix.
+
+    Args:
+        project_id: ID of the project
+        include_partial: Also score active experts' partial matrices
+
+    Returns:
+        Dictionary with 'expert_ids', 'distances', 'robust_z', 'flagged'
+        and 'threshold' (lists aligned with expert_ids)
+    """
+    from .group_calculations import aggregate_log_tensor, detect_outliers, fill_missing_judgments
+
+    expert_ids, _, log_tensor, mask = load_experts(project_id, include_partial)
+
+    if include_partial:
+        group_matrix = aggregate_log_tensor(log_tensor, mask=mask)
+        log_tensor = fill_missing_judgments(log_tensor, mask, group_matrix)
+
+    outliers = detect_outliers(log_tensor)
+    outliers['expert_ids'] = expert_ids
+
+    return outliers
+
+
+def cluster_expert_opinions(project_id: int, num_clusters: int = 3,
+                            method: str = 'kmeans', include_partial: bool = False) -> Dict:
+    """
+    Cluster experts into opinion blocs with per-cluster aggregated weights.
+
+    Args:
+        project_id: ID of the project
+        num_clusters: Requested number of clusters
+        method: 'kmeans' or 'agglomerative'
+        include_partial: Also cluster active experts' partial matrices
+
+    Returns:
+        Dictionary with 'method', 'num_clusters' and 'clusters', a list of
+        {'cluster', 'size', 'expert_ids', 'weights', 'consistency_ratio', 'spread'}
+    """
+    from .group_calculations import (
+        aggregate_log_tensor, cluster_experts, fill_missing_judgments
+    )
+    from ahp_core import random_index
+
+    expert_ids, _, log_tensor, mask = load_experts(project_id, include_partial)
+
+    if include_partial:
+        log_tensor = fill_missing_judgments(
+            log_tensor, mask, aggregate_log_tensor(log_tensor, mask=mask)
+        )
 
-    # Calculate eigenvalues and eigenvectors
-    eigenvalues, eigenvectors = np.linalg.eig(matrix)
+    result = cluster_experts(log_tensor, num_clusters, method)
 
-    # Find principal eigenvector (corresponding to max eigenvalue)
-    max_eigenvalue_idx = np.argmax(eigenvalues.real)
-    lambda_max = eigenvalues[max_eigenvalue_idx].real
-    principal_eigenvector = eigenvectors[:, max_eigenvalue_idx].real
+    n = log_tensor.shape[-1]
+    RI = random_index(n)
 
-    # Normalize weights to sum to 1
-    weights = principal_eigenvector / principal_eigenvector.sum()
+    members = defaultdict(list)
+    for user_id, label in zip(expert_ids, result['labels']):
+        members[label].append(user_id)
 
-    # Calculate Consistency Index (CI)
-    CI = (lambda_max - n) / (n - 1) if n > 1 else 0
+    clusters = []
+    for label, size in enumerate(result['sizes']):
+        CI = (result['lambda_max'][label] - n) / (n - 1)
+        clusters.append({
+            'cluster': label,
+            'size': size,
+            'expert_ids': members[label],
+            'weights': result['weights'][label],
+            'consistency_ratio': CI / RI if RI > 0 else 0.0,
+            'spread': result['spread'][label],
+        })
 
-    # Random Index (RI) values from Saaty
-    RI_values = {
-        1: 0, 2: 0, 3: 0.58, 4: 0.90, 5: 1.12,
-        6: 1.24, 7: 1.32, 8: 1.41, 9: 1.45, 10: 1.49
+    return {
+        'method': method,
+        'num_clusters': len(clusters),
+        'clusters': clusters,
     }
-    RI = RI_values.get(n, 1.49)
 
-    # Calculate Consistency Ratio (CR)
-    CR = CI / RI if RI > 0 else 0
 
-    return weights, lambda_max, CI, CR
+def aggregate_comparisons(project_id: int, method: str = 'AIJ',
+                          weighting: str = 'equal', bootstrap_samples: int = 0,
+                          confidence: float = 0.95, robust: bool = False,
+                          include_partial: bool = False) -> Dict:
+    """
+    Aggregate completed experts' judgments (AIJ) or priorities (AIP).
+
+    AIJ: weighted geometric mean of judgments, a_ij = ∏_k (a_ij^(k))^(λ_k)
+    AIP: weighted geometric mean of individual priority vectors,
+         w_i = ∏_k (w_i^(k))^(λ_k), normalized to sum to 1
+
+    Expert weights λ_k are equal, taken from ProjectCollaborator.competence,
+    or derived from each expert's CR or GCI. For AIP the consistency metrics
+    describe the weighted AIJ matrix of the same experts.
+
+    Args:
+        project_id: ID of the project to aggregate
+        method: Aggregation method ('AIJ' or 'AIP')
+        weighting: Expert weighting scheme (see WEIGHTING_SCHEMES)
+        bootstrap_samples: Number of expert resamples for confidence
+            intervals (0 disables bootstrapping)
+        confidence: Confidence level of the bootstrap intervals
+        robust: Exclude experts flagged as outliers before aggregating
+        include_partial: Include active experts' partial matrices; every
+            pair is aggregated over the experts who judged it and missing
+            judgments count as the group judgment in all statistics
+
+    Returns:
+        Dictionary with aggregated results (see aggregate_comparisons_aij),
+        plus 'method', 'weighting', 'expert_weights' (one per expert),
+        'bootstrap' (intervals and rank stability, empty if disabled),
+        'outliers' (leave-one-out screening of all experts) and
+        'coverage' (per-pair judgment counts, empty unless partial)
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "NumPy is required for aggregation calculations. "
+            "Install it with: pip install numpy scipy"
+        )
+    from .group_calculations import (
+        aggregate_log_tensor, aggregate_priorities, batched_consistency,
+        bootstrap_group_weights, consensus_metrics, detect_outliers,
+        fill_missing_judgments, pair_coverage
+    )
+
+    if method not in AGGREGATION_METHODS:
+        raise ValueError(f"Unknown aggregation method '{method}'. Use 'AIJ' or 'AIP'")
+
+    if not 0 <= bootstrap_samples <= MAX_BOOTSTRAP_SAMPLES:
+        raise ValueError(f"bootstrap must be between 0 and {MAX_BOOTSTRAP_SAMPLES}")
+
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+
+    expert_ids, competences, judged_tensor, mask = load_experts(project_id, include_partial)
+
+    if include_partial:
+        log_tensor = fill_missing_judgments(
+            judged_tensor, mask, aggregate_log_tensor(judged_tensor, mask=mask)
+        )
+    else:
+        log_tensor, mask = judged_tensor, None
+
+    # Screen for outlier experts against the leave-one-out group matrix
+    outliers = detect_outliers(log_tensor)
+    outliers['expert_ids'] = expert_ids
+    outliers['robust'] = robust
+    outliers['excluded'] = []
+
+    if robust and any(outliers['flagged']):
+        keep = ~np.array(outliers['flagged'])
+        outliers['excluded'] = [
+            user_id for user_id, flagged in zip(expert_ids, outliers['flagged']) if flagged
+        ]
+        expert_ids = [user_id for user_id, kept in zip(expert_ids, keep) if kept]
+        competences = [competence for competence, kept in zip(competences, keep) if kept]
+        if mask is None:
+            log_tensor = log_tensor[keep]
+        else:
+            # Refill the kept experts' gaps from their own group matrix, so no
+            # excluded expert's judgments leak in through the filled cells
+            judged_tensor, mask = judged_tensor[keep], mask[keep]
+            log_tensor = fill_missing_judgments(
+                judged_tensor, mask, aggregate_log_tensor(judged_tensor, mask=mask)
+            )
+
+    num_experts = len(expert_ids)
+
+    # Individual priorities and CRs for all experts in one batched solve
+    consistency = None
+    if method == 'AIP' or weighting == 'cr':
+        consistency = batched_consistency(log_tensor)
+
+    expert_weights = derive_expert_weights(weighting, log_tensor, competences, consistency)
+
+    # Aggregate using weighted geometric mean, reciprocity is preserved
+    aggregated_matrix = aggregate_log_tensor(log_tensor, expert_weights, mask)
+
+    # Calculate weights using eigenvector method
+    weights, lambda_max, CI, CR = calculate_eigenvector_weights(aggregated_matrix)
+
+    if method == 'AIP':
+        weights = aggregate_priorities(consistency['weights'], expert_weights)
+
+    # Expert compatibility and consensus against the group
+    consensus = consensus_metrics(log_tensor, weights)
+    consensus['expert_ids'] = expert_ids
+
+    # Percentile intervals and rank stability from resampled experts
+    bootstrap = {}
+    if bootstrap_samples:
+        bootstrap = bootstrap_group_weights(
+            log_tensor, weights, bootstrap_samples, expert_weights,
+            priorities=consistency['weights'] if method == 'AIP' else None,
+            confidence=confidence
+        )
+
+    if expert_weights is None:
+        expert_weights = np.full(num_experts, 1.0 / num_experts)
+
+    return {
+        'aggregated_matrix': aggregated_matrix.tolist(),
+        'weights': weights.tolist(),
+        'consistency_ratio': CR,
+        'lambda_max': lambda_max,
+        'consistency_index': CI,
+        'num_experts': num_experts,
+        'expert_ids': expert_ids,
+        'consensus': consensus,
+        'method': method,
+        'weighting': weighting,
+        'expert_weights': expert_weights.tolist(),
+        'bootstrap': bootstrap,
+        'outliers': outliers,
+        'include_partial': include_partial,
+        'coverage': pair_coverage(mask) if mask is not None else {}
+    }
+
+
+# Separator of nested group labels, e.g. "Engineering/Backend"
+GROUP_SEPARATOR = '/'
+
+# How long team-level aggregates stay cached (seconds)
+TEAM_CACHE_TIMEOUT = 24 * 60 * 60
+
 
+def _group_path(label: str) -> Tuple:
+    """Split a group label into its path in the aggregation tree."""
+    return tuple(part.strip() for part in label.split(GROUP_SEPARATOR) if part.strip())
 
-def aggregate_comparisons_aij(project_id: int) -> Dict:
+
+def _team_cache_key(project: Project, path: Tuple, members: List[Tuple],
+                    stamps: Dict, weighting: str, include_partial: bool) -> str:
+    """
+    Cache key of a team aggregate.
+
+    The key covers everything the team matrix depends on, so it changes
+    whenever a member is added, removed, re-weighted or edits a judgment,
+    and stays the same while only other teams change.
+    """
+    fingerprint = repr((
+        len(project.alternatives), project.scale_type, weighting, include_partial,
+        sorted((user_id, competence, stamps.get(user_id)) for user_id, competence in members)
+    ))
+    digest = hashlib.sha1(fingerprint.encode()).hexdigest()
+    return f"ahp:team:{project.id}:{GROUP_SEPARATOR.join(path)}:{digest}"
+
+
+def _aggregate_team(log_tensor, mask, competences: List[float], weighting: str,
+                    include_partial: bool) -> Tuple:
+    """
+    Aggregate one team's members into a team log matrix.
+
+    Returns:
+        Tuple of (log_matrix, covered) numpy arrays
+    """
+    from .group_calculations import aggregate_log_matrices, fill_missing_judgments
+    import numpy as np
+
+    if include_partial:
+        log_matrix, _ = aggregate_log_matrices(log_tensor, mask=mask)
+        log_tensor = fill_missing_judgments(log_tensor, mask, np.exp(log_matrix))
+    else:
+        mask = None
+
+    expert_weights = derive_expert_weights(weighting, log_tensor, competences)
+    return aggregate_log_matrices(log_tensor, expert_weights, mask)
+
+
+def _combine_subtree(path: Tuple, tree: Dict, team_results: Dict,
+                     group_weights: Dict, subtrees: Dict = None) -> Tuple:
+    """
+    Aggregate a subtree bottom-up from its team matrices.
+
+    Children are combined with the weights in Project.group_weights (default
+    1.0). Members attached directly to an inner node form one more child
+    team of weight 1.0. Each pair is averaged over the children that cover it.
+    Subtrees already combined can be passed in `subtrees`.
+
+    Returns:
+        Tuple of (log_matrix, covered) numpy arrays
+    """
+    from .group_calculations import aggregate_log_matrices
+    import numpy as np
+
+    children = []
+    for name in sorted(tree[path]):
+        child = path + (name,)
+        weight = group_weights.get(GROUP_SEPARATOR.join(child), 1.0)
+        if subtrees and child in subtrees:
+            children.append((weight, subtrees[child]))
+        else:
+            children.append((weight, _combine_subtree(child, tree, team_results, group_weights)))
+
+    if path in team_results:
+        if not children:
+            return team_results[path]
+        children.append((1.0, team_results[path]))
+
+    weights = [weight for weight, _ in children]
+    log_tensor = np.stack([log_matrix for _, (log_matrix, _) in children])
+    mask = np.stack([covered for _, (_, covered) in children])
+
+    # Children's pair coverage acts as the judgment mask one level up
+    mask = mask & ~np.eye(mask.shape[-1], dtype=bool)
+    return aggregate_log_matrices(log_tensor, weights, mask)
+
+
+def aggregate_hierarchical(project_id: int, weighting: str = 'equal',
+                           include_partial: bool = False) -> Dict:
+    """
+    Aggregate experts team by team, then teams up the group tree (AIJ).
+
+    Experts are grouped by ProjectCollaborator.group; nested labels such as
+    "Engineering/Backend" form a tree. Members of a team are aggregated with
+    the chosen weighting scheme, then team matrices are aggregated level by
+    level with the team weights in Project.group_weights. Experts without a
+    group form one team of their own.
+
+    Team matrices are cached per team and reused while the team's members and
+    their judgments are unchanged; independent top-level subtrees are
+    computed in parallel.
+
+    Args:
+        project_id: ID of the project
+        weighting: Expert weighting scheme inside each team
+        include_partial: Include active experts' partial matrices
+
+    Returns:
+        Dictionary with aggregated results (see aggregate_comparisons_aij)
+        plus 'groups': per-team weights, size and cache status
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "NumPy is required for aggregation calculations. "
+            "Install it with: pip install numpy scipy"
+        )
+    from ahp_core import batched_principal_eigenvectors
+
+    if weighting not in WEIGHTING_SCHEMES:
+        raise ValueError(
+            f"Unknown weighting '{weighting}'. "
+            f"Use one of: {', '.join(WEIGHTING_SCHEMES)}"
+        )
+
+    project = Project.objects.get(id=project_id)
+    if len(project.alternatives) < 2:
+        raise ValueError("Project must have at least 2 alternatives")
+
+    statuses = ['active', 'completed'] if include_partial else ['completed']
+    collaborators = ProjectCollaborator.objects.filter(project=project, status__in=statuses)
+    experts = list(collaborators.values_list('user_id', 'competence', 'group'))
+
+    if len(experts) == 0:
+        raise ValueError("No completed comparisons to aggregate")
+
+    # Last edit, size and value checksum of every expert's judgments, in one query
+    stamps = {
+        row['user_id']: (row['last_update'].isoformat(), row['count'], row['checksum'])
+        for row in Comparison.objects.filter(
+            project=project,
+            user_id__in=[user_id for user_id, _, _ in experts]
+        ).values('user_id').annotate(
+            last_update=Max('updated_at'), count=Count('id'), checksum=Sum('value')
+        )
+    }
+
+    teams = defaultdict(list)
+    for user_id, competence, group in experts:
+        if include_partial and user_id not in stamps:
+            continue  # Nothing judged yet
+        teams[_group_path(group)].append((user_id, competence))
+
+    if not teams:
+        raise ValueError("No completed comparisons to aggregate")
+
+    # Reuse cached team matrices, load judgments only for changed teams
+    team_results = {}
+    pending = []
+    for path, members in teams.items():
+        key = _team_cache_key(project, path, members, stamps, weighting, include_partial)
+        cached = cache.get(key)
+        if cached is not None:
+            team_results[path] = cached
+        else:
+            pending.append((path, members, key))
+
+    if pending:
+        member_ids = [user_id for _, members, _ in pending for user_id, _ in members]
+        log_tensor, mask = load_expert_log_tensor(project, member_ids)
+
+        jobs = []
+        start = 0
+        for path, members, key in pending:
+            stop = start + len(members)
+            competences = [competence for _, competence in members]
+            jobs.append((log_tensor[start:stop], mask[start:stop], competences))
+            start = stop
+
+        workers = min(len(jobs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(
+                lambda job: _aggregate_team(*job, weighting, include_partial), jobs
+            ))
+
+        for (path, _, key), result in zip(pending, results):
+            cache.set(key, result, TEAM_CACHE_TIMEOUT)
+            team_results[path] = result
+
+    # Build the group tree: every path prefix is a node
+    tree = {(): set()}
+    for path in team_results:
+        for depth in range(len(path)):
+            tree.setdefault(path[:depth], set()).add(path[depth])
+            tree.setdefault(path[:depth + 1], set())
+
+    group_weights = project.group_weights or {}
+
+    # Independent top-level subtrees in parallel, then the root
+    top_level = [(name,) for name in sorted(tree[()])]
+    subtrees = {}
+    if top_level:
+        with ThreadPoolExecutor(max_workers=min(len(top_level), os.cpu_count() or 1)) as pool:
+            subtrees = dict(zip(top_level, pool.map(
+                lambda path: _combine_subtree(path, tree, team_results, group_weights),
+                top_level
+            )))
+
+    root_log, _ = _combine_subtree((), tree, team_results, group_weights, subtrees)
+
+    aggregated_matrix = np.exp(root_log)
+    weights, lambda_max, CI, CR = calculate_eigenvector_weights(aggregated_matrix)
+
+    # Team priorities in one batched solve
+    paths = sorted(team_results)
+    team_weights, _ = batched_principal_eigenvectors(
+        np.exp(np.stack([team_results[path][0] for path in paths]))
+    )
+    pending_paths = {path for path, _, _ in pending}
+    groups = {
+        GROUP_SEPARATOR.join(path): {
+            'num_experts': len(teams[path]),
+            'weights': team_weight.tolist(),
+            'group_weight': group_weights.get(GROUP_SEPARATOR.join(path), 1.0) if path else 1.0,
+            'cached': path not in pending_paths,
+        }
+        for path, team_weight in zip(paths, team_weights)
+    }
+
+    expert_ids = [user_id for path in paths for user_id, _ in teams[path]]
+
+    return {
+        'aggregated_matrix': aggregated_matrix.tolist(),
+        'weights': weights.tolist(),
+        'consistency_ratio': CR,
+        'lambda_max': lambda_max,
+        'consistency_index': CI,
+        'num_experts': len(expert_ids),
+        'expert_ids': expert_ids,
+        'method': 'AIJ',
+        'weighting': weighting,
+        'include_partial': include_partial,
+        'groups': groups,
+    }
+
+
+def aggregate_comparisons_aij(project_id: int, weighting: str = 'equal') -> Dict:
     """
     Aggregate individual judgments using geometric mean (AIJ method).
 
@@ -69,9 +730,11 @@ def aggregate_comparisons_aij(project_id: int) -> Dict:
       * Unanimity
 
     Formula: a_ij^(group) = (∏_{k=1}^{n} a_ij^(k))^(1/n)
+    With expert weights: a_ij^(group) = ∏_k (a_ij^(k))^(λ_k)
 
     Args:
         project_id: ID of the project to aggregate
+        weighting: Expert weighting scheme (see WEIGHTING_SCHEMES)
 
     Returns:
         Dictionary with aggregated results:
@@ -82,111 +745,642 @@ def aggregate_comparisons_aij(project_id: int) -> Dict:
             'lambda_max': float,
             'consistency_index': float,
             'num_experts': int,
-            'expert_ids': [...]            # List of user IDs
+            'expert_ids': [...],           # List of user IDs
+            'consensus': {...},            # GCI, distances, consensus score
+            'expert_weights': [...]        # Weight of each expert
         }
     """
-    try:
-        import numpy as np
-    except ImportError:
-        raise ImportError(
-            "NumPy is required for aggregation calculations. "
-            "Install it with: pip install numpy scipy"
+    return aggregate_comparisons(project_id, 'AIJ', weighting)
+
+
+def compute_aggregated_result(project_id: int, method: str = 'AIJ',
+                              weighting: str = 'equal', bootstrap_samples: int = 0,
+                              confidence: float = 0.95, robust: bool = False,
+                              include_partial: bool = False,
+                              hierarchical: bool = False) -> Dict:
+    """
+    Calculate aggregated results as AggregatedResult field values.
+
+    Args:
+        project_id: ID of the project
+        method: Aggregation method ('AIJ' or 'AIP')
+        weighting: Expert weighting scheme (see WEIGHTING_SCHEMES)
+        bootstrap_samples: Number of bootstrap resamples (0 disables)
+        confidence: Confidence level of the bootstrap intervals
+        robust: Exclude outlier experts before aggregating
+        include_partial: Include active experts' partial matrices
+        hierarchical: Aggregate team by team along the expert group tree
+            (AIJ only; bootstrap and robust mode do not apply)
+
+    Returns:
+        Dictionary of AggregatedResult field values
+    """
+    if hierarchical:
+        if method != 'AIJ':
+            raise ValueError("Hierarchical aggregation supports the AIJ method only")
+        result_data = aggregate_hierarchical(project_id, weighting, include_partial)
+    else:
+        result_data = aggregate_comparisons(
+            project_id, method, weighting, bootstrap_samples, confidence,
+            robust, include_partial
         )
 
-    # Get project
-    project = Project.objects.get(id=project_id)
-    n = len(project.alternatives)
+    return {
+        'aggregation_method': method,
+        'weighting': weighting,
+        'num_experts': result_data['num_experts'],
+        'aggregated_matrix': result_data['aggregated_matrix'],
+        'final_weights': result_data['weights'],
+        'consistency_ratio': result_data['consistency_ratio'],
+        'lambda_max': result_data['lambda_max'],
+        'consistency_index': result_data['consistency_index'],
+        'expert_weights': dict(zip(
+            (str(user_id) for user_id in result_data['expert_ids']),
+            result_data.get('expert_weights', [])
+        )),
+        'consensus': result_data.get('consensus', {}),
+        'bootstrap': result_data.get('bootstrap', {}),
+        'outliers': result_data.get('outliers', {}),
+        'include_partial': result_data['include_partial'],
+        'coverage': result_data.get('coverage', {}),
+        'group_results': result_data.get('groups', {}),
+    }
 
-    if n < 2:
-        raise ValueError("Project must have at least 2 alternatives")
 
-    # Get all users who have completed comparisons
-    completed_collaborators = ProjectCollaborator.objects.filter(
-        project=project,
-        status='completed'
-    )
+def aggregation_options(aggregated_result: AggregatedResult) -> Dict:
+    """
+    Recover the options a saved aggregated result was calculated with.
 
-    expert_ids = list(completed_collaborators.values_list('user_id', flat=True))
+    Args:
+        aggregated_result: AggregatedResult instance
 
-    if len(expert_ids) == 0:
-        raise ValueError("No completed comparisons to aggregate")
+    Returns:
+        Keyword arguments for compute_aggregated_result
+    """
+    return {
+        'method': aggregated_result.aggregation_method,
+        'weighting': aggregated_result.weighting,
+        'bootstrap_samples': aggregated_result.bootstrap.get('num_samples', 0),
+        'confidence': aggregated_result.bootstrap.get('confidence', 0.95),
+        'robust': aggregated_result.outliers.get('robust', False),
+        'include_partial': aggregated_result.include_partial,
+        'hierarchical': bool(aggregated_result.group_results),
+    }
 
-    # Build comparison matrix for each expert
-    user_matrices = {}
-    for user_id in expert_ids:
-        matrix = np.ones((n, n))
-        comparisons = Comparison.objects.filter(
-            project=project,
-            user_id=user_id
-        )
 
-        for comp in comparisons:
-            matrix[comp.index_a][comp.index_b] = comp.value
-            matrix[comp.index_b][comp.index_a] = 1.0 / comp.value
+def aggregation_job_size(project: Project, include_partial: bool = False,
+                         bootstrap_samples: int = 0) -> int:
+    """
+    Number of matrix elements an aggregation solves over, k·n² per pass.
 
-        user_matrices[user_id] = matrix
+    Args:
+        project: Project instance
+        include_partial: Whether active experts are aggregated too
+        bootstrap_samples: Number of bootstrap resamples
 
-    # Aggregate using geometric mean (AIJ)
-    aggregated_matrix = np.ones((n, n))
-    num_experts = len(user_matrices)
+    Returns:
+        Job size for compute.dispatch
+    """
+    k = project.completed_experts + (project.active_experts if include_partial else 0)
+    n = len(project.alternatives)
+    return k * n * n * (1 + max(bootstrap_samples, 0))
 
-    for i in range(n):
-        for j in range(i + 1, n):
-            # Geometric mean of all experts' judgments for this pair
-            product = 1.0
-            for user_id, matrix in user_matrices.items():
-                product *= matrix[i][j]
 
-            # Take nth root (geometric mean)
-            agg_value = product ** (1.0 / num_experts)
+def calculate_individual_results(project: Project, expert_ids: List[int]) -> Dict:
+    """
+    Each expert's own matrix, weights and consistency in one batched solve.
 
-            # Preserve reciprocity
-            aggregated_matrix[i][j] = agg_value
-            aggregated_matrix[j][i] = 1.0 / agg_value
+    Matrices are built from the judgments as entered, without conversion
+    to the project scale, and solved by the configured compute client.
 
-    # Calculate weights using eigenvector method
-    weights, lambda_max, CI, CR = calculate_eigenvector_weights(aggregated_matrix)
+    Args:
+        project: Project instance
+        expert_ids: List of user IDs
+
+    Returns:
+        Dictionary keyed by user ID of {'matrix', 'weights',
+        'consistency_ratio', 'lambda_max', 'consistency_index'} for
+        experts with at least one comparison
+    """
+    judged_ids, matrices, solutions = individual_result_arrays(project, expert_ids)
 
     return {
-        'aggregated_matrix': aggregated_matrix.tolist(),
-        'weights': weights.tolist(),
-        'consistency_ratio': CR,
-        'lambda_max': lambda_max,
-        'consistency_index': CI,
-        'num_experts': num_experts,
-        'expert_ids': expert_ids
+        user_id: {'matrix': matrix, **solution}
+        for user_id, matrix, solution in zip(judged_ids, matrices.tolist(), solutions)
     }
 
 
-def save_aggregated_result(project_id: int, method: str = 'AIJ') -> AggregatedResult:
+def individual_result_arrays(project: Project, expert_ids: List[int]) -> Tuple:
+    """
+    Individual results as in calculate_individual_results, with the matrices
+    kept as one NumPy array for binary responses.
+
+    Args:
+        project: Project instance
+        expert_ids: List of user IDs
+
+    Returns:
+        Tuple of (judged user IDs, k×n×n matrices, list of k solutions)
+    """
+    import numpy as np
+    from .compute_client import get_compute_client
+    from .group_calculations import build_log_tensor
+
+    n = len(project.alternatives)
+    rows = list(
+        Comparison.objects.filter(
+            project=project,
+            user_id__in=expert_ids,
+            index_a__lt=n,
+            index_b__lt=n
+        ).values_list('user_id', 'index_a', 'index_b', 'value')
+    )
+
+    if not rows:
+        return [], np.zeros((0, n, n)), []
+
+    user_ids, index_a, index_b, values = (np.array(column) for column in zip(*rows))
+
+    # Only experts who compared anything get a result
+    judged_ids = sorted(set(user_ids.tolist()))
+    positions = np.searchsorted(judged_ids, user_ids)
+    values = values.astype(float)
+    log_values = np.log(np.where(values > 0, values, 1.0))
+
+    matrices = np.exp(
+        build_log_tensor(n, len(judged_ids), positions, index_a, index_b, log_values)
+    )
+    solutions = get_compute_client().solve_many(matrices.tolist())
+
+    return judged_ids, matrices, solutions
+
+
+def save_aggregated_result(project_id: int, method: str = 'AIJ',
+                           weighting: str = 'equal', bootstrap_samples: int = 0,
+                           confidence: float = 0.95, robust: bool = False,
+                           include_partial: bool = False,
+                           hierarchical: bool = False) -> AggregatedResult:
     """
     Calculate and save aggregated results for a project.
 
     Args:
         project_id: ID of the project
         method: Aggregation method ('AIJ' or 'AIP')
+        weighting: Expert weighting scheme (see WEIGHTING_SCHEMES)
+        bootstrap_samples: Number of bootstrap resamples (0 disables)
+        confidence: Confidence level of the bootstrap intervals
+        robust: Exclude outlier experts before aggregating
+        include_partial: Include active experts' partial matrices
+        hierarchical: Aggregate team by team along the expert group tree
 
     Returns:
         AggregatedResult instance
+
+    Raises:
+        compute.ComputeBusy, compute.ComputeTimeout: If a large aggregation
+            cannot be run in the compute pool
     """
-    if method != 'AIJ':
-        raise ValueError("Only AIJ method is currently supported")
+    from .compute import dispatch
 
-    # Calculate aggregation
-    result_data = aggregate_comparisons_aij(project_id)
+    project = Project.objects.get(id=project_id)
+
+    # Calculate aggregation, in the compute pool for large panels
+    fields = dispatch(
+        compute_aggregated_result,
+        project_id, method, weighting, bootstrap_samples, confidence,
+        robust, include_partial, hierarchical,
+        size=aggregation_job_size(project, include_partial, bootstrap_samples)
+    )
 
     # Save to database
-    project = Project.objects.get(id=project_id)
-    aggregated_result = AggregatedResult.objects.create(
-        project=project,
-        aggregation_method=method,
-        num_experts=result_data['num_experts'],
-        aggregated_matrix=result_data['aggregated_matrix'],
-        final_weights=result_data['weights'],
-        consistency_ratio=result_data['consistency_ratio'],
-        lambda_max=result_data['lambda_max'],
-        consistency_index=result_data['consistency_index'],
-        expert_weights={}  # For AIJ, individual weights not needed
+    return AggregatedResult.objects.create(project=project, **fields)
+
+
+# Judgment fields written by a comparison upsert, with their defaults
+COMPARISON_DEFAULTS = {
+    'reliability': 0.0,
+    'scale_str': '259',
+    'scale_type': 1,
+    'gradations': 3,
+    'refinement_level': 0,
+}
+
+# Type and inclusive range of the numeric fields of COMPARISON_DEFAULTS
+COMPARISON_FIELD_RANGES = {
+    'reliability': ((int, float), 0, 8),
+    'scale_type': (int, 1, 5),
+    'gradations': (int, 2, 8),
+    'refinement_level': (int, 0, 3),
+}
+SCALE_STR_MAX_LENGTH = 50
+
+
+def _is_number(value, types=(int, float)) -> bool:
+    return isinstance(value, types) and not isinstance(value, bool)
+
+
+def _judgment_error(judgment, n: int) -> Optional[str]:
+    """Why a submitted judgment is invalid for n alternatives, or None."""
+    if not isinstance(judgment, dict):
+        return "must be an object"
+
+    for field in ('index_a', 'index_b'):
+        index = judgment.get(field)
+        if not _is_number(index, int):
+            return f"{field} must be an integer"
+        if not 0 <= index < n:
+            return f"{field} must be between 0 and {n - 1}"
+    if judgment['index_a'] == judgment['index_b']:
+        return "index_a and index_b must differ"
+
+    value = judgment.get('value')
+    if not _is_number(value) or not math.isfinite(value) or value <= 0:
+        return "value must be a positive number"
+    if judgment.get('direction') not in ('more', 'less'):
+        return "direction must be 'more' or 'less'"
+
+    for field, (types, low, high) in COMPARISON_FIELD_RANGES.items():
+        if field in judgment:
+            if not _is_number(judgment[field], types) or not low <= judgment[field] <= high:
+                return f"{field} must be a number between {low} and {high}"
+    if 'scale_str' in judgment:
+        scale_str = judgment['scale_str']
+        if not isinstance(scale_str, str) or not 0 < len(scale_str) <= SCALE_STR_MAX_LENGTH:
+            return f"scale_str must be a string of 1 to {SCALE_STR_MAX_LENGTH} characters"
+
+    return None
+
+
+def save_comparisons(project: Project, user, judgments: List[Dict]) -> List[Tuple[int, int]]:
+    """
+    Upsert a batch of one user's judgments in a single transaction.
+
+    The whole batch is validated before anything is written. Index order
+    is canonicalized for the whole batch at once (index_a <
+    index_b, inverting the value and direction of swapped pairs) and a pair
+    submitted more than once keeps its last judgment. Collaborative
+    judgments are upserted with one bulk_create(update_conflicts=True);
+    single-user judgments have no user, and NULLs never conflict, so they
+    are split into a bulk_update of existing pairs and a bulk_create of new
+    ones. Bulk writes send no signals, so the progress counters are adjusted
+    and the progress event is published here, for the new pairs.
+
+    Args:
+        project: Project instance
+        user: User making the judgments
+        judgments: Dictionaries with index_a, index_b, value, direction and
+            optionally the fields of COMPARISON_DEFAULTS
+
+    Returns:
+        Canonical (index_a, index_b) pairs saved, one per saved comparison
+
+    Raises:
+        ValueError: If the batch is empty or too large, or a judgment is
+            invalid (the message names its position in the batch)
+    """
+    import numpy as np
+    from .counters import add_comparisons
+    from .events import publish_project_event
+
+    n = len(project.alternatives)
+    total_needed = n * (n - 1) // 2
+
+    if not isinstance(judgments, list) or not judgments:
+        raise ValueError("comparisons must be a non-empty list")
+    if len(judgments) > total_needed:
+        raise ValueError(f"At most {total_needed} comparisons can be submitted at once")
+
+    for position, judgment in enumerate(judgments):
+        error = _judgment_error(judgment, n)
+        if error is not None:
+            raise ValueError(f"Comparison {position}: {error}")
+
+    index_a = np.array([judgment['index_a'] for judgment in judgments], dtype=int)
+    index_b = np.array([judgment['index_b'] for judgment in judgments], dtype=int)
+    values = np.array([judgment['value'] for judgment in judgments], dtype=float)
+
+    # Canonical form: index_a < index_b
+    swapped = index_a > index_b
+    index_a, index_b = np.minimum(index_a, index_b), np.maximum(index_a, index_b)
+    values = np.where(swapped, 1.0 / values, values)
+
+    # Keep the last judgment of each pair
+    _, last = np.unique((index_a * n + index_b)[::-1], return_index=True)
+    keep = np.sort(len(judgments) - 1 - last)
+
+    comparisons = []
+    for position in keep:
+        judgment = judgments[position]
+        direction = judgment['direction']
+        if swapped[position]:
+            direction = 'less' if direction == 'more' else 'more'
+
+        comparisons.append(Comparison(
+            project=project,
+            user=user if project.is_collaborative else None,
+            index_a=int(index_a[position]),
+            index_b=int(index_b[position]),
+            value=float(values[position]),
+            direction=direction,
+            **{field: judgment.get(field, default) for field, default in COMPARISON_DEFAULTS.items()}
+        ))
+
+    update_fields = ['value', 'direction', *COMPARISON_DEFAULTS, 'updated_at']
+
+    with transaction.atomic():
+        # Serialize batches of the same judge, so the count of new pairs holds
+        if project.is_collaborative:
+            list(ProjectCollaborator.objects.select_for_update().filter(project=project, user=user))
+            judge = Comparison.objects.filter(project=project, user=user)
+        else:
+            list(Project.objects.select_for_update().filter(id=project.id))
+            judge = Comparison.objects.filter(project=project)
+
+        existing = {
+            (a, b): comparison_id
+            for comparison_id, a, b in judge.values_list('id', 'index_a', 'index_b')
+        }
+        created = [
+            comparison for comparison in comparisons
+            if (comparison.index_a, comparison.index_b) not in existing
+        ]
+
+        if project.is_collaborative:
+            Comparison.objects.bulk_create(
+                comparisons,
+                update_conflicts=True,
+                unique_fields=['project', 'user', 'index_a', 'index_b'],
+                update_fields=update_fields
+            )
+        else:
+            now = timezone.now()
+            updated = []
+            for comparison in comparisons:
+                comparison.id = existing.get((comparison.index_a, comparison.index_b))
+                if comparison.id is not None:
+                    comparison.updated_at = now
+                    updated.append(comparison)
+
+            Comparison.objects.bulk_update(updated, update_fields)
+            Comparison.objects.bulk_create(created)
+
+        # Bulk writes send no signals, so count the new pairs here
+        judge_id = user.id if project.is_collaborative else None
+        add_comparisons(project.id, judge_id, len(created))
+        if created:
+            publish_project_event(project.id, 'progress', user_id=judge_id, added=len(created))
+
+    return [(comparison.index_a, comparison.index_b) for comparison in comparisons]
+
+
+def rescale_project(project_id: int, scale_type: int) -> Dict:
+    """
+    Move a project and all of its stored judgments to another scale type.
+
+    Every judgment is matched to its grade position on the scale it was
+    made on and re-expressed on the new scale in one vectorized pass over
+    the lookup tables (see scales.convert_log_judgments). Judgments that
+    do not correspond to a grade of their scale keep their value and scale
+    type. The changed rows are written back with a single bulk_update,
+    and the project's saved results, which were calculated from the old
+    values, are deleted.
+
+    Args:
+        project_id: ID of the project
+        scale_type: New scale type (1-5)
+
+    Returns:
+        Dictionary with 'scale_type', 'rescaled' and 'unchanged' judgment
+        counts, and 'invalidated': the number of deleted results
+    """
+    import numpy as np
+    from .scales import SCALE_TYPES, convert_log_judgments
+
+    if scale_type not in SCALE_TYPES:
+        raise ValueError(
+            f"Unknown scale type {scale_type!r}. Use one of {', '.join(map(str, SCALE_TYPES))}"
+        )
+
+    with transaction.atomic():
+        project = Project.objects.select_for_update().get(id=project_id)
+
+        rows = list(
+            Comparison.objects.filter(project=project)
+            .exclude(scale_type=scale_type)
+            .values_list('id', 'value', 'scale_type', 'scale_str', 'gradations')
+        )
+
+        rescaled = []
+        if rows:
+            ids, values, scale_types, scale_strs, gradations = (
+                np.array(column) for column in zip(*rows)
+            )
+            values = values.astype(float)
+            positive = values > 0
+
+            # The grade position count is the length of the scale string the
+            # value was computed from, as in log_judgment_rows
+            grade_positions = np.char.str_len(scale_strs.astype(str))
+            grade_positions = np.where(grade_positions > 0, grade_positions, gradations)
+
+            log_values, matched = convert_log_judgments(
+                np.log(np.where(positive, values, 1.0)), scale_types, grade_positions,
+                scale_type, return_matched=True
+            )
+            matched &= positive
+
+            now = timezone.now()
+            rescaled = [
+                Comparison(id=int(comparison_id), value=float(value),
+                           scale_type=scale_type, updated_at=now)
+                for comparison_id, value in zip(ids[matched], np.exp(log_values[matched]))
+            ]
+            Comparison.objects.bulk_update(rescaled, ['value', 'scale_type', 'updated_at'])
+
+        project.scale_type = scale_type
+        project.save(update_fields=['scale_type', 'updated_at'])
+
+        invalidated = (
+            Result.objects.filter(project=project).delete()[0]
+            + AggregatedResult.objects.filter(project=project).delete()[0]
+        )
+
+    return {
+        'scale_type': scale_type,
+        'rescaled': len(rescaled),
+        'unchanged': len(rows) - len(rescaled),
+        'invalidated': invalidated,
+    }
+
+
+def _group_consistency(log_sum, num_experts: int) -> Tuple:
+    """Group matrix, weights and CR of an equally weighted AIJ log sum."""
+    import numpy as np
+    from ahp_core import batched_principal_eigenvectors, random_index
+
+    group_matrix = np.exp(np.asarray(log_sum) / num_experts)
+    weights, lambda_max = batched_principal_eigenvectors(group_matrix[None])
+
+    n = group_matrix.shape[0]
+    RI = random_index(n)
+    CI = (lambda_max[0] - n) / (n - 1) if n > 1 else 0.0
+    CR = CI / RI if RI > 0 else 0.0
+
+    return group_matrix, weights[0], float(CR)
+
+
+def open_consensus_round(project_id: int, num_pairs: int = 3,
+                         min_distance: float = None) -> ConsensusRound:
+    """
+    Close the current consensus round and open the next one.
+
+    The group matrix is the equally weighted AIJ of the completed experts.
+    For each expert, the judgments farthest from it in log space are stored
+    as feedback to re-answer during the new round, together with the
+    round's accumulators (sum of log matrices) that consensus_round_status
+    updates incrementally.
+
+    Args:
+        project_id: ID of the project
+        num_pairs: Maximum number of feedback judgments per expert
+        min_distance: Smallest log distance worth feedback
+
+    Returns:
+        The new ConsensusRound
+    """
+    import numpy as np
+    from .group_calculations import (
+        FEEDBACK_MIN_DISTANCE, consensus_metrics, farthest_judgments
+    )
+
+    if min_distance is None:
+        min_distance = FEEDBACK_MIN_DISTANCE
+
+    expert_ids, _, log_tensor, mask = load_experts(project_id)
+    num_experts = len(expert_ids)
+
+    log_sum = log_tensor.sum(axis=0)
+    group_matrix, weights, CR = _group_consistency(log_sum, num_experts)
+    group_log = np.log(group_matrix)
+
+    experts, index_a, index_b, distances = farthest_judgments(
+        log_tensor, group_log, num_pairs, min_distance
+    )
+    previous_values = np.exp(log_tensor[experts, index_a, index_b])
+    group_values = group_matrix[index_a, index_b]
+
+    with transaction.atomic():
+        project = Project.objects.select_for_update().get(id=project_id)
+
+        project.consensus_rounds.filter(status='open').update(
+            status='closed', closed_at=timezone.now()
+        )
+        last_number = project.consensus_rounds.aggregate(Max('number'))['number__max'] or 0
+
+        consensus_round = ConsensusRound.objects.create(
+            project=project,
+            number=last_number + 1,
+            expert_ids=expert_ids,
+            num_judgments=int(mask.sum()) // 2,
+            log_sum=log_sum.tolist(),
+            final_weights=weights.tolist(),
+            consistency_ratio=CR,
+            consensus_score=consensus_metrics(log_tensor, weights)['consensus_score'],
+        )
+
+        Feedback.objects.bulk_create([
+            Feedback(
+                consensus_round=consensus_round,
+                user_id=expert_ids[expert],
+                index_a=int(a),
+                index_b=int(b),
+                previous_value=float(previous),
+                group_value=float(group),
+                distance=float(distance),
+            )
+            for expert, a, b, previous, group, distance in zip(
+                experts, index_a, index_b, previous_values, group_values, distances
+            )
+        ])
+
+    return consensus_round
+
+
+def consensus_round_status(consensus_round: ConsensusRound) -> Dict:
+    """
+    Current group result of a consensus round.
+
+    Only the judgments changed since the round opened are read: when they
+    are all feedback judgments of the round's experts, their log deltas are
+    applied to the round's accumulators. Any other change (an expert joining
+    or leaving the completed set, a deleted judgment or a change outside
+    the feedback) falls back to a full recomputation.
+
+    Args:
+        consensus_round: ConsensusRound instance
+
+    Returns:
+        Dictionary with the round, aggregated matrix, weights, CR, whether
+        the result was updated incrementally and feedback progress
+    """
+    import numpy as np
+    from .group_calculations import apply_judgment_deltas
+
+    project = consensus_round.project
+    expert_ids = consensus_round.expert_ids
+
+    comparisons = Comparison.objects.filter(project=project, user_id__in=expert_ids)
+    changed = list(
+        comparisons.filter(
+            updated_at__gt=consensus_round.created_at
+        ).values_list(*JUDGMENT_COLUMNS)
+    )
+
+    feedback = consensus_round.feedback.all()
+    previous_values = {
+        (user_id, index_a, index_b): previous_value
+        for user_id, index_a, index_b, previous_value in feedback.values_list(
+            'user_id', 'index_a', 'index_b', 'previous_value'
+        )
+    }
+
+    completed = ProjectCollaborator.objects.filter(
+        project=project, status='completed'
+    ).values_list('user_id', flat=True)
+
+    incremental = (
+        set(completed) == set(expert_ids)
+        and all((row[0], row[1], row[2]) in previous_values for row in changed)
+        and comparisons.count() == consensus_round.num_judgments
     )
 
-    return aggregated_result
+    if incremental:
+        user_ids, index_a, index_b, log_values = log_judgment_rows(project, changed)
+        keys = zip(user_ids.tolist(), index_a.tolist(), index_b.tolist())
+        previous_logs = np.log([previous_values[key] for key in keys])
+        log_sum = apply_judgment_deltas(
+            consensus_round.log_sum, index_a, index_b, log_values - previous_logs
+        )
+        num_experts = len(expert_ids)
+    else:
+        current_ids, _, log_tensor, _ = load_experts(project.id)
+        log_sum = log_tensor.sum(axis=0)
+        num_experts = len(current_ids)
+
+    group_matrix, weights, CR = _group_consistency(log_sum, num_experts)
+
+    return {
+        'round': consensus_round.number,
+        'status': consensus_round.status,
+        'incremental': incremental,
+        'num_experts': num_experts,
+        'changed_judgments': len(changed),
+        'aggregated_matrix': group_matrix.tolist(),
+        'final_weights': weights.tolist(),
+        'consistency_ratio': CR,
+        'initial_weights': consensus_round.final_weights,
+        'initial_consistency_ratio': consensus_round.consistency_ratio,
+        'initial_consensus_score': consensus_round.consensus_score,
+        'feedback_total': feedback.count(),
+        'feedback_resolved': feedback.filter(resolved=True).count(),
+    }
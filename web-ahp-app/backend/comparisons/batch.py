@@ -0,0 +1,147 @@
+"""
+Batched AHP solves on plain lists, shared by the compute service and client.
+
+Everything here takes and returns JSON-ready values and does not depend on
+Django, so it runs unchanged in the standalone compute service
+(compute_service.py) and in-process (compute_client.LocalComputeClient).
+"""
+from collections import defaultdict
+
+import numpy as np
+
+from .group_calculations import (
+    aggregate_log_tensor, aggregate_priorities, batched_consistency
+)
+
+
+def _log_matrices(matrices, name='matrix'):
+    """Validate a stack of positive square matrices and take logs."""
+    array = np.asarray(matrices, dtype=float)
+
+    if array.ndim != 3 or array.shape[1] != array.shape[2] or array.shape[1] < 1:
+        raise ValueError(f"Each {name} must be a non-empty square matrix of the same size")
+    if not np.all(np.isfinite(array)) or np.any(array <= 0):
+        raise ValueError(f"{name.capitalize()} entries must be positive numbers")
+
+    return np.log(array)
+
+
+def _solution(weights, lambda_max, CI, CR):
+    return {
+        'weights': weights.tolist(),
+        'lambda_max': float(lambda_max),
+        'consistency_index': float(CI),
+        'consistency_ratio': float(CR),
+    }
+
+
+def solve_many(matrices):
+    """
+    Priorities and consistency of many comparison matrices.
+
+    Matrices of the same size are solved together in one batched eigen solve.
+
+    Args:
+        matrices: List of n×n comparison matrices (n may vary between them)
+
+    Returns:
+        List of {'weights', 'lambda_max', 'consistency_index',
+        'consistency_ratio'} in input order
+    """
+    if not isinstance(matrices, list):
+        raise ValueError("matrices must be a list of matrices")
+
+    by_size = defaultdict(list)
+    for position, matrix in enumerate(matrices):
+        by_size[len(matrix)].append(position)
+
+    solutions = [None] * len(matrices)
+    for positions in by_size.values():
+        consistency = batched_consistency(
+            _log_matrices([matrices[position] for position in positions])
+        )
+        for i, position in enumerate(positions):
+            solutions[position] = _solution(
+                consistency['weights'][i], consistency['lambda_max'][i],
+                consistency['CI'][i], consistency['CR'][i]
+            )
+
+    return solutions
+
+
+def aggregate_many(groups):
+    """
+    Aggregate many groups of expert matrices.
+
+    Args:
+        groups: List of {'matrices': k n×n matrices, 'expert_weights':
+            optional weight per expert, 'method': 'AIJ' (default) or 'AIP'}
+
+    Returns:
+        List of {'aggregated_matrix', 'weights', 'lambda_max',
+        'consistency_index', 'consistency_ratio'} in input order; for AIP
+        the consistency metrics describe the AIJ matrix
+    """
+    if not isinstance(groups, list):
+        raise ValueError("groups must be a list of expert groups")
+
+    results = []
+    for group in groups:
+        if not isinstance(group, dict) or 'matrices' not in group:
+            raise ValueError("Each group needs a 'matrices' list")
+
+        method = group.get('method', 'AIJ')
+        if method not in ('AIJ', 'AIP'):
+            raise ValueError(f"Unknown aggregation method '{method}'. Use 'AIJ' or 'AIP'")
+
+        log_tensor = _log_matrices(group['matrices'])
+        expert_weights = group.get('expert_weights')
+
+        aggregated_matrix = aggregate_log_tensor(log_tensor, expert_weights)
+        consistency = batched_consistency(np.log(aggregated_matrix)[None])
+        weights = consistency['weights'][0]
+
+        if method == 'AIP':
+            individual = batched_consistency(log_tensor)
+            weights = aggregate_priorities(individual['weights'], expert_weights)
+
+        result = _solution(
+            weights, consistency['lambda_max'][0],
+            consistency['CI'][0], consistency['CR'][0]
+        )
+        result['aggregated_matrix'] = aggregated_matrix.tolist()
+        results.append(result)
+
+    return results
+
+
+# Methods exposed by the compute service and clients
+METHODS = {
+    'solve_many': solve_many,
+    'aggregate_many': aggregate_many,
+}
+
+# Name of each method's batch parameter in JSON-RPC calls
+BATCH_PARAMS = {
+    'solve_many': 'matrices',
+    'aggregate_many': 'groups',
+}
+
+
+def batch_size(method, items):
+    """
+    Number of matrix elements a batch solves over, for compute.dispatch.
+
+    Args:
+        method: Name in METHODS
+        items: The batch (matrices or groups)
+
+    Returns:
+        int: Job size
+    """
+    if method == 'aggregate_many':
+        return sum(
+            len(group.get('matrices', ())) * len(group['matrices'][0]) ** 2
+            for group in items if isinstance(group, dict) and group.get('matrices')
+        )
+    return sum(len(matrix) ** 2 for matrix in items)
@@ -0,0 +1,140 @@
+"""
+Compact representation of comparison-heavy responses.
+
+Project details and aggregated results accept three opt-in query parameters:
+
+- compact=true packs every pairwise comparison matrix into its upper
+  triangle, a flat array in pair order (0, 1), (0, 2), ..., (0, n-1),
+  (1, 2), ...; the diagonal is 1 and a[j][i] = 1 / a[i][j]. Nested
+  comparison rows become one such array of values per judge, with null
+  for pairs the judge has not compared.
+- precision=N rounds every float in the response to N decimals.
+- fields=a,b,... keeps only the listed top-level fields; fields that are
+  not requested are not computed either.
+"""
+import math
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+# Most decimals a float64 can carry
+MAX_PRECISION = 15
+
+
+class ResponseOptions(NamedTuple):
+    compact: bool = False
+    precision: Optional[int] = None
+    fields: Optional[Set[str]] = None
+
+    def wants(self, field: str) -> bool:
+        """Whether a top-level field is part of the response."""
+        return self.fields is None or field in self.fields
+
+
+def response_options(query_params) -> Optional[ResponseOptions]:
+    """
+    Parse the compact, precision and fields query parameters.
+
+    Args:
+        query_params: Request query parameters
+
+    Returns:
+        ResponseOptions, or None if none of the parameters was given
+
+    Raises:
+        ValueError: If precision is not an integer between 0 and MAX_PRECISION
+    """
+    if not any(name in query_params for name in ResponseOptions._fields):
+        return None
+
+    precision = query_params.get('precision')
+    if precision is not None:
+        try:
+            precision = int(precision)
+        except ValueError:
+            raise ValueError("precision must be an integer")
+        if not 0 <= precision <= MAX_PRECISION:
+            raise ValueError(f"precision must be between 0 and {MAX_PRECISION}")
+
+    fields = query_params.get('fields')
+    if fields is not None:
+        fields = {name.strip() for name in fields.split(',') if name.strip()}
+
+    return ResponseOptions(
+        compact=str(query_params.get('compact', '')).lower() in ('true', '1', 'yes'),
+        precision=precision,
+        fields=fields,
+    )
+
+
+def pair_count(n: int) -> int:
+    return n * (n - 1) // 2
+
+
+def pair_positions(n: int, index_a, index_b):
+    """Position of pairs (index_a < index_b) in the packed upper triangle."""
+    return index_a * (2 * n - index_a - 1) // 2 + (index_b - index_a - 1)
+
+
+def pack_matrix(matrix) -> List[float]:
+    """Upper triangle of a square matrix, row by row."""
+    import numpy as np
+
+    matrix = np.asarray(matrix, dtype=float)
+    return matrix[np.triu_indices(len(matrix), 1)].tolist()
+
+
+def pack_comparisons(n: int, rows: List[Tuple]) -> Dict:
+    """
+    Pack comparison rows into one upper-triangle array of values per judge.
+
+    Args:
+        n: Number of alternatives
+        rows: Tuples of (user_id, index_a, index_b, value); user_id is None
+            for single-user projects
+
+    Returns:
+        Dictionary with 'judges' (user IDs) and 'values' (one array of
+        pair_count(n) values per judge, None for pairs not compared)
+    """
+    import numpy as np
+
+    judges = sorted({row[0] for row in rows}, key=lambda user_id: (user_id is not None, user_id))
+    values = np.full((len(judges), pair_count(n)), np.nan)
+
+    if rows:
+        user_ids, index_a, index_b, raw_values = zip(*rows)
+        index_a, index_b = np.array(index_a), np.array(index_b)
+        raw_values = np.array(raw_values, dtype=float)
+
+        # Stored pairs are canonical (index_a < index_b); skip stale indices
+        valid = (index_a < index_b) & (index_b < n)
+        judge_of = {user_id: position for position, user_id in enumerate(judges)}
+        rows_of = np.array([judge_of[user_id] for user_id in user_ids])
+        values[rows_of[valid], pair_positions(n, index_a[valid], index_b[valid])] = raw_values[valid]
+
+    return {
+        'judges': judges,
+        'values': [
+            [None if math.isnan(value) else value for value in judge_values]
+            for judge_values in values.tolist()
+        ],
+    }
+
+
+def round_floats(data, precision: Optional[int]):
+    """Round every float in nested lists and dictionaries."""
+    if precision is None:
+        return data
+    if isinstance(data, float):
+        return round(data, precision)
+    if isinstance(data, list):
+        return [round_floats(item, precision) for item in data]
+    if isinstance(data, dict):
+        return {key: round_floats(value, precision) for key, value in data.items()}
+    return data
+
+
+def shape(data: Dict, options: ResponseOptions) -> Dict:
+    """Apply the sparse fieldset and precision of the options to a response body."""
+    if options.fields is not None:
+        data = {key: value for key, value in data.items() if key in options.fields}
+    return round_floats(data, options.precision)
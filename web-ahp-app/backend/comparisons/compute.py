@@ -0,0 +1,210 @@
+"""
+Dispatch of CPU-heavy computations to a shared process pool.
+
+Jobs of at most COMPUTE_INLINE_MAX_SIZE matrix elements run inline in the
+request worker. Larger ones go to a pool of worker processes, so long eigen
+solves do not hold request workers and starve cheap requests. The number of
+jobs queued or running in the pool is bounded: once the bound is reached,
+dispatch raises ComputeBusy instead of queueing without limit.
+
+The pool belongs to the server process: with N web worker processes
+(gunicorn --workers N) there are N pools of COMPUTE_POOL_SIZE processes,
+each admitting COMPUTE_POOL_SIZE + COMPUTE_QUEUE_SIZE jobs. It is started
+on the first job that needs it, so processes that never solve a large
+matrix never spawn workers; that first job waits for the workers to start.
+
+Workers are started with the spawn method and set up Django, so jobs may be
+any importable function, including ones that query the database.
+"""
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+
+
+class ComputeBusy(Exception):
+    """The compute pool queue is full."""
+
+
+class ComputeTimeout(Exception):
+    """A job did not finish within COMPUTE_TIMEOUT seconds."""
+
+
+def _init_worker():
+    """Set up Django and pay import costs before the first job arrives."""
+    import django
+    django.setup()
+
+    import numpy  # noqa: F401
+    from . import aggregation, calculations, group_calculations  # noqa: F401
+
+
+def _warm_up():
+    """No-op job that forces a worker process to start."""
+    return os.getpid()
+
+
+class ComputePool:
+    """Process pool with a bounded queue, a timeout and usage counters."""
+
+    def __init__(self, size: int, queue_size: int, timeout: float):
+        self.size = size
+        self.queue_size = queue_size
+        self.timeout = timeout
+
+        self._executor = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size + queue_size)
+        self._stats = {
+            'inline': 0,
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'rejected': 0,
+            'timed_out': 0,
+            'in_flight': 0,
+            'peak_in_flight': 0,
+            'pool_seconds': 0.0,
+        }
+
+    def start(self):
+        """Start the worker processes, if not yet started, and warm them up without waiting."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.size,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker
+                )
+                for _ in range(self.size):
+                    self._executor.submit(_warm_up)
+        return self._executor
+
+    def shutdown(self):
+        """Stop the worker processes, dropping queued jobs."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def record_inline(self):
+        with self._lock:
+            self._stats['inline'] += 1
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Run a job in the pool and wait for its result.
+
+        Raises:
+            ComputeBusy: If the pool's queue is full
+            ComputeTimeout: If the job takes longer than the timeout; it
+                keeps its queue slot until it actually finishes
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats['rejected'] += 1
+            raise ComputeBusy('Compute pool is saturated, try again shortly')
+
+        started = time.monotonic()
+        with self._lock:
+            self._stats['submitted'] += 1
+            self._stats['in_flight'] += 1
+            self._stats['peak_in_flight'] = max(
+                self._stats['peak_in_flight'], self._stats['in_flight']
+            )
+
+        def release(future):
+            with self._lock:
+                self._stats['in_flight'] -= 1
+                self._stats['pool_seconds'] += time.monotonic() - started
+                failed = future.cancelled() or future.exception() is not None
+                self._stats['failed' if failed else 'completed'] += 1
+            self._slots.release()
+
+        try:
+            future = self.start().submit(func, *args, **kwargs)
+        except Exception:
+            with self._lock:
+                self._stats['in_flight'] -= 1
+                self._stats['failed'] += 1
+            self._slots.release()
+            raise
+        future.add_done_callback(release)
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                self._stats['timed_out'] += 1
+            raise ComputeTimeout(f'Computation did not finish within {self.timeout:g} seconds')
+
+    def metrics(self) -> dict:
+        """Current counters and saturation of the pool."""
+        with self._lock:
+            stats = dict(self._stats)
+            started = self._executor is not None
+
+        capacity = self.size + self.queue_size
+        stats.update({
+            'started': started,
+            'pool_size': self.size,
+            'queue_size': self.queue_size,
+            'running': min(stats['in_flight'], self.size),
+            'queued': max(stats['in_flight'] - self.size, 0),
+            'saturation': stats['in_flight'] / capacity if capacity else 1.0,
+            'inline_max_size': settings.COMPUTE_INLINE_MAX_SIZE,
+            'timeout': self.timeout,
+        })
+        return stats
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ComputePool:
+    """The process-wide compute pool, created from settings on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ComputePool(
+                settings.COMPUTE_POOL_SIZE,
+                settings.COMPUTE_QUEUE_SIZE,
+                settings.COMPUTE_TIMEOUT
+            )
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def dispatch(func, *args, size: int = 0, **kwargs):
+    """
+    Run a job inline if it is small, otherwise in the compute pool.
+
+    Args:
+        func: Importable module-level function to run
+        size: Number of matrix elements the job solves over, e.g. k·n²
+        *args, **kwargs: Passed to func; must be picklable
+
+    Returns:
+        The function's result
+
+    Raises:
+        ComputeBusy: If the job is large and the pool's queue is full
+        ComputeTimeout: If a pooled job exceeds COMPUTE_TIMEOUT
+    """
+    pool = get_pool()
+
+    if settings.COMPUTE_POOL_SIZE < 1 or size <= settings.COMPUTE_INLINE_MAX_SIZE:
+        pool.record_inline()
+        return func(*args, **kwargs)
+
+    return pool.submit(func, *args, **kwargs)
+
+
+def metrics() -> dict:
+    """Counters and saturation of the process-wide compute pool."""
+    return get_pool().metrics()
@@ -0,0 +1,109 @@
+"""
+Clients for batched AHP solves.
+
+Django code calls get_compute_client() and does not need to know where the
+math runs. The client class is chosen with the COMPUTE_CLIENT setting:
+
+- LocalComputeClient (default) solves in-process, through compute.dispatch
+- HttpComputeClient calls the standalone compute service at
+  COMPUTE_SERVICE_URL, falling back to in-process solves if the service
+  cannot be reached and COMPUTE_SERVICE_FALLBACK is set
+"""
+import itertools
+import json
+import logging
+import urllib.error
+import urllib.request
+from typing import Dict, List
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from . import batch
+
+logger = logging.getLogger(__name__)
+
+
+class ComputeServiceError(Exception):
+    """The compute service rejected or failed a call."""
+
+
+class BaseComputeClient:
+    """Interface of compute clients; both methods mirror batch.METHODS."""
+
+    def call(self, method: str, items: list) -> list:
+        raise NotImplementedError
+
+    def solve_many(self, matrices: List) -> List[Dict]:
+        """Priorities and consistency of many matrices (see batch.solve_many)."""
+        return self.call('solve_many', matrices)
+
+    def aggregate_many(self, groups: List[Dict]) -> List[Dict]:
+        """Aggregate many groups of expert matrices (see batch.aggregate_many)."""
+        return self.call('aggregate_many', groups)
+
+
+class LocalComputeClient(BaseComputeClient):
+    """Solves in-process, or in the local compute pool for large batches."""
+
+    def call(self, method: str, items: list) -> list:
+        from .compute import dispatch
+        return dispatch(batch.METHODS[method], items, size=batch.batch_size(method, items))
+
+
+class HttpComputeClient(BaseComputeClient):
+    """JSON-RPC client of the standalone compute service."""
+
+    def __init__(self, url: str, timeout: float = 30, fallback: BaseComputeClient = None):
+        self.url = url
+        self.timeout = timeout
+        self.fallback = fallback
+        self._ids = itertools.count(1)
+
+    def call(self, method: str, items: list) -> list:
+        request_id = next(self._ids)
+        body = json.dumps({
+            'jsonrpc': '2.0',
+            'id': request_id,
+            'method': method,
+            'params': {batch.BATCH_PARAMS[method]: items},
+        }).encode()
+        request = urllib.request.Request(
+            self.url, data=body, headers={'Content-Type': 'application/json'}
+        )
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = json.loads(response.read())
+        except (urllib.error.URLError, OSError) as e:
+            if self.fallback is None:
+                raise ComputeServiceError(f"Compute service unavailable: {e}")
+            logger.warning("Compute service unavailable (%s), solving in-process", e)
+            return self.fallback.call(method, items)
+
+        if 'error' in payload:
+            error = payload['error']
+            if error.get('code') == -32602:
+                # Invalid params, raised like the in-process solve would
+                raise ValueError(error.get('message'))
+            raise ComputeServiceError(error.get('message'))
+
+        return payload['result']
+
+
+_client = None
+
+
+def get_compute_client() -> BaseComputeClient:
+    """The client configured by settings, created on first use."""
+    global _client
+    if _client is None:
+        client_class = import_string(settings.COMPUTE_CLIENT)
+        if issubclass(client_class, HttpComputeClient):
+            fallback = LocalComputeClient() if settings.COMPUTE_SERVICE_FALLBACK else None
+            _client = client_class(
+                settings.COMPUTE_SERVICE_URL, settings.COMPUTE_SERVICE_TIMEOUT, fallback
+            )
+        else:
+            _client = client_class()
+    return _client
@@ -0,0 +1,188 @@
+"""
+Standalone AHP compute service with a batched JSON-RPC 2.0 interface.
+
+Runs without Django, so compute nodes can be scaled separately from the API:
+
+    python -m comparisons.compute_service --port 8100 --workers 8
+
+POST / accepts a JSON-RPC request (or a JSON-RPC batch) calling one of the
+methods in batch.METHODS, e.g.
+
+    {"jsonrpc": "2.0", "id": 1, "method": "solve_many",
+     "params": {"matrices": [[[1, 3], [0.333, 1]], ...]}}
+
+Large batches are split into chunks solved in parallel by a process pool.
+GET /health reports the service status.
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import signal
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .batch import BATCH_PARAMS, METHODS
+
+
+# Largest accepted request body (bytes)
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+# Batches are not split into chunks smaller than this
+MIN_CHUNK_SIZE = 64
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+def _error(request_id, code, message):
+    return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
+
+
+class ComputeService:
+    """Executes JSON-RPC calls, fanning large batches out to worker processes."""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        # Spawned workers do not inherit the listening socket
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn')
+        ) if workers > 1 else None
+
+    def run(self, method: str, items: list) -> list:
+        """Run a batch method, in parallel chunks if the batch is large."""
+        func = METHODS[method]
+        chunk_size = max(MIN_CHUNK_SIZE, math.ceil(len(items) / self.workers))
+
+        if self.executor is None or len(items) <= chunk_size:
+            return func(items)
+
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        return [result for chunk in self.executor.map(func, chunks) for result in chunk]
+
+    def call(self, request) -> dict:
+        """Handle a single JSON-RPC request object."""
+        request_id = request.get('id') if isinstance(request, dict) else None
+
+        if not isinstance(request, dict) or request.get('jsonrpc') != '2.0':
+            return _error(request_id, INVALID_REQUEST, 'Invalid JSON-RPC 2.0 request')
+
+        method = request.get('method')
+        if method not in METHODS:
+            return _error(request_id, METHOD_NOT_FOUND, f"Unknown method '{method}'")
+
+        params = request.get('params', {})
+        if isinstance(params, list):
+            params = dict(zip([BATCH_PARAMS[method]], params))
+        items = params.get(BATCH_PARAMS[method]) if isinstance(params, dict) else None
+
+        if not isinstance(items, list):
+            return _error(request_id, INVALID_PARAMS, f"'{BATCH_PARAMS[method]}' must be a list")
+
+        try:
+            result = self.run(method, items)
+        except (TypeError, ValueError) as e:
+            return _error(request_id, INVALID_PARAMS, str(e))
+        except Exception as e:
+            return _error(request_id, INTERNAL_ERROR, str(e))
+
+        return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+
+
+class ComputeRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end of the compute service."""
+
+    server_version = 'AHPCompute/1.0'
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip('/') == '/health':
+            self._send_json(HTTPStatus.OK, {
+                'status': 'ok',
+                'workers': self.server.service.workers,
+                'methods': sorted(METHODS),
+            })
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': 'Not found'})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_SIZE:
+            self._send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, _error(None, INVALID_REQUEST, 'Request too large'))
+            return
+
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except ValueError:
+            self._send_json(HTTPStatus.OK, _error(None, PARSE_ERROR, 'Parse error'))
+            return
+
+        service = self.server.service
+        if isinstance(payload, list):
+            if not payload:
+                response = _error(None, INVALID_REQUEST, 'Empty batch')
+            else:
+                response = [service.call(request) for request in payload]
+        else:
+            response = service.call(payload)
+
+        self._send_json(HTTPStatus.OK, response)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def serve(host: str = '127.0.0.1', port: int = 8100, workers: int = None,
+          verbose: bool = False):
+    """Run the compute service until interrupted."""
+    service = ComputeService(workers or os.cpu_count() or 1)
+    server = ThreadingHTTPServer((host, port), ComputeRequestHandler)
+    server.service = service
+    server.verbose = verbose
+
+    # Stop cleanly on SIGTERM as well as on Ctrl+C
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    print(f"AHP compute service on http://{host}:{server.server_port} with {service.workers} workers", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Standalone AHP compute service (JSON-RPC 2.0)')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=8100, help='Port to listen on')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: number of CPUs)')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+
+    serve(args.host, args.port, args.workers, args.verbose)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Denormalized progress counters.
+
+Project.comparison_count, Project.active_experts, Project.completed_experts
+and ProjectCollaborator.comparison_count replace COUNT(*) queries on the
+progress and polling endpoints. They are only changed with F() updates,
+from the signals in signals.py and from bulk operations that bypass
+signals; reconcile_counters recomputes them from the underlying rows.
+"""
+from typing import Tuple
+
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import Comparison, Project, ProjectCollaborator
+
+
+# Project counter of each counted collaborator status
+EXPERT_COUNTERS = {
+    'active': 'active_experts',
+    'completed': 'completed_experts',
+}
+
+
+def add_comparisons(project_id: int, user_id: int, count: int):
+    """
+    Adjust the comparison counters of a project and its expert.
+
+    Args:
+        project_id: ID of the project
+        user_id: ID of the user who made the comparisons, None for single-user
+        count: Number of comparisons added (negative for removed)
+    """
+    if not count:
+        return
+
+    Project.objects.filter(id=project_id).update(
+        comparison_count=F('comparison_count') + count
+    )
+    if user_id is not None:
+        ProjectCollaborator.objects.filter(project_id=project_id, user_id=user_id).update(
+            comparison_count=F('comparison_count') + count
+        )
+
+
+def move_expert(project_id: int, old_status: str, new_status: str):
+    """
+    Move a collaborator between the project's expert counters.
+
+    Args:
+        project_id: ID of the project
+        old_status: Previous status, None for a new collaborator
+        new_status: New status, None for a removed collaborator
+    """
+    if old_status == new_status:
+        return
+
+    changes = {}
+    if old_status in EXPERT_COUNTERS:
+        counter = EXPERT_COUNTERS[old_status]
+        changes[counter] = F(counter) - 1
+    if new_status in EXPERT_COUNTERS:
+        counter = EXPERT_COUNTERS[new_status]
+        changes[counter] = F(counter) + 1
+
+    if changes:
+        Project.objects.filter(id=project_id).update(**changes)
+
+
+def count_rows(queryset, group_by: str):
+    """Subquery counting the rows of a correlated queryset."""
+    return Coalesce(
+        Subquery(queryset.order_by().values(group_by).annotate(total=Count('id')).values('total')),
+        0
+    )
+
+
+def reconcile_counters(dry_run: bool = False) -> Tuple[int, int]:
+    """
+    Recompute every counter from the underlying rows and fix drifted ones.
+
+    Drifted rows are found with one correlated query per model and fixed
+    with one UPDATE that recounts in the database.
+
+    Args:
+        dry_run: Only count drifted rows without fixing them
+
+    Returns:
+        Tuple of (drifted projects, drifted collaborators)
+    """
+    project_counts = {
+        'comparison_count': count_rows(Comparison.objects.filter(project=OuterRef('pk')), 'project'),
+        **{
+            counter: count_rows(
+                ProjectCollaborator.objects.filter(project=OuterRef('pk'), status=status),
+                'project'
+            )
+            for status, counter in EXPERT_COUNTERS.items()
+        },
+    }
+    collaborator_counts = {
+        'comparison_count': count_rows(
+            Comparison.objects.filter(project=OuterRef('project'), user=OuterRef('user')),
+            'project'
+        ),
+    }
+
+    drifted = []
+    for model, counts in ((Project, project_counts), (ProjectCollaborator, collaborator_counts)):
+        ids = list(
+            model.objects.annotate(**{f'actual_{name}': count for name, count in counts.items()})
+            .exclude(**{name: F(f'actual_{name}') for name in counts})
+            .values_list('id', flat=True)
+        )
+        if ids and not dry_run:
+            model.objects.filter(id__in=ids).update(**counts)
+        drifted.append(len(ids))
+
+    return tuple(drifted)
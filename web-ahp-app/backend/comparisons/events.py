@@ -0,0 +1,186 @@
+"""
+Project and user events pushed to open Server-Sent Events streams.
+
+Views and signals call publish_project_event() when a collaborator's status
+or progress, or a project's aggregated results change, and
+publish_user_event() when a user receives an invitation, a friend request
+or a message; the event is handed to the broker after the transaction
+commits. Each open stream (see streams.py) subscribes to one project's or
+user's channel, so a channel nobody is watching costs one dictionary
+lookup per event.
+
+The broker class is chosen with the EVENT_BROKER setting:
+
+- LocalEventBroker (default) fans out in-process, which reaches the streams
+  served by the same ASGI process. Deployments running several processes
+  plug in a broker backed by a shared pub/sub service instead.
+"""
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """
+    Events of one channel for one stream, consumed on the stream's event loop.
+
+    Publishers may run in any thread; events are handed to the loop with
+    call_soon_threadsafe. A subscriber that falls behind by more than
+    maxsize events loses the newest ones and is told so with an
+    'overflow' event, after which it should reload its state.
+    """
+
+    def __init__(self, broker: 'BaseEventBroker', channel: str, maxsize: int = 100):
+        self.broker = broker
+        self.channel = channel
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize)
+        self._overflowed = False
+
+    def put(self, event: Dict):
+        """Queue an event from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # The stream's loop has closed; it unsubscribes on its way out
+            pass
+
+    def _put(self, event: Dict):
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._overflowed = True
+
+    async def get(self, timeout: float) -> Optional[Dict]:
+        """
+        Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            The event, or None if none arrived within the timeout
+        """
+        if self._overflowed and self._queue.empty():
+            self._overflowed = False
+            return {'type': 'overflow'}
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class BaseEventBroker:
+    """Interface of event brokers."""
+
+    def publish(self, channel: str, event: Dict):
+        """Deliver an event to every current subscriber of a channel."""
+        raise NotImplementedError
+
+    def subscribe(self, channel: str) -> Subscription:
+        """Subscribe the calling event loop to a channel."""
+        raise NotImplementedError
+
+    def unsubscribe(self, subscription: Subscription):
+        raise NotImplementedError
+
+
+class LocalEventBroker(BaseEventBroker):
+    """Fans events out to the subscribers of this process."""
+
+    def __init__(self):
+        self._channels = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def publish(self, channel: str, event: Dict):
+        with self._lock:
+            subscribers = list(self._channels.get(channel, ()))
+        for subscription in subscribers:
+            subscription.put(event)
+
+    def subscribe(self, channel: str) -> Subscription:
+        subscription = Subscription(self, channel, settings.EVENT_STREAM_QUEUE_SIZE)
+        with self._lock:
+            self._channels[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscribers = self._channels.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._channels[subscription.channel]
+
+    def subscriber_count(self) -> int:
+        """Open subscriptions over all channels."""
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._channels.values())
+
+
+_broker = None
+
+
+def get_event_broker() -> BaseEventBroker:
+    """The broker configured by settings, created on first use."""
+    global _broker
+    if _broker is None:
+        _broker = import_string(settings.EVENT_BROKER)()
+    return _broker
+
+
+def project_channel(project_id: int) -> str:
+    return f'project:{project_id}'
+
+
+def user_channel(user_id: int) -> str:
+    return f'user:{user_id}'
+
+
+def publish_on_commit(channel: str, event: Dict):
+    """Publish an event on a channel once the current transaction commits."""
+    def publish():
+        try:
+            get_event_broker().publish(channel, event)
+        except Exception:
+            # Streams are a convenience; never fail the write that triggered them
+            logger.exception("Failed to publish %s event on %s", event['type'], channel)
+
+    transaction.on_commit(publish)
+
+
+def publish_project_event(project_id: int, event_type: str, **data):
+    """
+    Publish a project event once the current transaction commits.
+
+    Args:
+        project_id: ID of the project
+        event_type: 'status', 'progress' or 'aggregation'
+        **data: Event payload (JSON-serializable)
+    """
+    publish_on_commit(
+        project_channel(project_id), {'type': event_type, 'project_id': project_id, **data}
+    )
+
+
+def publish_user_event(user_id: int, event_type: str, **data):
+    """
+    Publish a notification to a user once the current transaction commits.
+
+    Args:
+        user_id: ID of the notified user
+        event_type: 'invitation', 'friend_request', 'message' or 'messages_read'
+        **data: Event payload (JSON-serializable)
+    """
+    publish_on_commit(user_channel(user_id), {'type': event_type, **data})
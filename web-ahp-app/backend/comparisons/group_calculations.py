@@ -0,0 +1,689 @@
+"""
+Group (multi-expert) calculations on stacked log-judgment tensors.
+
+Each expert's n×n comparison matrix is kept as its element-wise logarithm
+and stacked into a (k, n, n) tensor. In log space the geometric mean turns
+into an arithmetic mean and reciprocity turns into antisymmetry, so every
+group statistic reduces to sums and dot products over the expert axis.
+
+This module is pure NumPy and does not touch the ORM.
+"""
+import math
+
+import numpy as np
+
+from ahp_core import CR_THRESHOLD, batched_principal_eigenvectors, random_index
+
+
+# Largest judgment on the 1-9 scales; 2·ln(9) bounds the log distance
+# between two opposite extreme judgments of the same pair.
+MAX_LOG_JUDGMENT = math.log(9.0)
+
+# GCI thresholds of Aguarón & Moreno-Jiménez (2003), equivalent to CR = 0.10
+GCI_THRESHOLDS = {3: 0.31, 4: 0.35}
+GCI_THRESHOLD_DEFAULT = 0.37
+
+# Clustering algorithms for opinion blocs
+CLUSTERING_METHODS = ('kmeans', 'agglomerative')
+
+# Smallest log distance from the group judgment worth sending back as
+# consensus feedback (about a factor of 1.65 between the two values)
+FEEDBACK_MIN_DISTANCE = 0.5
+
+# Robust z-score above which an expert is flagged as an outlier (Iglewicz & Hoaglin)
+OUTLIER_Z_THRESHOLD = 3.5
+
+
+def build_log_tensor(n, num_experts, expert_positions, index_a, index_b, log_values):
+    """
+    Build stacked log-judgment tensor from flat comparison rows.
+
+    Missing judgments stay at log(1) = 0, matching build_comparison_matrix.
+
+    Args:
+        n: Number of alternatives
+        num_experts: Number of experts (k)
+        expert_positions: Array of expert positions (0..k-1), one per row
+        index_a: Array of row indices
+        index_b: Array of column indices
+        log_values: Array of log comparison values
+
+    Returns:
+        numpy.ndarray: (k, n, n) antisymmetric log tensor
+    """
+    log_tensor = np.zeros((num_experts, n, n))
+
+    log_tensor[expert_positions, index_a, index_b] = log_values
+    log_tensor[expert_positions, index_b, index_a] = np.negative(log_values)
+
+    return log_tensor
+
+
+def build_judgment_mask(n, num_experts, expert_positions, index_a, index_b):
+    """
+    Mark which judgments each expert has actually made.
+
+    Args:
+        n: Number of alternatives
+        num_experts: Number of experts (k)
+        expert_positions: Array of expert positions (0..k-1), one per row
+        index_a: Array of row indices
+        index_b: Array of column indices
+
+    Returns:
+        numpy.ndarray: (k, n, n) symmetric boolean mask, False on the diagonal
+    """
+    mask = np.zeros((num_experts, n, n), dtype=bool)
+    mask[expert_positions, index_a, index_b] = True
+    mask[expert_positions, index_b, index_a] = True
+    return mask
+
+
+def normalize_expert_weights(expert_weights, num_experts):
+    """
+    Normalize expert weights to sum to 1 (equal weights if None).
+
+    Args:
+        expert_weights: Array-like of non-negative weights, or None
+        num_experts: Number of experts (k)
+
+    Returns:
+        numpy.ndarray: Normalized weights, shape (k,)
+    """
+    if expert_weights is None:
+        return np.full(num_experts, 1.0 / num_experts)
+
+    expert_weights = np.asarray(expert_weights, dtype=float)
+    if expert_weights.shape != (num_experts,):
+        raise ValueError("Expected one weight per expert")
+    if np.any(expert_weights < 0) or expert_weights.sum() <= 0:
+        raise ValueError("Expert weights must be non-negative and not all zero")
+
+    return expert_weights / expert_weights.sum()
+
+
+def aggregate_log_matrices(log_tensor, expert_weights=None, mask=None):
+    """
+    Weighted mean over the expert axis of a log tensor.
+
+    With a judgment mask every pair is averaged only over the experts who
+    judged it: the log accumulator is divided by the per-pair (weighted)
+    count. Pairs nobody judged stay at log(1) = 0.
+
+    Args:
+        log_tensor: (k, n, n) log tensor
+        expert_weights: Optional weight per expert (equal if None)
+        mask: Optional (k, n, n) boolean mask of judgments actually made
+
+    Returns:
+        Tuple of (log_matrix, covered): n×n group log matrix and n×n
+        boolean matrix of pairs judged by at least one expert
+    """
+    weights = normalize_expert_weights(expert_weights, log_tensor.shape[0])
+
+    if mask is None:
+        log_matrix = np.einsum('k,kij->ij', weights, log_tensor)
+        return log_matrix, np.ones(log_matrix.shape, dtype=bool)
+
+    log_sum = np.einsum('k,kij->ij', weights, log_tensor * mask)
+    counts = np.einsum('k,kij->ij', weights, mask.astype(float))
+    covered = counts > 0
+
+    log_matrix = np.divide(log_sum, counts, out=np.zeros_like(log_sum), where=covered)
+    return log_matrix, covered
+
+
+def aggregate_log_tensor(log_tensor, expert_weights=None, mask=None):
+    """
+    Aggregate expert judgments with the (weighted) geometric mean (AIJ).
+
+    Formula: a_ij^(group) = ∏_k (a_ij^(k))^(λ_k), Σ λ_k = 1
+
+    Args:
+        log_tensor: (k, n, n) log tensor
+        expert_weights: Optional weight per expert (equal if None)
+        mask: Optional (k, n, n) boolean mask of judgments actually made;
+            see aggregate_log_matrices
+
+    Returns:
+        numpy.ndarray: n×n aggregated comparison matrix
+    """
+    log_matrix, _ = aggregate_log_matrices(log_tensor, expert_weights, mask)
+    return np.exp(log_matrix)
+
+
+def fill_missing_judgments(log_tensor, mask, group_matrix):
+    """
+    Replace judgments an expert has not made with the group judgment.
+
+    Consensus, consistency and outlier statistics treat a missing judgment
+    as agreeing with the group, so partial experts neither gain nor lose
+    influence from pairs they skipped.
+
+    Args:
+        log_tensor: (k, n, n) log tensor
+        mask: (k, n, n) boolean mask of judgments actually made
+        group_matrix: n×n aggregated comparison matrix
+
+    Returns:
+        numpy.ndarray: (k, n, n) log tensor without gaps
+    """
+    filled = np.where(mask, log_tensor, np.log(group_matrix)[None, :, :])
+    diagonal = np.arange(log_tensor.shape[-1])
+    filled[:, diagonal, diagonal] = 0.0
+    return filled
+
+
+def pair_coverage(mask):
+    """
+    Per-pair coverage statistics of a partially completed panel.
+
+    Args:
+        mask: (k, n, n) boolean mask of judgments actually made
+
+    Returns:
+        dict:
+            - counts: n×n number of experts who judged each pair
+            - min / max / mean: Per-pair count statistics over i < j
+            - coverage_ratio: Share of all expert-pair judgments made
+            - uncovered_pairs: [i, j] pairs nobody judged yet
+    """
+    k, n, _ = mask.shape
+    counts = mask.sum(axis=0)
+    rows, cols = np.triu_indices(n, 1)
+    pair_counts = counts[rows, cols]
+
+    uncovered = pair_counts == 0
+    num_pairs = max(pair_counts.size, 1)
+
+    return {
+        'counts': counts.tolist(),
+        'min': int(pair_counts.min(initial=k)),
+        'max': int(pair_counts.max(initial=0)),
+        'mean': float(pair_counts.sum() / num_pairs),
+        'coverage_ratio': float(pair_counts.sum() / (k * num_pairs)) if k else 0.0,
+        'uncovered_pairs': [[int(i), int(j)] for i, j in zip(rows[uncovered], cols[uncovered])],
+    }
+
+
+def aggregate_priorities(priorities, expert_weights=None):
+    """
+    Aggregate individual priority vectors with the weighted geometric mean (AIP).
+
+    Args:
+        priorities: (k, n) array of individual priority vectors
+        expert_weights: Optional weight per expert (equal if None)
+
+    Returns:
+        numpy.ndarray: Normalized group priority vector (sum = 1)
+    """
+    weights = normalize_expert_weights(expert_weights, priorities.shape[0])
+    group = np.exp(weights @ np.log(priorities))
+    return group / group.sum()
+
+
+def batched_consistency(log_tensor):
+    """
+    Priorities and consistency ratio of every expert in one batched solve.
+
+    Args:
+        log_tensor: (k, n, n) log tensor
+
+    Returns:
+        dict:
+            - weights: (k, n) individual priority vectors
+            - lambda_max: (k,) principal eigenvalues
+            - CI: (k,) consistency indices
+            - CR: (k,) consistency ratios
+    """
+    n = log_tensor.shape[-1]
+    weights, lambda_max = batched_principal_eigenvectors(np.exp(log_tensor))
+
+    ci = (lambda_max - n) / (n - 1) if n > 1 else np.zeros_like(lambda_max)
+    ri = random_index(n)
+    cr = ci / ri if ri > 0 else np.zeros_like(ci)
+
+    return {
+        'weights': weights,
+        'lambda_max': lambda_max,
+        'CI': ci,
+        'CR': cr,
+    }
+
+
+def calculate_rank_positions(weights):
+    """
+    Rank positions of weight vectors (0 = highest weight).
+
+    Args:
+        weights: (..., n) array of weight vectors
+
+    Returns:
+        numpy.ndarray: Integer rank positions with the same shape
+    """
+    order = np.argsort(-weights, axis=-1)
+    positions = np.empty_like(order)
+    np.put_along_axis(positions, order, np.arange(weights.shape[-1]), axis=-1)
+    return positions
+
+
+def bootstrap_group_weights(log_tensor, group_weights, num_samples=1000,
+                            expert_weights=None, priorities=None,
+                            confidence=0.95, seed=None):
+    """
+    Bootstrap percentile intervals for group weights by resampling experts.
+
+    All resamples are drawn as one (B, k) index array and evaluated as a
+    single (B, n, n) batch: the index array is turned into per-resample
+    expert counts, the resampled group log matrices are one matrix product
+    with the flattened expert tensor, and the batch is solved with
+    batched_principal_eigenvectors.
+
+    Args:
+        log_tensor: (k, n, n) log tensor
+        group_weights: Point estimate of the group weights (length n)
+        num_samples: Number of bootstrap resamples (B)
+        expert_weights: Optional weight per expert (equal if None)
+        priorities: Optional (k, n) individual priorities; resample AIP instead of AIJ
+        confidence: Confidence level of the percentile intervals
+        seed: Optional random seed for reproducible intervals
+
+    Returns:
+        dict:
+            - num_samples: B
+            - confidence: Confidence level
+            - lower: Lower interval bound per alternative
+            - upper: Upper interval bound per alternative
+            - std: Bootstrap standard deviation per alternative
+            - rank_probabilities: n×n, P(alternative i has rank r + 1)
+            - rank_stability: P(alternative keeps its point-estimate rank)
+    """
+    k, n, _ = log_tensor.shape
+    rng = np.random.default_rng(seed)
+
+    # (B, k) index arrays -> how often each expert appears in each resample
+    indices = rng.integers(0, k, size=(num_samples, k))
+    offsets = np.arange(num_samples)[:, None] * k
+    counts = np.bincount((indices + offsets).ravel(), minlength=num_samples * k)
+    counts = counts.reshape(num_samples, k).astype(float)
+
+    resample_weights = counts * normalize_expert_weights(expert_weights, k)
+    resample_weights /= resample_weights.sum(axis=1, keepdims=True)
+
+    if priorities is None:
+        group_logs = (resample_weights @ log_tensor.reshape(k, n * n)).reshape(num_samples, n, n)
+        samples, _ = batched_principal_eigenvectors(np.exp(group_logs))
+    else:
+        samples = np.exp(resample_weights @ np.log(priorities))
+        samples /= samples.sum(axis=1, keepdims=True)
+
+    alpha = 1.0 - confidence
+    lower, upper = np.percentile(samples, [100 * alpha / 2, 100 * (1 - alpha / 2)], axis=0)
+
+    sample_ranks = calculate_rank_positions(samples)
+    point_ranks = calculate_rank_positions(np.asarray(group_weights))
+    rank_probabilities = (sample_ranks[:, :, None] == np.arange(n)).mean(axis=0)
+
+    return {
+        'num_samples': num_samples,
+        'confidence': confidence,
+        'lower': lower.tolist(),
+        'upper': upper.tolist(),
+        'std': samples.std(axis=0).tolist(),
+        'rank_probabilities': rank_probabilities.tolist(),
+        'rank_stability': rank_probabilities[np.arange(n), point_ranks].tolist(),
+    }
+
+
+def gci_threshold(n):
+    """Return the GCI acceptance threshold for an n×n matrix."""
+    return GCI_THRESHOLDS.get(n, GCI_THRESHOLD_DEFAULT)
+
+
+def geometric_compatibility_index(log_tensor, weights):
+    """
+    Geometric compatibility index (GCI) of every expert against a priority vector.
+
+    Formula: GCI_k = 2 / ((n-1)(n-2)) · Σ_{i<j} ln²(a_ij^(k) · w_j / w_i)
+
+    Args:
+        log_tensor: (k, n, n) log tensor
+        weights: Group priority vector of length n, or (k, n) per-expert vectors
+
+    Returns:
+        numpy.ndarray: GCI per expert, shape (k,)
+    """
+    k, n, _ = log_tensor.shape
+    if n < 3:
+        return np.zeros(k)
+
+    log_w = np.log(weights)
+    errors = log_tensor - (log_w[..., :, None] - log_w[..., None, :])
+
+    # Squared errors are symmetric, so the full sum counts every pair twice
+    return np.einsum('kij,kij->k', errors, errors) / ((n - 1) * (n - 2))
+
+
+def individual_gci(log_tensor):
+    """
+    GCI of every expert against their own row geometric mean priorities.
+
+    Args:
+        log_tensor: (k, n, n) log tensor
+
+    Returns:
+        numpy.ndarray: GCI per expert, shape (k,)
+    """
+    return geometric_compatibility_index(log_tensor, np.exp(log_tensor.mean(axis=-1)))
+
+
+def weights_from_inconsistency(indices, threshold):
+    """
+    Expert weights that decrease with an inconsistency index.
+
+    Formula: λ_k ∝ 1 / (1 + index_k / threshold), so a perfectly consistent
+    expert counts twice as much as one exactly at the acceptance threshold.
+
+    Args:
+        indices: Array of CR or GCI values, one per expert
+        threshold: Acceptance threshold of the index
+
+    Returns:
+        numpy.ndarray: Normalized expert weights
+    """
+    indices = np.clip(np.asarray(indices, dtype=float), 0.0, None)
+    weights = 1.0 / (1.0 + indices / threshold)
+    return weights / weights.sum()
+
+
+def expert_distance_matrix(log_tensor):
+    """
+    Pairwise expert-to-expert distances in log space.
+
+    Distance is the root mean square difference of log judgments over the
+    n(n-1)/2 pairs, computed from the Gram matrix of the expert tensor.
+
+    Args:
+        log_tensor: (k, n, n) log tensor
+
+    Returns:
+        numpy.ndarray: (k, k) symmetric distance matrix
+    """
+    k, n, _ = log_tensor.shape
+    num_pairs = n * (n - 1) // 2
+    if num_pairs == 0:
+        return np.zeros((k, k))
+
+    # Full-matrix dot products count every pair twice (a_ij and a_ji)
+    gram = np.einsum('kij,lij->kl', log_tensor, log_tensor) / 2.0
+    squared_norms = np.diag(gram)
+    squared = squared_norms[:, None] + squared_norms[None, :] - 2.0 * gram
+
+    distances = np.sqrt(np.clip(squared, 0.0, None) / num_pairs)
+    np.fill_diagonal(distances, 0.0)
+
+    return distances
+
+
+def leave_one_out_distances(log_tensor, expert_weights=None):
+    """
+    Distance of every expert from the group matrix aggregated without them.
+
+    With S = Σ_k λ_k L_k the leave-one-out log mean is (S − λ_k L_k) / (1 − λ_k),
+    which is (S − L_k) / (k − 1) for equal weights, so all k distances cost
+    O(k·n²) instead of k re-aggregations.
+
+    Args:
+        log_tensor: (k, n, n) log tensor
+        expert_weights: Optional weight per expert (equal if None)
+
+    Returns:
+        numpy.ndarray: RMS log distance per expert, shape (k,)
+    """
+    k, n, _ = log_tensor.shape
+    num_pairs = n * (n - 1) // 2
+    if k < 2 or num_pairs == 0:
+        return np.zeros(k)
+
+    weights = normalize_expert_weights(expert_weights, k)
+    weighted = weights[:, None, None] * log_tensor
+    total = weighted.sum(axis=0)
+
+    remaining = np.clip(1.0 - weights, 1e-12, None)
+    leave_one_out = (total[None, :, :] - weighted) / remaining[:, None, None]
+    differences = log_tensor - leave_one_out
+
+    # Full-matrix sum counts every pair twice
+    return np.sqrt(np.einsum('kij,kij->k', differences, differences) / (2.0 * num_pairs))
+
+
+def detect_outliers(log_tensor, expert_weights=None, threshold=OUTLIER_Z_THRESHOLD):
+    """
+    Flag experts whose leave-one-out distance is anomalously large.
+
+    Uses the robust z-score 0.6745·(d_k − median(d)) / MAD(d). Fewer than
+    three experts are never flagged.
+
+    Args:
+        log_tensor: (k, n, n) log tensor
+        expert_weights: Optional weight per expert (equal if None)
+        threshold: Robust z-score threshold
+
+    Returns:
+        dict:
+            - distances: Leave-one-out distance per expert
+            - robust_z: Robust z-score per expert
+            - flagged: Whether each expert is an outlier
+            - threshold: Threshold used
+    """
+    k = log_tensor.shape[0]
+    distances = leave_one_out_distances(log_tensor, expert_weights)
+
+    robust_z = np.zeros(k)
+    if k >= 3:
+        median = np.median(distances)
+        deviation = np.abs(distances - median)
+        mad = np.median(deviation)
+        if mad > 0:
+            robust_z = 0.6745 * (distances - median) / mad
+        elif deviation.mean() > 0:
+            # More than half the experts agree exactly; fall back to mean deviation
+            robust_z = 0.7979 * (distances - median) / deviation.mean()
+
+    return {
+        'distances': distances.tolist(),
+        'robust_z': robust_z.tolist(),
+        'flagged': (robust_z > threshold).tolist(),
+        'threshold': threshold,
+    }
+
+
+def consensus_score(distances):
+    """
+    Overall consensus in [0, 1] from the expert distance matrix.
+
+    1.0 means identical judgments; 0.0 means experts are on average as far
+    apart as two opposite extreme judgments.
+
+    Args:
+        distances: (k, k) expert distance matrix
+
+    Returns:
+        float: Consensus score
+    """
+    k = distances.shape[0]
+    if k < 2:
+        return 1.0
+
+    mean_distance = distances.sum() / (k * (k - 1))
+    return float(np.clip(1.0 - mean_distance / (2.0 * MAX_LOG_JUDGMENT), 0.0, 1.0))
+
+
+def consensus_metrics(log_tensor, weights):
+    """
+    Compute consensus and compatibility metrics for a group of experts.
+
+    Args:
+        log_tensor: (k, n, n) log tensor
+        weights: Group priority vector of length n
+
+    Returns:
+        dict:
+            - gci: GCI per expert
+            - gci_threshold: Acceptance threshold for n
+            - compatible: Whether each expert's GCI is within the threshold
+            - distance_matrix: (k, k) expert-to-expert distances
+            - consensus_score: Overall consensus in [0, 1]
+    """
+    n = log_tensor.shape[1]
+    gci = geometric_compatibility_index(log_tensor, weights)
+    threshold = gci_threshold(n)
+    distances = expert_distance_matrix(log_tensor)
+
+    return {
+        'gci': gci.tolist(),
+        'gci_threshold': threshold,
+        'compatible': (gci <= threshold).tolist(),
+        'distance_matrix': distances.tolist(),
+        'consensus_score': consensus_score(distances),
+    }
+
+
+def judgment_features(log_tensor):
+    """
+    Flatten every expert's upper-triangle log judgments into a feature row.
+
+    Args:
+        log_tensor: (k, n, n) log tensor
+
+    Returns:
+        numpy.ndarray: (k, n(n-1)/2) feature matrix in fixed pair order
+    """
+    n = log_tensor.shape[-1]
+    rows, cols = np.triu_indices(n, 1)
+    return log_tensor[:, rows, cols]
+
+
+def cluster_experts(log_tensor, num_clusters, method='kmeans', seed=None):
+    """
+    Cluster experts by their log-judgment vectors and aggregate each cluster.
+
+    Args:
+        log_tensor: (k, n, n) log tensor
+        num_clusters: Requested number of clusters (capped at k)
+        method: 'kmeans' (k-means++) or 'agglomerative' (Ward linkage)
+        seed: Optional random seed for k-means
+
+    Returns:
+        dict:
+            - labels: Cluster index per expert (clusters ordered by size)
+            - sizes: Number of experts per cluster
+            - weights: (C, n) group weights per cluster
+            - lambda_max: Principal eigenvalue per cluster matrix
+            - spread: RMS log distance of members from their cluster matrix
+    """
+    import warnings
+    from scipy.cluster.hierarchy import fcluster, linkage
+    from scipy.cluster.vq import kmeans2
+
+    if method not in CLUSTERING_METHODS:
+        raise ValueError(f"Unknown clustering method '{method}'. Use 'kmeans' or 'agglomerative'")
+
+    k, n, _ = log_tensor.shape
+    num_clusters = max(1, min(int(num_clusters), k))
+    features = judgment_features(log_tensor)
+
+    if num_clusters == 1:
+        raw_labels = np.zeros(k, dtype=int)
+    elif method == 'kmeans':
+        with warnings.catch_warnings():
+            # Empty clusters are dropped below
+            warnings.simplefilter('ignore')
+            _, raw_labels = kmeans2(features, num_clusters, minit='++', seed=seed)
+    else:
+        raw_labels = fcluster(linkage(features, method='ward'), num_clusters, criterion='maxclust')
+
+    # Relabel non-empty clusters by decreasing size
+    unique, inverse, sizes = np.unique(raw_labels, return_inverse=True, return_counts=True)
+    order = np.argsort(-sizes, kind='stable')
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    labels = rank[inverse]
+    sizes = sizes[order]
+
+    # Cluster mean log matrices as one (C, k) @ (k, n²) product
+    membership = (labels[None, :] == np.arange(sizes.size)[:, None]) / sizes[:, None]
+    cluster_logs = (membership @ log_tensor.reshape(k, n * n)).reshape(-1, n, n)
+    weights, lambda_max = batched_principal_eigenvectors(np.exp(cluster_logs))
+
+    num_pairs = max(n * (n - 1) // 2, 1)
+    residuals = features - judgment_features(cluster_logs)[labels]
+    spread = np.sqrt(
+        np.bincount(labels, weights=np.einsum('km,km->k', residuals, residuals))
+        / (sizes * num_pairs)
+    )
+
+    return {
+        'labels': labels.tolist(),
+        'sizes': sizes.tolist(),
+        'weights': weights.tolist(),
+        'lambda_max': lambda_max.tolist(),
+        'spread': spread.tolist(),
+    }
+
+
+def farthest_judgments(log_tensor, group_log_matrix, num_pairs=3,
+                       min_distance=FEEDBACK_MIN_DISTANCE):
+    """
+    Pick each expert's judgments farthest from the group in log space.
+
+    Args:
+        log_tensor: (k, n, n) log tensor
+        group_log_matrix: (n, n) log group matrix
+        num_pairs: Maximum number of judgments per expert
+        min_distance: Only judgments farther than this are returned
+
+    Returns:
+        Tuple of (experts, index_a, index_b, distances) arrays with one
+        entry per selected judgment, by expert and decreasing distance
+    """
+    k, n, _ = log_tensor.shape
+    rows, cols = np.triu_indices(n, 1)
+    num_pairs = max(0, min(int(num_pairs), rows.size))
+
+    if k == 0 or num_pairs == 0:
+        empty = np.zeros(0, dtype=int)
+        return empty, empty, empty, np.zeros(0)
+
+    distances = np.abs(judgment_features(log_tensor) - group_log_matrix[rows, cols])
+
+    # Top pairs per expert without sorting whole rows
+    top = np.argpartition(-distances, num_pairs - 1, axis=1)[:, :num_pairs]
+    top_distances = np.take_along_axis(distances, top, axis=1)
+    order = np.argsort(-top_distances, axis=1, kind='stable')
+    top = np.take_along_axis(top, order, axis=1).ravel()
+    top_distances = np.take_along_axis(top_distances, order, axis=1).ravel()
+
+    experts = np.repeat(np.arange(k), num_pairs)
+    keep = top_distances > min_distance
+
+    return experts[keep], rows[top[keep]], cols[top[keep]], top_distances[keep]
+
+
+def apply_judgment_deltas(log_sum, index_a, index_b, deltas):
+    """
+    Update a summed log matrix with changes to individual judgments.
+
+    Args:
+        log_sum: (n, n) sum of experts' log matrices
+        index_a: Row index of each changed judgment
+        index_b: Column index of each changed judgment
+        deltas: New minus old log value of each changed judgment
+
+    Returns:
+        numpy.ndarray: Updated (n, n) sum; the input is left untouched
+    """
+    log_sum = np.array(log_sum, dtype=float)
+    np.add.at(log_sum, (index_a, index_b), deltas)
+    np.add.at(log_sum, (index_b, index_a), -np.asarray(deltas, dtype=float))
+    return log_sum
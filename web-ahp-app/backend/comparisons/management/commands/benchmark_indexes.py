@@ -0,0 +1,230 @@
+"""
+Time the hot queries with and without the access pattern indexes.
+
+Builds a fixture of about --comparisons comparisons (20 alternatives, 50
+experts per project) with collaborators, friendships and messages in
+proportion, then times each query with the indexes declared in the
+models' Meta.indexes dropped and recreated, and prints the plan each
+query gets with the indexes. The Comparison (project, user) filter has no
+index of its own, as it is served by the unique_together index on
+(project, user, index_a, index_b); it is timed alongside so that claim
+is measured rather than assumed. Everything runs in one
+transaction that is rolled back, so the database is left unchanged; it
+needs a backend with transactional DDL (SQLite, PostgreSQL).
+"""
+import random
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Q
+
+from comparisons.models import Comparison, Friendship, Message, Project, ProjectCollaborator
+
+ALTERNATIVES = 20
+EXPERTS = 50
+USERS = 1000
+FRIENDS_PER_USER = 10
+# Messages per comparison in the fixture
+MESSAGE_RATIO = 0.2
+
+INDEXED_MODELS = (ProjectCollaborator, Friendship, Message)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the hot queries with and without the access pattern indexes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--comparisons', type=int, default=1_000_000,
+            help='Approximate number of comparisons in the fixture (default: 1000000)'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=20,
+            help='Runs of each query; the fastest is reported (default: 20)'
+        )
+
+    def handle(self, *args, **options):
+        if not connection.features.can_rollback_ddl:
+            raise CommandError(
+                f'{connection.vendor} cannot roll back index changes; '
+                'run the benchmark on SQLite or PostgreSQL'
+            )
+        if options['comparisons'] < 1 or options['repeat'] < 1:
+            raise CommandError('--comparisons and --repeat must be positive')
+
+        with transaction.atomic():
+            started = time.perf_counter()
+            sample = self.build_fixture(options['comparisons'])
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+            self.stdout.write(f'Built fixture in {time.perf_counter() - started:.1f} s')
+
+            queries = self.hot_queries(**sample)
+            self.set_indexes(create=False)
+            before = self.time_queries(queries, options['repeat'])
+            self.set_indexes(create=True)
+            after = self.time_queries(queries, options['repeat'])
+
+            self.report(queries, before, after)
+            self.report_plans(queries)
+            transaction.set_rollback(True)
+
+    def build_fixture(self, comparisons):
+        """
+        Create the fixture rows with bulk_create (no signals, so counters
+        are left at zero).
+
+        Returns:
+            Dictionary of the sample rows the hot queries filter on
+        """
+        rng = random.Random(0)
+        pairs = [(i, j) for i in range(ALTERNATIVES) for j in range(i + 1, ALTERNATIVES)]
+        project_count = max(1, round(comparisons / (EXPERTS * len(pairs))))
+
+        users = User.objects.bulk_create(
+            User(username=f'benchmark-{i}', password='!') for i in range(USERS)
+        )
+        projects = Project.objects.bulk_create(
+            Project(
+                user=rng.choice(users), title=f'Benchmark {i}', is_collaborative=True,
+                alternatives=[f'Alternative {a}' for a in range(ALTERNATIVES)],
+            )
+            for i in range(project_count)
+        )
+
+        sample_expert = None
+        for project in projects:
+            experts = rng.sample(users, EXPERTS)
+            sample_expert = sample_expert or experts[0]
+            ProjectCollaborator.objects.bulk_create(
+                ProjectCollaborator(
+                    project=project, user=expert,
+                    status=rng.choices(['invited', 'active', 'completed'], [1, 2, 7])[0],
+                )
+                for expert in experts
+            )
+            Comparison.objects.bulk_create(
+                (
+                    Comparison(
+                        project=project, user=expert, index_a=i, index_b=j,
+                        value=rng.uniform(1 / 9, 9), direction='more',
+                    )
+                    for expert in experts for i, j in pairs
+                ),
+                batch_size=5000
+            )
+
+        friendships = {
+            (user, friend)
+            for user in users for friend in rng.sample(users, FRIENDS_PER_USER)
+            if user != friend
+        }
+        Friendship.objects.bulk_create(
+            (
+                Friendship(
+                    user=user, friend=friend,
+                    status=rng.choices(['pending', 'accepted', 'declined'], [1, 8, 1])[0],
+                )
+                for user, friend in friendships
+                if (friend, user) not in friendships or user.id < friend.id
+            ),
+            batch_size=5000
+        )
+
+        Message.objects.bulk_create(
+            (
+                Message(
+                    sender=sender, recipient=recipient, content='Benchmark message',
+                    is_read=rng.random() < 0.95,
+                )
+                for sender, recipient in (
+                    rng.sample(users, 2) for _ in range(int(comparisons * MESSAGE_RATIO))
+                )
+            ),
+            batch_size=5000
+        )
+
+        return {
+            'project': projects[0],
+            'expert': sample_expert,
+            'user': users[0],
+            'other_user': users[1],
+        }
+
+    def hot_queries(self, project, expert, user, other_user):
+        """The filters of the endpoints, as (label, queryset) pairs."""
+        return [
+            ('Comparisons of an expert', Comparison.objects.filter(
+                project=project, user=expert
+            ).values_list('index_a', 'index_b', 'value')),
+            ('Experts of a project by status', ProjectCollaborator.objects.filter(
+                project=project, status='completed'
+            ).values_list('user_id')),
+            ('Projects of a user', Project.objects.filter(
+                Q(user=user) |
+                Q(collaborators__user=user,
+                  collaborators__status__in=['invited', 'active', 'completed'])
+            ).distinct().values_list('id')),
+            ('Invitations of a user', ProjectCollaborator.objects.filter(
+                user=user, status='invited'
+            ).values_list('project_id')),
+            ('Pending friend requests', Friendship.objects.filter(
+                friend=user, status='pending'
+            ).values_list('id')),
+            ('Unread messages of a user', Message.objects.filter(
+                recipient=user, is_read=False
+            ).values_list('id')),
+            ('Conversation', Message.objects.filter(
+                Q(sender=user, recipient=other_user) | Q(sender=other_user, recipient=user)
+            ).order_by('created_at').values_list('id')),
+        ]
+
+    def set_indexes(self, create):
+        """Create or drop the indexes declared in the models' Meta.indexes."""
+        schema_editor = connection.schema_editor()
+        with connection.cursor() as cursor:
+            for model in INDEXED_MODELS:
+                for index in model._meta.indexes:
+                    if create:
+                        statement = index.create_sql(model, schema_editor)
+                    else:
+                        statement = index.remove_sql(model, schema_editor)
+                    cursor.execute(str(statement))
+            cursor.execute('ANALYZE')
+
+    def time_queries(self, queries, repeat):
+        """
+        Fastest run of each query, in milliseconds.
+
+        The SQL is compiled once, so the timings are the database's alone.
+        """
+        timings = []
+        with connection.cursor() as cursor:
+            for label, queryset in queries:
+                sql, params = queryset.query.sql_with_params()
+                runs = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    cursor.execute(sql, params)
+                    cursor.fetchall()
+                    runs.append(time.perf_counter() - started)
+                timings.append(min(runs) * 1000)
+        return timings
+
+    def report(self, queries, before, after):
+        width = max(len(label) for label, query in queries)
+        self.stdout.write(f"{'Query':<{width}}  {'Before':>10}  {'After':>10}  {'Speedup':>8}")
+        for (label, query), old, new in zip(queries, before, after):
+            self.stdout.write(
+                f'{label:<{width}}  {old:>8.2f}ms  {new:>8.2f}ms  {old / new:>7.1f}x'
+            )
+
+    def report_plans(self, queries):
+        """The database's plan of each query, with the indexes in place."""
+        self.stdout.write('\nQuery plans:')
+        for label, queryset in queries:
+            self.stdout.write(f'{label}:')
+            for line in queryset.explain().splitlines():
+                self.stdout.write(f'  {line}')
@@ -0,0 +1,137 @@
+"""
+Recompute all saved results, e.g. after a change to the formulas.
+
+Project IDs are streamed in chunks to a pool of worker processes. Each
+worker loads the comparisons of its whole chunk at once and writes the
+recomputed rows back with bulk_update. Progress is saved to a state file
+after every chunk, so an interrupted run resumes where it stopped.
+"""
+import json
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from django.core.management.base import BaseCommand, CommandError
+
+from comparisons.models import Project
+from comparisons.recompute import init_worker, recompute_chunk
+
+
+def _project_chunks(start_after, chunk_size):
+    """
+    Yield project IDs in ascending chunks.
+
+    Each chunk is its own keyset query, so no cursor stays open while
+    the workers write.
+    """
+    while True:
+        chunk = list(
+            Project.objects.filter(id__gt=start_after).order_by('id')
+            .values_list('id', flat=True)[:chunk_size]
+        )
+        if not chunk:
+            return
+        yield chunk
+        start_after = chunk[-1]
+
+
+class Command(BaseCommand):
+    help = 'Recompute all saved results and aggregated results in parallel'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1,
+            help='Number of worker processes (default: number of CPUs)'
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=100,
+            help='Number of projects per worker task (default: 100)'
+        )
+        parser.add_argument(
+            '--state-file', default='recompute_results.state.json',
+            help='File recording progress for resuming an interrupted run'
+        )
+        parser.add_argument(
+            '--restart', action='store_true',
+            help='Ignore saved progress and recompute all projects'
+        )
+
+    def handle(self, *args, **options):
+        workers = options['workers']
+        chunk_size = options['chunk_size']
+        state_file = options['state_file']
+
+        if workers < 1 or chunk_size < 1:
+            raise CommandError('--workers and --chunk-size must be positive')
+
+        start_after = 0
+        if not options['restart'] and os.path.exists(state_file):
+            with open(state_file) as f:
+                start_after = json.load(f).get('last_project_id', 0)
+            self.stdout.write(f'Resuming after project {start_after}')
+
+        chunks = _project_chunks(start_after, chunk_size)
+
+        totals = {'results': 0, 'aggregated_results': 0, 'skipped': []}
+
+        # Chunks finish out of order; progress only advances past chunks
+        # whose predecessors have all finished
+        submitted = deque()
+        finished = {}
+        checkpoint = start_after
+
+        # Spawned workers open their own database connections instead of
+        # inheriting the parent's
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=init_worker
+        ) as executor:
+            pending = set()
+
+            def submit_next():
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    submitted.append(chunk[-1])
+                    pending.add(executor.submit(recompute_chunk, chunk))
+
+            # Keep every worker busy with a bounded number of chunks in flight
+            for _ in range(workers * 2):
+                submit_next()
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    summary = future.result()
+                    finished[summary['last_project_id']] = summary
+                    for key in ('results', 'aggregated_results'):
+                        totals[key] += summary[key]
+                    totals['skipped'].extend(summary['skipped'])
+                    submit_next()
+
+                while submitted and submitted[0] in finished:
+                    checkpoint = submitted.popleft()
+                    del finished[checkpoint]
+
+                with open(state_file, 'w') as f:
+                    json.dump({'last_project_id': checkpoint}, f)
+
+                self.stdout.write(
+                    f"Up to project {checkpoint}: {totals['results']} results, "
+                    f"{totals['aggregated_results']} aggregated results"
+                )
+
+        if os.path.exists(state_file):
+            os.remove(state_file)
+
+        if totals['skipped']:
+            self.stdout.write(self.style.WARNING(
+                f"Skipped projects without enough judgments: {sorted(totals['skipped'])}"
+            ))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Recomputed {totals['results']} results and "
+            f"{totals['aggregated_results']} aggregated results"
+        ))
@@ -0,0 +1,29 @@
+"""
+Recompute the denormalized progress counters from the underlying rows.
+
+The counters are kept up to date with F() updates as comparisons and
+collaborators change; this fixes any drift, e.g. after rows were changed
+outside the application or deleted together with their user.
+"""
+from django.core.management.base import BaseCommand
+
+from comparisons.counters import reconcile_counters
+
+
+class Command(BaseCommand):
+    help = 'Recompute project and collaborator progress counters and fix drifted ones'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Only report drifted counters without fixing them'
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        projects, collaborators = reconcile_counters(dry_run=dry_run)
+
+        verb = 'Found' if dry_run else 'Fixed'
+        message = f'{verb} drifted counters on {projects} projects and {collaborators} collaborators'
+        style = self.style.WARNING if dry_run and (projects or collaborators) else self.style.SUCCESS
+        self.stdout.write(style(message))
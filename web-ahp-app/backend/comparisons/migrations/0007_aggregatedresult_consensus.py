@@ -0,0 +1,18 @@
+# Generated by Django 4.2.8 on 2026-10-19 02:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comparisons", "0006_message_friendship"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="aggregatedresult",
+            name="consensus",
+            field=models.JSONField(default=dict),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.8 on 2026-10-19 02:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comparisons", "0007_aggregatedresult_consensus"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="aggregatedresult",
+            name="weighting",
+            field=models.CharField(
+                choices=[
+                    ("equal", "Equal"),
+                    ("competence", "Competence"),
+                    ("cr", "Consistency Ratio"),
+                    ("gci", "Geometric Consistency Index"),
+                ],
+                default="equal",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="projectcollaborator",
+            name="competence",
+            field=models.FloatField(default=1.0),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.8 on 2026-10-19 02:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comparisons", "0009_aggregatedresult_bootstrap"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="aggregatedresult",
+            name="outliers",
+            field=models.JSONField(default=dict),
+        ),
+    ]
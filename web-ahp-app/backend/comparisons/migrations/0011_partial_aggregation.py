@@ -0,0 +1,23 @@
+# Generated by Django 4.2.8 on 2026-10-19 02:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comparisons", "0010_aggregatedresult_outliers"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="aggregatedresult",
+            name="coverage",
+            field=models.JSONField(default=dict),
+        ),
+        migrations.AddField(
+            model_name="aggregatedresult",
+            name="include_partial",
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.8 on 2026-10-19 02:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comparisons", "0011_partial_aggregation"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="aggregatedresult",
+            name="group_results",
+            field=models.JSONField(default=dict),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="group_weights",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name="projectcollaborator",
+            name="group",
+            field=models.CharField(blank=True, default="", max_length=255),
+        ),
+    ]
@@ -0,0 +1,99 @@
+# Generated by Django 4.2.8 on 2026-10-19 02:38
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("comparisons", "0012_expert_groups"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ConsensusRound",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("number", models.IntegerField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("open", "Open"), ("closed", "Closed")],
+                        default="open",
+                        max_length=20,
+                    ),
+                ),
+                ("expert_ids", models.JSONField(default=list)),
+                ("num_judgments", models.IntegerField(default=0)),
+                ("log_sum", models.JSONField(default=list)),
+                ("final_weights", models.JSONField(default=list)),
+                ("consistency_ratio", models.FloatField(blank=True, null=True)),
+                ("consensus_score", models.FloatField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("closed_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="consensus_rounds",
+                        to="comparisons.project",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-number"],
+                "unique_together": {("project", "number")},
+            },
+        ),
+        migrations.CreateModel(
+            name="Feedback",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("index_a", models.IntegerField()),
+                ("index_b", models.IntegerField()),
+                ("previous_value", models.FloatField()),
+                ("group_value", models.FloatField()),
+                ("distance", models.FloatField()),
+                ("resolved", models.BooleanField(default=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "consensus_round",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="feedback",
+                        to="comparisons.consensusround",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-distance"],
+                "unique_together": {("consensus_round", "user", "index_a", "index_b")},
+            },
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 4.2.8 on 2026-10-19 03:05
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_rows(queryset, group_by):
+    return Coalesce(
+        Subquery(
+            queryset.order_by()
+            .values(group_by)
+            .annotate(total=Count("id"))
+            .values("total")
+        ),
+        0,
+    )
+
+
+def populate_counters(apps, schema_editor):
+    Comparison = apps.get_model("comparisons", "Comparison")
+    Project = apps.get_model("comparisons", "Project")
+    ProjectCollaborator = apps.get_model("comparisons", "ProjectCollaborator")
+
+    Project.objects.update(
+        comparison_count=count_rows(
+            Comparison.objects.filter(project=OuterRef("pk")), "project"
+        ),
+        active_experts=count_rows(
+            ProjectCollaborator.objects.filter(project=OuterRef("pk"), status="active"),
+            "project",
+        ),
+        completed_experts=count_rows(
+            ProjectCollaborator.objects.filter(
+                project=OuterRef("pk"), status="completed"
+            ),
+            "project",
+        ),
+    )
+    ProjectCollaborator.objects.update(
+        comparison_count=count_rows(
+            Comparison.objects.filter(
+                project=OuterRef("project"), user=OuterRef("user")
+            ),
+            "project",
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comparisons", "0013_consensus_rounds"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="active_experts",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="comparison_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="completed_experts",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="projectcollaborator",
+            name="comparison_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
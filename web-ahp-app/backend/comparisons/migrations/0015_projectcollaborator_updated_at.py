@@ -0,0 +1,22 @@
+# Generated by Django 4.2.8 on 2026-10-19 04:10
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comparisons", "0014_progress_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectcollaborator",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.8 on 2026-10-19 05:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comparisons", "0015_projectcollaborator_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="friendship",
+            index=models.Index(
+                fields=["friend", "status"], name="friendship_friend_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                fields=["sender", "recipient", "created_at"],
+                name="message_conversation_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                condition=models.Q(("is_read", False)),
+                fields=["recipient"],
+                name="message_unread_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projectcollaborator",
+            index=models.Index(
+                fields=["project", "status"], name="collab_project_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projectcollaborator",
+            index=models.Index(
+                fields=["user", "status"], name="collab_user_status_idx"
+            ),
+        ),
+    ]
@@ -17,7 +17,29 @@ class UserProfile(models.Model):
         return f"Profile for {self.user.username}"
 
 
-class Project(models.Model):
+class CounterModel(models.Model):
+    """
+    Model with denormalized counters maintained by comparisons.counters.
+
+    Counters are only changed with F() updates, so saving an existing row
+    never writes them: a stale in-memory value would overwrite concurrent
+    increments. Pass update_fields explicitly to write a counter anyway.
+    """
+    COUNTER_FIELDS = ()
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+
+class Project(CounterModel):
     """A pairwise comparison project/session."""
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='projects')
     title = models.CharField(max_length=255)
@@ -41,6 +63,17 @@ class Project(models.Model):
     # Collaborative features
     is_collaborative = models.BooleanField(default=False)
 
+    # Weights of expert groups for hierarchical aggregation, keyed by group label
+    group_weights = models.JSONField(default=dict, blank=True)
+
+    # Progress counters (see comparisons.counters): all comparisons, and
+    # collaborators with status 'active' and 'completed'
+    comparison_count = models.IntegerField(default=0)
+    active_experts = models.IntegerField(default=0)
+    completed_experts = models.IntegerField(default=0)
+
+    COUNTER_FIELDS = ('comparison_count', 'active_experts', 'completed_experts')
+
     # Status
     STATUS_CHOICES = [
         ('input', 'Input Alternatives'),
@@ -60,7 +93,7 @@ class Project(models.Model):
         return f"{self.title} - {self.user.username}"
 
 
-class ProjectCollaborator(models.Model):
+class ProjectCollaborator(CounterModel):
     """Track expert collaborators on a project."""
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='collaborators')
     user = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -78,12 +111,38 @@ class ProjectCollaborator(models.Model):
     ]
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='invited')
 
+    # Explicit expert competence for competence-weighted aggregation
+    competence = models.FloatField(default=1.0)
+
+    # Expert group (team) label; nested groups use "/", e.g. "Engineering/Backend"
+    group = models.CharField(max_length=255, blank=True, default='')
+
     invited_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Comparisons this expert has made on the project (see comparisons.counters)
+    comparison_count = models.IntegerField(default=0)
+
+    COUNTER_FIELDS = ('comparison_count',)
 
     class Meta:
         unique_together = ['project', 'user']
         ordering = ['invited_at']
+        indexes = [
+            # Experts of a project by status (progress, aggregation)
+            models.Index(fields=['project', 'status'], name='collab_project_status_idx'),
+            # Projects and invitations of a user
+            models.Index(fields=['user', 'status'], name='collab_user_status_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Status as stored, so a status change can move the project's expert counters
+        if 'status' in instance.__dict__:
+            instance._stored_status = instance.status
+        return instance
 
     def __str__(self):
         return f"{self.user.username} - {self.project.title} ({self.role})"
@@ -176,6 +235,14 @@ class AggregatedResult(models.Model):
     ]
     aggregation_method = models.CharField(max_length=20, choices=METHOD_CHOICES, default='AIJ')
 
+    WEIGHTING_CHOICES = [
+        ('equal', 'Equal'),
+        ('competence', 'Competence'),
+        ('cr', 'Consistency Ratio'),
+        ('gci', 'Geometric Consistency Index'),
+    ]
+    weighting = models.CharField(max_length=20, choices=WEIGHTING_CHOICES, default='equal')
+
     # Number of experts whose judgments were aggregated
     num_experts = models.IntegerField()
 
@@ -185,7 +252,7 @@ class AggregatedResult(models.Model):
     # Final weights (stored as JSON array)
     final_weights = models.JSONField()
 
-    # Individual expert weights (for AIP method, stored as JSON)
+    # Weight of each expert in the aggregation, keyed by user ID (stored as JSON)
     expert_weights = models.JSONField(default=dict)
 
     # Consistency metrics for aggregated matrix
@@ -193,6 +260,22 @@ class AggregatedResult(models.Model):
     lambda_max = models.FloatField(null=True, blank=True)
     consistency_index = models.FloatField(null=True, blank=True)
 
+    # Expert compatibility (GCI), expert distances and consensus score
+    consensus = models.JSONField(default=dict)
+
+    # Bootstrap intervals and rank stability of final weights (empty if not requested)
+    bootstrap = models.JSONField(default=dict)
+
+    # Leave-one-out outlier screening and experts excluded in robust mode
+    outliers = models.JSONField(default=dict)
+
+    # Interim aggregation over partially completed experts and per-pair coverage
+    include_partial = models.BooleanField(default=False)
+    coverage = models.JSONField(default=dict)
+
+    # Per-group weights and sizes for hierarchical aggregation (empty if flat)
+    group_results = models.JSONField(default=dict)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -203,6 +286,70 @@ class AggregatedResult(models.Model):
         return f"Aggregated Results for {self.project.title} ({self.num_experts} experts)"
 
 
+class ConsensusRound(models.Model):
+    """A round of the iterative consensus-reaching process on a project."""
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='consensus_rounds')
+    number = models.IntegerField()
+
+    STATUS_CHOICES = [
+        ('open', 'Open'),
+        ('closed', 'Closed'),
+    ]
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='open')
+
+    # Experts and number of their judgments the round's accumulators were built from
+    expert_ids = models.JSONField(default=list)
+    num_judgments = models.IntegerField(default=0)
+
+    # Sum of the experts' log matrices when the round opened (stored as JSON);
+    # the group matrix is exp(log_sum / number of experts)
+    log_sum = models.JSONField(default=list)
+
+    # Group weights and agreement when the round opened
+    final_weights = models.JSONField(default=list)
+    consistency_ratio = models.FloatField(null=True, blank=True)
+    consensus_score = models.FloatField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    closed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ['project', 'number']
+        ordering = ['-number']
+
+    def __str__(self):
+        return f"Round {self.number} - {self.project.title} ({self.status})"
+
+
+class Feedback(models.Model):
+    """A judgment an expert is asked to reconsider in a consensus round."""
+    consensus_round = models.ForeignKey(ConsensusRound, on_delete=models.CASCADE, related_name='feedback')
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+
+    # Indices of compared alternatives
+    index_a = models.IntegerField()
+    index_b = models.IntegerField()
+
+    # Expert's and group's judgment on the project scale when the round opened
+    previous_value = models.FloatField()
+    group_value = models.FloatField()
+
+    # Log-space distance between the expert's and the group's judgment
+    distance = models.FloatField()
+
+    # Whether the expert has re-answered the pair during the round
+    resolved = models.BooleanField(default=False)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ['consensus_round', 'user', 'index_a', 'index_b']
+        ordering = ['-distance']
+
+    def __str__(self):
+        return f"Feedback for {self.user.username}: {self.index_a} vs {self.index_b}"
+
+
 class Friendship(models.Model):
     """Friend relationships between users."""
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='friendships')
@@ -221,6 +368,10 @@ class Friendship(models.Model):
     class Meta:
         unique_together = ['user', 'friend']
         ordering = ['-created_at']
+        indexes = [
+            # Friend requests received; (user, ...) is covered by unique_together
+            models.Index(fields=['friend', 'status'], name='friendship_friend_status_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} -> {self.friend.username} ({self.status})"
@@ -236,6 +387,14 @@ class Message(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Conversation between two users, in order
+            models.Index(fields=['sender', 'recipient', 'created_at'], name='message_conversation_idx'),
+            # Unread messages of a recipient; read messages are the bulk and stay out
+            models.Index(
+                fields=['recipient'], condition=models.Q(is_read=False), name='message_unread_idx'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.sender.username} -> {self.recipient.username}: {self.content[:50]}"
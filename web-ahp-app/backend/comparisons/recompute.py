@@ -0,0 +1,138 @@
+"""
+Bulk recomputation of saved results in worker processes.
+
+Workers are started with the spawn method, so this module must stay
+importable before Django is set up: models are imported inside functions.
+"""
+from collections import defaultdict
+
+
+RESULT_FIELDS = [
+    'matrix', 'weights', 'rankings', 'lambda_max', 'consistency_index',
+    'consistency_ratio', 'is_consistent', 'recommendations', 'updated_at',
+]
+
+AGGREGATED_RESULT_FIELDS = [
+    'num_experts', 'aggregated_matrix', 'final_weights', 'expert_weights',
+    'consistency_ratio', 'lambda_max', 'consistency_index', 'consensus',
+    'bootstrap', 'outliers', 'coverage', 'group_results', 'updated_at',
+]
+
+
+def recompute_results(project_ids):
+    """
+    Recompute the single-user results of a chunk of projects.
+
+    Args:
+        project_ids: IDs of the projects in the chunk
+
+    Returns:
+        Tuple of (number of updated results, list of skipped project IDs)
+    """
+    from django.utils import timezone
+    from .calculations import solve_comparisons
+    from .models import Comparison, Result
+
+    results = list(Result.objects.filter(project_id__in=project_ids).select_related('project'))
+    if not results:
+        return 0, []
+
+    comparisons = defaultdict(list)
+    for project_id, index_a, index_b, value in Comparison.objects.filter(
+        project_id__in=[result.project_id for result in results]
+    ).values_list('project_id', 'index_a', 'index_b', 'value'):
+        comparisons[project_id].append((index_a, index_b, value))
+
+    now = timezone.now()
+    updated, skipped = [], []
+
+    for result in results:
+        n = len(result.project.alternatives)
+        comparisons_list = comparisons[result.project_id]
+
+        # Results are only calculated from complete matrices
+        if n < 2 or len(comparisons_list) < n * (n - 1) // 2:
+            skipped.append(result.project_id)
+            continue
+
+        solution = solve_comparisons(n, comparisons_list)
+        consistency = solution['consistency']
+
+        result.matrix = solution['matrix']
+        result.weights = solution['weights']
+        result.rankings = solution['rankings']
+        result.lambda_max = consistency['lambda_max']
+        result.consistency_index = consistency['CI']
+        result.consistency_ratio = consistency['CR']
+        result.is_consistent = consistency['is_consistent']
+        result.recommendations = consistency['recommendations']
+        result.updated_at = now
+        updated.append(result)
+
+    Result.objects.bulk_update(updated, RESULT_FIELDS)
+
+    return len(updated), skipped
+
+
+def recompute_aggregated_results(project_ids):
+    """
+    Recompute the aggregated results of a chunk of projects.
+
+    Every saved aggregated result is recalculated from the current
+    judgments with the options it was originally calculated with.
+
+    Args:
+        project_ids: IDs of the projects in the chunk
+
+    Returns:
+        Tuple of (number of updated results, list of skipped project IDs)
+    """
+    from django.utils import timezone
+    from .aggregation import aggregation_options, compute_aggregated_result
+    from .models import AggregatedResult
+
+    now = timezone.now()
+    updated, skipped = [], []
+
+    for aggregated_result in AggregatedResult.objects.filter(project_id__in=project_ids):
+        try:
+            fields = compute_aggregated_result(
+                aggregated_result.project_id, **aggregation_options(aggregated_result)
+            )
+        except ValueError:
+            # E.g. every expert has since left the project
+            skipped.append(aggregated_result.project_id)
+            continue
+
+        for field in AGGREGATED_RESULT_FIELDS[:-1]:
+            setattr(aggregated_result, field, fields[field])
+        aggregated_result.updated_at = now
+        updated.append(aggregated_result)
+
+    AggregatedResult.objects.bulk_update(updated, AGGREGATED_RESULT_FIELDS)
+
+    return len(updated), skipped
+
+
+def init_worker():
+    """Set up Django in a freshly spawned worker process."""
+    import django
+    django.setup()
+
+
+def recompute_chunk(project_ids):
+    """
+    Recompute all results of a chunk of projects in a worker process.
+
+    Returns:
+        Dictionary with the chunk's last project ID and update counts
+    """
+    results, skipped_results = recompute_results(project_ids)
+    aggregated, skipped_aggregated = recompute_aggregated_results(project_ids)
+
+    return {
+        'last_project_id': project_ids[-1],
+        'results': results,
+        'aggregated_results': aggregated,
+        'skipped': sorted(set(skipped_results) | set(skipped_aggregated)),
+    }
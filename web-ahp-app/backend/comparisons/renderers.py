@@ -0,0 +1,94 @@
+"""
+Binary renderers for matrix-heavy responses, chosen with the Accept header.
+
+- MessagePackRenderer (application/x-msgpack) renders any response. NumPy
+  arrays become maps of {'dtype', 'shape', 'data'} with the raw
+  little-endian buffer as data.
+- ArrayRenderer (application/octet-stream) renders the NumPy array fields
+  of a response, concatenated as little-endian buffers in field order. The
+  X-Array-Layout header lists each field as "name dtype shape", e.g.
+  "aggregated_matrix <f8 30,30; weights <f8 30". Floats are float64, or
+  float32 with "Accept: application/octet-stream; dtype=float32".
+  Responses without arrays (errors) are rendered as JSON.
+
+Views opt in by putting NumPy arrays in the response data when a binary
+renderer was negotiated (see wants_arrays); the JSON renderer still turns
+such arrays into lists.
+"""
+import msgpack
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+FLOAT_DTYPES = {
+    'float64': '<f8',
+    'float32': '<f4',
+}
+
+
+def wants_arrays(request) -> bool:
+    """Whether the negotiated renderer emits NumPy arrays from their buffers."""
+    return isinstance(getattr(request, 'accepted_renderer', None), (MessagePackRenderer, ArrayRenderer))
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = 'application/x-msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        return msgpack.packb(data, default=self._encode, use_bin_type=True)
+
+    @staticmethod
+    def _encode(obj):
+        import numpy as np
+
+        if isinstance(obj, np.ndarray):
+            array = np.ascontiguousarray(obj, dtype=obj.dtype.newbyteorder('<'))
+            return {'dtype': array.dtype.str, 'shape': list(array.shape), 'data': array.data}
+        if isinstance(obj, np.generic):
+            return obj.item()
+        # Dates and other values the JSON encoder knows
+        return JSONRenderer.encoder_class().default(obj)
+
+
+class ArrayRenderer(BaseRenderer):
+    media_type = 'application/octet-stream'
+    format = 'bin'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        import numpy as np
+
+        response = (renderer_context or {}).get('response')
+        arrays = {}
+        if isinstance(data, dict):
+            arrays = {name: value for name, value in data.items() if isinstance(value, np.ndarray)}
+
+        if not arrays:
+            if response is not None:
+                response['Content-Type'] = JSONRenderer.media_type
+            return JSONRenderer().render(data, JSONRenderer.media_type, renderer_context)
+
+        float_dtype = FLOAT_DTYPES.get(self._requested_dtype(accepted_media_type), '<f8')
+        buffers, layout = [], []
+        for name, array in arrays.items():
+            dtype = float_dtype if array.dtype.kind == 'f' else array.dtype.newbyteorder('<').str
+            array = np.ascontiguousarray(array, dtype=dtype)
+            buffers.append(array.data)
+            layout.append(f"{name} {array.dtype.str} {','.join(map(str, array.shape))}")
+
+        if response is not None:
+            response['X-Array-Layout'] = '; '.join(layout)
+        return b''.join(buffers)
+
+    @staticmethod
+    def _requested_dtype(accepted_media_type):
+        for parameter in (accepted_media_type or '').split(';')[1:]:
+            key, _, value = parameter.partition('=')
+            if key.strip() == 'dtype':
+                return value.strip()
+        return None
@@ -1,13 +1,18 @@
 """
 Scale implementations for pairwise comparisons.
 Ported from the original Tkinter application.
+
+Scale values and the per-position judgment values are precomputed once into
+read-only NumPy tables; the transformation itself lives in ahp_core.scales,
+shared with the desktop application.
 """
-import math
 import numpy as np
 
+from ahp_core.scales import JUDGMENT_VALUES, SCALE_TYPES, integer_by_scale, unify
+
 
 class Scale:
-    """Base class for all scale types."""
+    """Base class for all scale types. Instances are immutable."""
 
     def __init__(self, gradations=9):
         """
@@ -17,10 +22,20 @@ class Scale:
             gradations: Number of gradations (3-9)
         """
         self.gradations = min(max(gradations, 3), 9)
-        self.values = self._calculate_values()
+        self.values = self._calculate_values(np.arange(1, self.gradations + 1))
+        self.values.setflags(write=False)
+
+    def _calculate_values(self, grades):
+        """
+        Calculate the values of all grades at once.
+        Must be implemented by subclasses.
 
-    def _calculate_values(self):
-        """Calculate scale values. Must be implemented by subclasses."""
+        Args:
+            grades: Array of grades 1 to n
+
+        Returns:
+            numpy.ndarray: Scale values
+        """
         raise NotImplementedError
 
     def unify(self, gradation_index):
@@ -33,168 +48,153 @@ class Scale:
         Returns:
             Unified value in range [1.5, 9.5]
         """
-        n = self.gradations
-        l = 1.5  # Lower bound
-        p = 9.5  # Upper bound
-
-        # M_i^n = l + (i - 0.5) * (p - l) / n
-        unified = l + (gradation_index - 0.5) * (p - l) / n
-        return unified
+        return float(unify(gradation_index, self.gradations))
 
 
 class IntegerScale(Scale):
     """Integer scale (1-9)."""
 
-    def _calculate_values(self):
+    def _calculate_values(self, grades):
         """Generate integer values 1 through gradations."""
-        return list(range(1, self.gradations + 1))
+        return grades.astype(float)
 
 
 class BalancedScale(Scale):
     """Balanced scale using weight ratio formula."""
 
-    def _calculate_values(self):
+    def _calculate_values(self, grades):
         """
         Generate balanced scale values.
         Formula: a = w / (1 - w), where w = i / (n + 1)
         """
-        n = self.gradations
-        values = []
-
-        for i in range(1, n + 1):
-            w = i / (n + 1)
-            if w < 1:
-                a = w / (1 - w)
-            else:
-                a = 9.0
-            values.append(a)
-
-        return values
+        w = grades / (self.gradations + 1)
+        return w / (1 - w)
 
 
 class PowerScale(Scale):
     """Power scale using exponential growth."""
 
-    def _calculate_values(self):
+    def _calculate_values(self, grades):
         """
         Generate power scale values.
         Formula: a = 9^((i-1)/(n-1))
         """
-        n = self.gradations
-        values = []
-
-        for i in range(1, n + 1):
-            if n > 1:
-                exponent = (i - 1) / (n - 1)
-                a = math.pow(9, exponent)
-            else:
-                a = 1.0
-            values.append(a)
-
-        return values
+        return np.power(9.0, (grades - 1) / (self.gradations - 1))
 
 
 class MaZhengScale(Scale):
     """Ma-Zheng scale."""
 
-    def _calculate_values(self):
+    def _calculate_values(self, grades):
         """
         Generate Ma-Zheng scale values.
         Formula: a = 9 / (9 + 1 - grade)
         """
-        values = []
-
-        for grade in range(1, self.gradations + 1):
-            a = 9 / (9 + 1 - grade)
-            values.append(a)
-
-        return values
+        return integer_by_scale(grades, 4)
 
 
 class DoneganScale(Scale):
     """Donegan scale using hyperbolic tangent."""
 
-    def _calculate_values(self):
+    def _calculate_values(self, grades):
         """
         Generate Donegan scale values.
-        Formula: a = exp(atanh((grade-1)/14 * sqrt(3)))
+        Formula: a = exp(atanh((grade-1)/14 * sqrt(3))), argument clamped to ±0.999
         """
-        values = []
+        return integer_by_scale(grades, 5)
 
-        for grade in range(1, self.gradations + 1):
-            try:
-                # atanh argument must be in (-1, 1)
-                arg = (grade - 1) / 14 * math.sqrt(3)
-                arg = min(max(arg, -0.999), 0.999)  # Clamp to valid range
 
-                a = math.exp(math.atanh(arg))
-                values.append(a)
-            except (ValueError, OverflowError):
-                values.append(1.0)
+SCALE_CLASSES = {
+    1: IntegerScale,
+    2: BalancedScale,
+    3: PowerScale,
+    4: MaZhengScale,
+    5: DoneganScale,
+}
 
-        return values
+# One shared instance per (scale_type, gradations)
+_SCALES = {
+    (scale_type, gradations): scale_class(gradations)
+    for scale_type, scale_class in SCALE_CLASSES.items()
+    for gradations in range(3, 10)
+}
 
 
 def get_scale(scale_type, gradations=9):
     """
-    Factory function to get appropriate scale instance.
+    Get the shared scale instance for a scale type.
 
     Args:
         scale_type: Integer 1-5 representing scale type
         gradations: Number of gradations (3-9)
 
     Returns:
-        Scale instance
+        Scale instance (cached and read-only; do not modify)
     """
-    scale_classes = {
-        1: IntegerScale,
-        2: BalancedScale,
-        3: PowerScale,
-        4: MaZhengScale,
-        5: DoneganScale,
-    }
+    if scale_type not in SCALE_CLASSES:
+        scale_type = 1
+    return _SCALES[scale_type, min(max(gradations, 3), 9)]
 
-    scale_class = scale_classes.get(scale_type, IntegerScale)
-    return scale_class(gradations)
 
+# Largest number of grade positions a scale string can hold
+MAX_GRADE_POSITIONS = 9
 
-def integer_by_scale(grade, scale_type):
-    """
-    Transform a grade (1-9) using the specified scale type.
+# Relative tolerance for recognizing a stored value as a grade of its scale
+GRADE_MATCH_TOLERANCE = 1e-6
 
-    Args:
-        grade: Grade value (1-9)
-        scale_type: Scale type (1-5)
+# Log judgment values of every (scale_type, gradations, grade); unused entries are NaN
+with np.errstate(invalid='ignore'):
+    LOG_JUDGMENT_TABLE = np.log(JUDGMENT_VALUES)
+LOG_JUDGMENT_TABLE.setflags(write=False)
 
-    Returns:
-        Transformed value
-    """
-    grade = max(1, min(9, grade))  # Clamp to 1-9
 
-    if scale_type == 1:  # Integer
-        return float(grade)
-
-    elif scale_type == 2:  # Balanced
-        w = 0.5 + (grade - 1) * 0.05
-        if w < 1:
-            return w / (1 - w)
-        return 9.0
-
-    elif scale_type == 3:  # Power
-        return math.pow(9, (grade - 1) / 8)
+def convert_log_judgments(log_values, scale_types, gradations, target_scale_type,
+                          return_matched=False):
+    """
+    Re-express log judgments made on various scales on a common scale.
 
-    elif scale_type == 4:  # Ma-Zheng
-        return 9 / (9 + 1 - grade)
+    Each value is matched to its grade position in the lookup table row
+    of its own (scale_type, gradations) and replaced by the value of the
+    same position on the target scale. Values that do not correspond to a
+    grade of their scale are left unchanged.
 
-    elif scale_type == 5:  # Donegan
-        try:
-            arg = (grade - 1) / 14 * math.sqrt(3)
-            arg = min(max(arg, -0.999), 0.999)
-            return math.exp(math.atanh(arg))
-        except (ValueError, OverflowError):
-            return 1.0
+    Args:
+        log_values: Array of log comparison values (sign gives direction)
+        scale_types: Array of scale types the values were made on
+        gradations: Array of grade positions of the scale string used
+        target_scale_type: Common scale type (1-5)
+        return_matched: Also return which values were matched to a grade
 
-    return float(grade)
+    Returns:
+        numpy.ndarray: Log values on the target scale, or a tuple of
+        (log values, boolean matched mask) with return_matched
+    """
+    log_values = np.asarray(log_values, dtype=float)
+    scale_types = np.asarray(scale_types, dtype=int)
+    gradations = np.asarray(gradations, dtype=int)
+
+    known = (
+        np.isin(scale_types, SCALE_TYPES)
+        & (gradations >= 1) & (gradations <= MAX_GRADE_POSITIONS)
+    )
+    scale_types = np.where(known, scale_types, SCALE_TYPES[0])
+    gradations = np.where(known, gradations, 1)
+
+    # One gather of every row's candidate grade values, then nearest grade
+    magnitudes = np.abs(log_values)
+    candidates = LOG_JUDGMENT_TABLE[scale_types, gradations]
+    distances = np.abs(np.nan_to_num(candidates, nan=np.inf) - magnitudes[:, None])
+    grades = distances.argmin(axis=1)
+    matched = known & (
+        distances[np.arange(grades.size), grades] <= GRADE_MATCH_TOLERANCE * np.maximum(magnitudes, 1.0)
+    )
+
+    converted = np.sign(log_values) * LOG_JUDGMENT_TABLE[target_scale_type, gradations, grades]
+    converted = np.where(matched, converted, log_values)
+
+    if return_matched:
+        return converted, matched
+    return converted
 
 
 def get_progressive_labels(gradations):
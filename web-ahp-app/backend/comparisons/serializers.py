@@ -3,6 +3,7 @@ Serializers for REST API.
 """
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from .compact import pack_comparisons, pack_matrix, round_floats
 from .models import Project, Comparison, Result, Friendship, Message
 
 
@@ -80,15 +81,66 @@ class ProjectSerializer(serializers.ModelSerializer):
         model = Project
         fields = [
             'id', 'title', 'description', 'alternatives',
-            'scale_type', 'status', 'is_collaborative', 'comparisons', 'result',
-            'user', 'created_at', 'updated_at'
+            'scale_type', 'status', 'is_collaborative', 'group_weights',
+            'comparisons', 'result', 'user', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'user', 'created_at', 'updated_at']
 
+    def validate_group_weights(self, value):
+        if not isinstance(value, dict):
+            raise serializers.ValidationError("Expected an object of group label to weight")
+        for label, weight in value.items():
+            if not isinstance(weight, (int, float)) or isinstance(weight, bool) or weight < 0:
+                raise serializers.ValidationError(f"Weight of group '{label}' must be a non-negative number")
+        return value
+
+
+class ShapedProjectSerializer(ProjectSerializer):
+    """
+    ProjectSerializer shaped by ResponseOptions (see compact.py).
+
+    Fields outside the sparse fieldset are dropped before serialization, so
+    they are never computed; with compact, comparisons and the result
+    matrix are packed into upper triangles.
+    """
+
+    def __init__(self, *args, options=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.options = options
+
+        if options.fields is not None:
+            for name in set(self.fields) - options.fields:
+                self.fields.pop(name)
+
+        if options.compact:
+            for name in ('comparisons', 'result'):
+                if name in self.fields:
+                    self.fields[name] = serializers.SerializerMethodField(
+                        method_name=f'get_packed_{name}'
+                    )
+
+    def get_packed_comparisons(self, obj):
+        return pack_comparisons(
+            len(obj.alternatives),
+            list(obj.comparisons.values_list('user_id', 'index_a', 'index_b', 'value'))
+        )
+
+    def get_packed_result(self, obj):
+        try:
+            result = obj.result
+        except Result.DoesNotExist:
+            return None
+        data = ResultSerializer(result).data
+        data['matrix'] = pack_matrix(result.matrix)
+        return data
+
+    def to_representation(self, instance):
+        return round_floats(dict(super().to_representation(instance)), self.options.precision)
+
 
 class ProjectListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for project list."""
-    comparison_count = serializers.SerializerMethodField()
+    comparison_count = serializers.IntegerField(read_only=True)
     total_comparisons = serializers.SerializerMethodField()
 
     class Meta:
@@ -101,9 +153,6 @@ class ProjectListSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
-    def get_comparison_count(self, obj):
-        return obj.comparisons.count()
-
     def get_total_comparisons(self, obj):
         n = len(obj.alternatives)
         return n * (n - 1) // 2 if n > 1 else 0
@@ -131,3 +180,77 @@ class MessageSerializer(serializers.ModelSerializer):
         fields = ["id", "sender", "recipient", "content", "is_read", "created_at"]
         read_only_fields = ["id", "created_at"]
 
+
+
+class ValuesSerializer:
+    """
+    values()-based equivalent of a read-only ModelSerializer.
+
+    Builds the same dictionaries as the serializer it mirrors from one
+    values() query: no model instance or field binding per row, and nested
+    users (including the profile avatar) are joined instead of loaded per
+    row. Used on hot read endpoints; keep the field lists in step with the
+    mirrored serializer.
+    """
+    user_fields = ['id', 'username', 'email', 'first_name', 'last_name']
+    datetime_fields = {'created_at', 'updated_at'}
+
+    def __init__(self, fields, users=(), computed=None):
+        """
+        Args:
+            fields: Field names in the order of the mirrored serializer
+            users: Fields that are foreign keys rendered with UserSerializer
+            computed: Function of the values() row for each method field
+        """
+        self.fields = fields
+        self.users = set(users)
+        self.computed = computed or {}
+        self.columns = [
+            name for name in fields if name not in self.users and name not in self.computed
+        ]
+        for prefix in users:
+            self.columns += [f'{prefix}__{name}' for name in self.user_fields]
+            self.columns.append(f'{prefix}__profile__avatar_url')
+        self.datetime = serializers.DateTimeField()
+
+    def values(self, queryset):
+        """The queryset as values() rows, e.g. to paginate before represent()."""
+        return queryset.values(*self.columns)
+
+    def represent_user(self, row, prefix):
+        user = {name: row[f'{prefix}__{name}'] for name in self.user_fields}
+        user['avatar_url'] = row[f'{prefix}__profile__avatar_url'] or None
+        return user
+
+    def represent(self, row):
+        data = {}
+        for name in self.fields:
+            if name in self.users:
+                data[name] = self.represent_user(row, name)
+            elif name in self.computed:
+                data[name] = self.computed[name](row)
+            elif name in self.datetime_fields:
+                data[name] = self.datetime.to_representation(row[name])
+            else:
+                data[name] = row[name]
+        return data
+
+    def serialize(self, queryset):
+        return [self.represent(row) for row in self.values(queryset)]
+
+
+def total_comparisons(row):
+    n = len(row['alternatives'])
+    return n * (n - 1) // 2 if n > 1 else 0
+
+
+comparison_values = ValuesSerializer(ComparisonSerializer.Meta.fields)
+
+project_list_values = ValuesSerializer(
+    ProjectListSerializer.Meta.fields,
+    computed={'total_comparisons': total_comparisons},
+)
+
+friendship_values = ValuesSerializer(FriendshipSerializer.Meta.fields, users=['user', 'friend'])
+
+message_values = ValuesSerializer(MessageSerializer.Meta.fields, users=['sender', 'recipient'])
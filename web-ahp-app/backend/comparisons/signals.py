@@ -1,10 +1,15 @@
 """
-Signals for automatic model creation.
+Signals for automatic model creation, progress counters, project events
+and user notifications.
 """
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import User
-from .models import UserProfile
+from .counters import add_comparisons, move_expert
+from .events import publish_project_event, publish_user_event
+from .models import (
+    AggregatedResult, Comparison, Friendship, Message, Project, ProjectCollaborator, UserProfile
+)
 
 
 @receiver(post_save, sender=User)
@@ -21,3 +26,90 @@ def save_user_profile(sender, instance, **kwargs):
         instance.profile.save()
     else:
         UserProfile.objects.create(user=instance)
+
+
+@receiver(post_save, sender=Comparison)
+def count_created_comparison(sender, instance, created, **kwargs):
+    """Count a new comparison for its project and expert."""
+    if created:
+        add_comparisons(instance.project_id, instance.user_id, 1)
+        publish_project_event(instance.project_id, 'progress', user_id=instance.user_id, added=1)
+
+
+@receiver(post_delete, sender=Comparison)
+def count_deleted_comparison(sender, instance, origin=None, **kwargs):
+    """Uncount a deleted comparison, unless its whole project is being deleted."""
+    if not isinstance(origin, Project):
+        add_comparisons(instance.project_id, instance.user_id, -1)
+        publish_project_event(instance.project_id, 'progress', user_id=instance.user_id, added=-1)
+
+
+@receiver(post_save, sender=ProjectCollaborator)
+def count_collaborator_status(sender, instance, created, **kwargs):
+    """Move a collaborator between the project's expert counters on status change."""
+    old_status = None if created else getattr(instance, '_stored_status', instance.status)
+    move_expert(instance.project_id, old_status, instance.status)
+    instance._stored_status = instance.status
+
+    if old_status != instance.status:
+        publish_project_event(instance.project_id, 'status',
+                              user_id=instance.user_id, status=instance.status)
+        if 'invited' in (old_status, instance.status):
+            publish_user_event(instance.user_id, 'invitation', collaboration_id=instance.id,
+                               project_id=instance.project_id, status=instance.status)
+
+
+@receiver(post_delete, sender=ProjectCollaborator)
+def count_removed_collaborator(sender, instance, origin=None, **kwargs):
+    """Uncount a removed collaborator, unless its whole project is being deleted."""
+    if not isinstance(origin, Project):
+        move_expert(instance.project_id, instance.status, None)
+        publish_project_event(instance.project_id, 'status', user_id=instance.user_id, status=None)
+    if instance.status == 'invited':
+        publish_user_event(instance.user_id, 'invitation', collaboration_id=instance.id,
+                           project_id=instance.project_id, status=None)
+
+
+@receiver(post_save, sender=AggregatedResult)
+def announce_aggregated_result(sender, instance, created, **kwargs):
+    """Tell the project's open streams that new aggregated results are available."""
+    if created:
+        publish_project_event(instance.project_id, 'aggregation',
+                              result_id=instance.id, method=instance.aggregation_method)
+
+
+@receiver(post_delete, sender=AggregatedResult)
+def announce_removed_aggregated_result(sender, instance, origin=None, **kwargs):
+    """Tell the project's open streams that aggregated results were invalidated."""
+    if not isinstance(origin, Project):
+        publish_project_event(instance.project_id, 'aggregation',
+                              result_id=instance.id, method=instance.aggregation_method, deleted=True)
+
+
+@receiver(post_save, sender=Friendship)
+def notify_friend_request(sender, instance, created, **kwargs):
+    """Notify the recipient of a new friend request, and the sender of its acceptance."""
+    if created:
+        publish_user_event(instance.friend_id, 'friend_request', friendship_id=instance.id,
+                           other_user_id=instance.user_id, status=instance.status)
+    elif instance.status == 'accepted':
+        publish_user_event(instance.user_id, 'friend_request', friendship_id=instance.id,
+                           other_user_id=instance.friend_id, status=instance.status)
+
+
+@receiver(post_delete, sender=Friendship)
+def notify_removed_friend_request(sender, instance, **kwargs):
+    """Notify both users that a pending friend request is gone."""
+    if instance.status == 'pending':
+        for user_id, other_id in ((instance.friend_id, instance.user_id),
+                                  (instance.user_id, instance.friend_id)):
+            publish_user_event(user_id, 'friend_request', friendship_id=instance.id,
+                               other_user_id=other_id, status=None)
+
+
+@receiver(post_save, sender=Message)
+def notify_message(sender, instance, created, **kwargs):
+    """Notify the recipient of a new message."""
+    if created:
+        publish_user_event(instance.recipient_id, 'message', message_id=instance.id,
+                           sender_id=instance.sender_id)
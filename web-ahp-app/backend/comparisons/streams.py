@@ -0,0 +1,118 @@
+"""
+Server-Sent Events streams of project events and user notifications
+(see events.py).
+
+Streams are async views and need an ASGI server (ahp_project.asgi);
+under WSGI they answer 501 and clients keep polling. EventSource cannot send
+headers, so the JWT access token is passed as the `token` query parameter.
+
+Streams end after EVENT_STREAM_TIMEOUT seconds and the browser reconnects,
+which bounds the lifetime of streams whose client went away unnoticed.
+"""
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+
+from .events import get_event_broker, project_channel, user_channel
+from .models import Project
+
+# Delay before the browser reconnects a closed stream, in milliseconds
+RECONNECT_DELAY = 3000
+
+
+def stream_user(request):
+    """The user of the access token in the query string or header, else None."""
+    authentication = JWTAuthentication()
+    raw_token = request.GET.get('token')
+    if raw_token is None:
+        header = authentication.get_header(request)
+        raw_token = header and authentication.get_raw_token(header)
+    if not raw_token:
+        return None
+
+    try:
+        return authentication.get_user(authentication.get_validated_token(raw_token))
+    except (InvalidToken, AuthenticationFailed):
+        return None
+
+
+def can_view_project(user, project_id: int) -> bool:
+    """Whether the user owns or collaborates on the project (as ProjectViewSet)."""
+    return Project.objects.filter(
+        Q(user=user) |
+        Q(collaborators__user=user,
+          collaborators__status__in=['invited', 'active', 'completed']),
+        id=project_id
+    ).exists()
+
+
+def format_event(event) -> str:
+    return f"data: {json.dumps(event, cls=DjangoJSONEncoder)}\n\n"
+
+
+async def event_stream(channel: str):
+    """Yield the channel's events as SSE messages, with keepalive comments."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.EVENT_STREAM_TIMEOUT
+    subscription = get_event_broker().subscribe(channel)
+    try:
+        yield f"retry: {RECONNECT_DELAY}\n: connected\n\n"
+        while (remaining := deadline - loop.time()) > 0:
+            event = await subscription.get(min(settings.EVENT_STREAM_KEEPALIVE, remaining))
+            yield ": keepalive\n\n" if event is None else format_event(event)
+    finally:
+        subscription.close()
+
+
+def stream_response(channel: str) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(event_stream(channel), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Keep reverse proxies from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+async def authenticate_stream(request):
+    """
+    Check that a stream can be served and authenticate its user.
+
+    Returns:
+        Tuple of (user, None), or (None, error JsonResponse)
+    """
+    if not isinstance(request, ASGIRequest):
+        return None, JsonResponse({'error': 'Event streams require an ASGI server'}, status=501)
+
+    user = await sync_to_async(stream_user)(request)
+    if user is None:
+        return None, JsonResponse(
+            {'error': 'Authentication credentials were not provided or are invalid'}, status=401
+        )
+    return user, None
+
+
+async def project_events(request, pk):
+    """Stream status, progress and aggregation events of a project."""
+    user, error = await authenticate_stream(request)
+    if error is not None:
+        return error
+    if not await sync_to_async(can_view_project)(user, pk):
+        return JsonResponse({'error': 'Not found'}, status=404)
+
+    return stream_response(project_channel(pk))
+
+
+async def notification_events(request):
+    """Stream invitation, friend request and message notifications of the user."""
+    user, error = await authenticate_stream(request)
+    if error is not None:
+        return error
+
+    return stream_response(user_channel(user.id))
@@ -0,0 +1,403 @@
+"""
+Tests for the comparisons app.
+"""
+from unittest import mock
+
+import numpy as np
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from .aggregation import aggregate_comparisons
+from .group_calculations import (
+    aggregate_log_matrices, aggregate_log_tensor, build_judgment_mask, build_log_tensor,
+    fill_missing_judgments, pair_coverage
+)
+from .models import (
+    Comparison, Friendship, Message, Project, ProjectCollaborator, Result, UserProfile
+)
+from .serializers import (
+    ComparisonSerializer, FriendshipSerializer, MessageSerializer, ProjectListSerializer,
+    comparison_values, friendship_values, message_values, project_list_values
+)
+
+
+class ValuesSerializerTests(TestCase):
+    """The values() fast paths render the same JSON bytes as the serializers they mirror."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = User.objects.create_user(
+            'alice', 'alice@example.com', 'password123', first_name='Alice', last_name='Ärber'
+        )
+        cls.bob = User.objects.create_user('bob', password='password123')
+        cls.carol = User.objects.create_user('carol', 'carol@example.com', 'password123')
+
+        # Avatar, empty avatar, no profile at all
+        UserProfile.objects.filter(user=cls.alice).update(avatar_url='https://example.com/alice.png')
+        UserProfile.objects.filter(user=cls.bob).update(avatar_url='')
+        UserProfile.objects.filter(user=cls.carol).delete()
+
+        cls.project = Project.objects.create(
+            user=cls.alice, title='Laptops', description='Which laptop to buy',
+            alternatives=['A', 'B', 'C', 'D'], scale_type=3, is_collaborative=True,
+            status='comparison'
+        )
+        for index_a, index_b, value, direction in [(0, 1, 3.0, 'more'), (0, 2, 1 / 7, 'less'), (2, 3, 1.0, 'more')]:
+            Comparison.objects.create(
+                project=cls.project, user=cls.alice, index_a=index_a, index_b=index_b,
+                value=value, direction=direction, reliability=2.5, scale_str='2579',
+                scale_type=3, gradations=4, refinement_level=2
+            )
+        # No comparisons, no or a single alternative
+        Project.objects.create(user=cls.bob, title='Empty', alternatives=[])
+        Project.objects.create(user=cls.carol, title='Single', description='', alternatives=['Only'])
+
+        Friendship.objects.create(user=cls.alice, friend=cls.bob, status='accepted')
+        Friendship.objects.create(user=cls.carol, friend=cls.alice)
+        Friendship.objects.create(user=cls.bob, friend=cls.carol, status='declined')
+
+        Message.objects.create(sender=cls.bob, recipient=cls.alice, content='Hi Alice')
+        Message.objects.create(sender=cls.alice, recipient=cls.carol, content='Grüße 👋', is_read=True)
+        Message.objects.create(sender=cls.carol, recipient=cls.bob, content='')
+
+    def assertSameJSON(self, expected, actual):
+        self.assertEqual(JSONRenderer().render(expected), JSONRenderer().render(actual))
+
+    def test_comparisons(self):
+        comparisons = Comparison.objects.filter(project=self.project)
+        self.assertEqual(len(comparisons), 3)
+        self.assertSameJSON(
+            ComparisonSerializer(comparisons, many=True).data, comparison_values.serialize(comparisons)
+        )
+
+    def test_project_list(self):
+        projects = Project.objects.all()
+        self.assertEqual(len(projects), 3)
+        self.assertSameJSON(
+            ProjectListSerializer(projects, many=True).data, project_list_values.serialize(projects)
+        )
+
+    def test_friendships(self):
+        friendships = Friendship.objects.all()
+        self.assertEqual(len(friendships), 3)
+        self.assertSameJSON(
+            FriendshipSerializer(friendships, many=True).data, friendship_values.serialize(friendships)
+        )
+
+    def test_messages(self):
+        messages = Message.objects.all()
+        self.assertEqual(len(messages), 3)
+        self.assertSameJSON(
+            MessageSerializer(messages, many=True).data, message_values.serialize(messages)
+        )
+
+    def test_empty_querysets(self):
+        self.assertSameJSON(
+            ComparisonSerializer(Comparison.objects.none(), many=True).data,
+            comparison_values.serialize(Comparison.objects.none())
+        )
+
+    def test_null_timestamps(self):
+        cases = [
+            (ComparisonSerializer, comparison_values, Comparison.objects.filter(project=self.project)),
+            (ProjectListSerializer, project_list_values, Project.objects.all()),
+            (FriendshipSerializer, friendship_values, Friendship.objects.all()),
+            (MessageSerializer, message_values, Message.objects.all()),
+        ]
+        for serializer_class, values, queryset in cases:
+            with self.subTest(serializer=serializer_class.__name__):
+                instance = queryset.first()
+                row = values.values(queryset.filter(pk=instance.pk)).get()
+                for name in values.datetime_fields & set(values.fields):
+                    setattr(instance, name, None)
+                    row[name] = None
+
+                self.assertSameJSON(serializer_class(instance).data, values.represent(row))
+
+
+class QueryCountMixin:
+    """
+    Pins the query count of an endpoint: it runs the same number of queries
+    with a few and with many related rows, so per-row queries cannot creep
+    back in.
+    """
+    sizes = (2, 20)
+    num_queries = None
+
+    def create_fixture(self, size):
+        """
+        Create a fixture with size related rows.
+
+        Returns:
+            Tuple of (user to authenticate, URL to get)
+        """
+        raise NotImplementedError
+
+    def create_user(self, name):
+        user = User.objects.create_user(name, f'{name}@example.com')
+        UserProfile.objects.filter(user=user).update(avatar_url=f'https://example.com/{name}.png')
+        return user
+
+    def test_query_count_independent_of_rows(self):
+        for size in self.sizes:
+            user, url = self.create_fixture(size)
+            self.client.force_authenticate(user)
+            with self.subTest(size=size):
+                with self.assertNumQueries(self.num_queries):
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+
+
+def create_collaborative_project(owner, experts, alternatives=4):
+    """Project of owner in which every expert has completed all comparisons."""
+    project = Project.objects.create(
+        user=owner, title='Panel', alternatives=[f'A{i}' for i in range(alternatives)],
+        is_collaborative=True
+    )
+    for number, expert in enumerate(experts):
+        ProjectCollaborator.objects.create(project=project, user=expert, status='completed')
+        Comparison.objects.bulk_create(
+            Comparison(
+                project=project, user=expert, index_a=index_a, index_b=index_b,
+                value=float(1 + (index_a + index_b + number) % 5), direction='more'
+            )
+            for index_a in range(alternatives) for index_b in range(index_a + 1, alternatives)
+        )
+    return project
+
+
+class ProjectListQueryTests(QueryCountMixin, APITestCase):
+    # Page count, page
+    num_queries = 2
+
+    def create_fixture(self, size):
+        user = self.create_user(f'list{size}')
+        other = self.create_user(f'list{size}-owner')
+        for number in range(size):
+            owner = user if number % 2 else other
+            project = Project.objects.create(user=owner, title=f'Project {number}', alternatives=['A', 'B'])
+            if owner is other:
+                ProjectCollaborator.objects.create(project=project, user=user, status='active')
+        return user, '/api/projects/'
+
+
+class ProjectDetailQueryTests(QueryCountMixin, APITestCase):
+    # ETag version, project with owner, profile and result, comparisons
+    num_queries = 3
+
+    def create_fixture(self, size):
+        user = self.create_user(f'detail{size}')
+        project = Project.objects.create(
+            user=user, title='Detail', alternatives=[f'A{i}' for i in range(size + 1)]
+        )
+        Comparison.objects.bulk_create(
+            Comparison(project=project, index_a=0, index_b=index_b, value=2.0, direction='more')
+            for index_b in range(1, size + 1)
+        )
+        Result.objects.create(
+            project=project, matrix=[[1.0]], weights=[1.0], rankings=[0], lambda_max=1.0,
+            consistency_index=0.0, consistency_ratio=0.0, is_consistent=True, recommendations=[]
+        )
+        return user, f'/api/projects/{project.id}/'
+
+
+class CollaboratorsQueryTests(QueryCountMixin, APITestCase):
+    # ETag version, project, collaborators with their users
+    num_queries = 3
+
+    def create_fixture(self, size):
+        owner = self.create_user(f'collab{size}')
+        experts = [self.create_user(f'collab{size}-{number}') for number in range(size)]
+        project = create_collaborative_project(owner, experts)
+        return owner, f'/api/projects/{project.id}/collaborators/'
+
+
+class AggregatedResultsQueryTests(QueryCountMixin, APITestCase):
+    # ETag version, project, latest result, collaborators with their users, comparisons
+    num_queries = 5
+
+    def create_fixture(self, size):
+        owner = self.create_user(f'aggregated{size}')
+        experts = [self.create_user(f'aggregated{size}-{number}') for number in range(size)]
+        project = create_collaborative_project(owner, experts)
+        self.client.force_authenticate(owner)
+        response = self.client.post(f'/api/projects/{project.id}/aggregate/', {}, format='json')
+        self.assertEqual(response.status_code, 200)
+        return owner, f'/api/projects/{project.id}/aggregated_results/'
+
+
+class FriendsQueryTests(QueryCountMixin, APITestCase):
+    # Friendships with both users and their profiles
+    num_queries = 1
+
+    def create_fixture(self, size):
+        user = self.create_user(f'friends{size}')
+        for number in range(size):
+            friend = self.create_user(f'friends{size}-{number}')
+            if number % 2:
+                Friendship.objects.create(user=user, friend=friend, status='accepted')
+            else:
+                Friendship.objects.create(user=friend, friend=user, status='accepted')
+        return user, '/api/friends/'
+
+
+class FriendRequestsQueryTests(QueryCountMixin, APITestCase):
+    # Friendships with both users and their profiles
+    num_queries = 1
+
+    def create_fixture(self, size):
+        user = self.create_user(f'requests{size}')
+        for number in range(size):
+            Friendship.objects.create(user=self.create_user(f'requests{size}-{number}'), friend=user)
+        return user, '/api/friends/requests/'
+
+
+class MessagesQueryTests(QueryCountMixin, APITestCase):
+    # Other user, marking as read, messages with both users and their profiles
+    num_queries = 3
+
+    def create_fixture(self, size):
+        user = self.create_user(f'messages{size}')
+        other = self.create_user(f'messages{size}-other')
+        for number in range(size):
+            sender, recipient = (user, other) if number % 2 else (other, user)
+            Message.objects.create(sender=sender, recipient=recipient, content=f'Message {number}')
+        return user, f'/api/messages/{other.id}/'
+
+
+class ProjectStatusEventTests(TestCase):
+    """Status events of a project have one payload shape, whatever the change."""
+
+    def setUp(self):
+        self.owner = User.objects.create_user('owner')
+        self.expert = User.objects.create_user('expert')
+        self.project = Project.objects.create(user=self.owner, title='Events', is_collaborative=True)
+
+    def status_events(self, publish):
+        return [call.kwargs for call in publish.call_args_list if call.args[1] == 'status']
+
+    def test_status_change_and_removal(self):
+        with mock.patch('comparisons.signals.publish_project_event') as publish:
+            collaborator = ProjectCollaborator.objects.create(project=self.project, user=self.expert)
+            collaborator.status = 'active'
+            collaborator.save()
+            collaborator.delete()
+
+        self.assertEqual(self.status_events(publish), [
+            {'user_id': self.expert.id, 'status': 'invited'},
+            {'user_id': self.expert.id, 'status': 'active'},
+            {'user_id': self.expert.id, 'status': None},
+        ])
+
+
+class MaskedAggregationTests(SimpleTestCase):
+    """Partial panels are averaged per pair over the experts who judged it."""
+
+    def setUp(self):
+        # Expert 0 judged (0, 1) = 2 and (0, 2) = 4, expert 1 (0, 1) = 8,
+        # expert 2 (0, 2) = 9; nobody judged (1, 2)
+        positions, index_a, index_b = [0, 0, 1, 2], [0, 0, 0, 0], [1, 2, 1, 2]
+        self.log_tensor = build_log_tensor(3, 3, positions, index_a, index_b, np.log([2, 4, 8, 9]))
+        self.mask = build_judgment_mask(3, 3, positions, index_a, index_b)
+
+    def test_geometric_mean_over_judging_experts(self):
+        # a01 = √(2·8) = 4, a02 = √(4·9) = 6, a12 uncovered stays 1
+        np.testing.assert_allclose(
+            aggregate_log_tensor(self.log_tensor, mask=self.mask),
+            [[1, 4, 6], [1 / 4, 1, 1], [1 / 6, 1, 1]]
+        )
+
+    def test_weighted_mean_renormalizes_per_pair(self):
+        log_matrix, covered = aggregate_log_matrices(self.log_tensor, [2, 1, 1], self.mask)
+
+        # Weights 1/2, 1/4, 1/4: a01 = 2^(2/3) · 8^(1/3) = 2^(5/3), a02 = 4^(2/3) · 9^(1/3)
+        np.testing.assert_allclose(
+            np.exp(log_matrix[0, 1:]), [2 ** (5 / 3), 4 ** (2 / 3) * 9 ** (1 / 3)]
+        )
+        np.testing.assert_array_equal(covered, [[False, True, True], [True, False, False], [True, False, False]])
+
+    def test_pair_coverage(self):
+        coverage = pair_coverage(self.mask)
+
+        self.assertEqual(coverage['counts'], [[0, 2, 2], [2, 0, 0], [2, 0, 0]])
+        self.assertEqual((coverage['min'], coverage['max']), (0, 2))
+        self.assertAlmostEqual(coverage['coverage_ratio'], 4 / 9)
+        self.assertEqual(coverage['uncovered_pairs'], [[1, 2]])
+
+    def test_fill_missing_judgments(self):
+        group_matrix = aggregate_log_tensor(self.log_tensor, mask=self.mask)
+        filled = fill_missing_judgments(self.log_tensor, self.mask, group_matrix)
+
+        # Expert 1 keeps its own a01 and takes the group's a02
+        np.testing.assert_allclose(np.exp(filled[1, 0]), [1, 8, 6])
+        np.testing.assert_allclose(np.exp(filled[1, 2]), [1 / 6, 1, 1])
+
+
+class RobustPartialAggregationTests(TestCase):
+    """Excluding an outlier in a partial panel leaves no trace of their judgments."""
+
+    # Consistent judgments w_i / w_j, scaled by an expert's small bias
+    priorities = [0.4, 0.3, 0.2, 0.1]
+    biases = [1.0, 1.1, 0.9, 1.2, 0.85]
+
+    @classmethod
+    def setUpTestData(cls):
+        owner = User.objects.create_user('owner')
+        cls.project = Project.objects.create(
+            user=owner, title='Robust', alternatives=['A', 'B', 'C', 'D'], is_collaborative=True
+        )
+        pairs = [(i, j) for i in range(4) for j in range(i + 1, 4)]
+
+        for number, bias in enumerate(cls.biases):
+            # The last expert has judged only half of the pairs so far
+            status, judged = ('active', pairs[::2]) if number == len(cls.biases) - 1 else ('completed', pairs)
+            cls.add_expert(f'expert{number}', status, {
+                (i, j): cls.priorities[i] / cls.priorities[j] * bias for i, j in judged
+            })
+
+        # Reverses every judgment of the panel as strongly as the scale allows
+        cls.outlier = cls.add_expert('outlier', 'completed', {pair: 1 / 9 for pair in pairs})
+
+    @classmethod
+    def add_expert(cls, username, status, judgments):
+        expert = User.objects.create_user(username)
+        ProjectCollaborator.objects.create(project=cls.project, user=expert, status=status)
+        Comparison.objects.bulk_create(
+            Comparison(
+                project=cls.project, user=expert, index_a=i, index_b=j,
+                value=value, direction='more' if value >= 1 else 'less'
+            )
+            for (i, j), value in judgments.items()
+        )
+        return expert
+
+    def assertSameAggregation(self, expected, actual):
+        self.assertEqual(expected['expert_ids'], actual['expert_ids'])
+        for key in ('aggregated_matrix', 'weights', 'expert_weights'):
+            with self.subTest(key=key):
+                np.testing.assert_allclose(actual[key], expected[key])
+        for key in ('gci', 'distance_matrix', 'consensus_score'):
+            with self.subTest(key=key):
+                np.testing.assert_allclose(actual['consensus'][key], expected['consensus'][key])
+        self.assertEqual(actual['coverage'], expected['coverage'])
+
+    def test_robust_run_equals_run_without_outlier(self):
+        for weighting in ('equal', 'gci', 'cr'):
+            with self.subTest(weighting=weighting):
+                robust = aggregate_comparisons(
+                    self.project.id, weighting=weighting, robust=True, include_partial=True
+                )
+                self.assertEqual(robust['outliers']['excluded'], [self.outlier.id])
+
+                with transaction.atomic():
+                    ProjectCollaborator.objects.filter(project=self.project, user=self.outlier).delete()
+                    without = aggregate_comparisons(
+                        self.project.id, weighting=weighting, include_partial=True
+                    )
+                    transaction.set_rollback(True)
+
+                self.assertEqual(without['outliers']['excluded'], [])
+                self.assertSameAggregation(without, robust)
@@ -1,7 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from rest_framework_simplejwt.views import TokenRefreshView
-from . import views
+from . import streams, views
 
 router = DefaultRouter()
 router.register(r"projects", views.ProjectViewSet, basename="project")
@@ -32,6 +32,16 @@ urlpatterns = [
     path("messages/<int:user_id>/send/", views.send_message, name="send_message"),
     path("messages/unread/", views.get_unread_count, name="get_unread_count"),
 
+    # Notifications
+    path("notifications/snapshot/", views.notifications_snapshot, name="notifications_snapshot"),
+    path("notifications/events/", streams.notification_events, name="notification_events"),
+
+    # Compute pool
+    path("compute/metrics/", views.compute_metrics, name="compute_metrics"),
+
+    # Server-Sent Events (ASGI only)
+    path("projects/<int:pk>/events/", streams.project_events, name="project_events"),
+
     # ViewSets
     path("", include(router.urls)),
 ]
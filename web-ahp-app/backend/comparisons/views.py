@@ -4,26 +4,102 @@ API views for pairwise comparison application.
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate
-from django.db.models import Q
+from django.db.models import OuterRef, Q, Subquery
+from django.http import Http404
+from django.utils.http import parse_etags
+from functools import wraps
+import hashlib
 import numpy as np
 
-from .models import Project, Comparison, Result, ProjectCollaborator, AggregatedResult, UserProfile
+from .models import (
+    Project, Comparison, Result, ProjectCollaborator, AggregatedResult, UserProfile, Feedback
+)
 from .serializers import (
-    ProjectSerializer, ProjectListSerializer,
+    ProjectSerializer, ProjectListSerializer, ShapedProjectSerializer,
     ComparisonSerializer, ResultSerializer,
-    UserSerializer, UserRegistrationSerializer
+    UserSerializer, UserRegistrationSerializer,
+    comparison_values, project_list_values
 )
-from .calculations import (
-    build_comparison_matrix,
-    calculate_weights_eigenvector,
-    check_consistency,
-    calculate_rankings
+from .calculations import solve_comparisons
+from .compute import ComputeBusy, ComputeTimeout, dispatch
+from .compute_client import ComputeServiceError
+from . import compute
+from .compact import pack_matrix, response_options, shape
+from .counters import count_rows
+from .renderers import wants_arrays
+from .events import publish_user_event
+from .aggregation import (
+    aggregate_comparisons_aij, analyze_outliers, calculate_individual_results,
+    individual_result_arrays,
+    cluster_expert_opinions,
+    consensus_round_status, open_consensus_round, rescale_project,
+    save_aggregated_result, save_comparisons
 )
-from .aggregation import aggregate_comparisons_aij, save_aggregated_result
+
+
+def parse_flag(value):
+    """Interpret a boolean request parameter sent as JSON or as a query string."""
+    return str(value).lower() in ('true', '1', 'yes')
+
+
+def compute_unavailable(error):
+    """Response for a job the compute pool could not take or finish in time."""
+    return Response(
+        {'error': str(error)},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={'Retry-After': '5'}
+    )
+
+
+def latest_update(queryset):
+    """Subquery of the latest updated_at of a correlated queryset."""
+    return Subquery(queryset.order_by('-updated_at').values('updated_at')[:1])
+
+
+def etag_for(request, version):
+    """
+    Weak ETag of a response version.
+
+    The user, the negotiated format and the query parameters are part of
+    the tag, since they change the body of the same version.
+    """
+    key = repr((version, request.user.id, request.accepted_media_type,
+                sorted(request.query_params.lists())))
+    return f'W/"{hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()}"'
+
+
+def conditional(version_method):
+    """
+    Answer If-None-Match with 304 Not Modified before running a read action.
+
+    Args:
+        version_method: Name of the viewset method returning the version of
+            the requested body; it must be one cheap query, as it replaces
+            the action's work on unchanged polls
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(self, request, *args, **kwargs):
+            etag = etag_for(request, getattr(self, version_method)(request))
+            headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+
+            client_etags = parse_etags(request.headers.get('If-None-Match', ''))
+            if '*' in client_etags or etag.removeprefix('W/') in (
+                tag.removeprefix('W/') for tag in client_etags
+            ):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+            response = view(self, request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                for header, value in headers.items():
+                    response[header] = value
+            return response
+        return wrapper
+    return decorator
 
 
 @api_view(['POST'])
@@ -141,12 +217,10 @@ def change_password(request):
     return Response({'message': 'Password changed successfully'})
 
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def pending_invitations(request):
-    """Get pending project invitations for current user."""
+def invitation_list(user):
+    """Pending project invitations of a user, as returned by /invitations/."""
     collaborations = ProjectCollaborator.objects.filter(
-        user=request.user,
+        user=user,
         status='invited'
     ).select_related('project', 'project__user')
 
@@ -168,7 +242,14 @@ def pending_invitations(request):
             'role': collab.role,
         })
 
-    return Response(invitations)
+    return invitations
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def pending_invitations(request):
+    """Get pending project invitations for current user."""
+    return Response(invitation_list(request.user))
 
 
 @api_view(['POST'])
@@ -234,15 +315,111 @@ class ProjectViewSet(viewsets.ModelViewSet):
         1. The owner (user field), OR
         2. An active/completed/invited collaborator
         """
-        return Project.objects.filter(
+        queryset = Project.objects.filter(
             Q(user=self.request.user) |
             Q(collaborators__user=self.request.user,
               collaborators__status__in=['invited', 'active', 'completed'])
         ).distinct()
+        if self.action == 'retrieve':
+            # Owner, avatar and result nested by ProjectSerializer, in the same query
+            queryset = queryset.select_related('user__profile', 'result')
+        return queryset
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    def project_version(self, *fields, **annotations):
+        """
+        Version of the requested project for conditional GETs.
+
+        One query on the same queryset as get_object, so it also checks
+        access, returning the given fields and annotations.
+
+        Raises:
+            Http404: If the user cannot see the project
+        """
+        row = (
+            self.get_queryset().filter(pk=self.kwargs['pk'])
+            .annotate(**annotations)
+            .values_list(*fields, *annotations)
+            .first()
+        )
+        if row is None:
+            raise Http404
+        return row
+
+    def detail_version(self, request):
+        """Version of the project with its comparisons and result."""
+        return self.project_version(
+            'updated_at', 'comparison_count', 'result__updated_at',
+            last_comparison=latest_update(Comparison.objects.filter(project=OuterRef('pk'))),
+        )
+
+    def progress_version(self, request):
+        """Version of the user's progress and comparisons (single-user ones have no user)."""
+        collaborator = ProjectCollaborator.objects.filter(project=OuterRef('pk'), user=request.user)
+        return self.project_version(
+            'updated_at', 'is_collaborative', 'comparison_count',
+            collaborator_status=Subquery(collaborator.values('status')),
+            user_count=Subquery(collaborator.values('comparison_count')),
+            last_comparison=latest_update(Comparison.objects.filter(
+                Q(user=request.user) | Q(user__isnull=True), project=OuterRef('pk')
+            )),
+        )
+
+    def collaboration_version(self, request):
+        """Version of the collaboration status, from the progress counters."""
+        return self.project_version(
+            'updated_at', 'is_collaborative', 'active_experts', 'completed_experts',
+            user_count=Subquery(ProjectCollaborator.objects.filter(
+                project=OuterRef('pk'), user=request.user
+            ).values('comparison_count')),
+        )
+
+    def collaborators_version(self, request):
+        """Version of the collaborator list."""
+        collaborators = ProjectCollaborator.objects.filter(project=OuterRef('pk'))
+        return self.project_version(
+            collaborator_count=count_rows(collaborators, 'project'),
+            last_collaborator=latest_update(collaborators),
+        )
+
+    def aggregated_results_version(self, request):
+        """Version of the latest aggregated result and the expert results shown with it."""
+        collaborators = ProjectCollaborator.objects.filter(project=OuterRef('pk'))
+        latest_result = AggregatedResult.objects.filter(
+            project=OuterRef('pk')
+        ).order_by('-created_at')
+        return self.project_version(
+            'updated_at', 'is_collaborative', 'comparison_count',
+            result_id=Subquery(latest_result.values('id')[:1]),
+            result_updated=Subquery(latest_result.values('updated_at')[:1]),
+            collaborator_count=count_rows(collaborators, 'project'),
+            last_collaborator=latest_update(collaborators),
+            last_comparison=latest_update(Comparison.objects.filter(project=OuterRef('pk'))),
+        )
+
+    def list(self, request, *args, **kwargs):
+        """Project list, serialized from values() rows (see ValuesSerializer)."""
+        rows = project_list_values.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response([project_list_values.represent(row) for row in page])
+        return Response([project_list_values.represent(row) for row in rows])
+
+    @conditional('detail_version')
+    def retrieve(self, request, *args, **kwargs):
+        """Project details, optionally compact (see compact.py)."""
+        try:
+            options = response_options(request.query_params)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if options is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        return Response(ShapedProjectSerializer(self.get_object(), options=options).data)
+
     @action(detail=True, methods=['post'])
     def add_comparison(self, request, pk=None):
         """Add a pairwise comparison to the project."""
@@ -297,6 +474,15 @@ class ProjectViewSet(viewsets.ModelViewSet):
                     collaborator.save()
             except ProjectCollaborator.DoesNotExist:
                 pass  # Owner doesn't have ProjectCollaborator entry
+
+            # Re-answering a pair sent back as consensus feedback resolves it
+            Feedback.objects.filter(
+                consensus_round__project=project,
+                consensus_round__status='open',
+                user=request.user,
+                index_a=index_a,
+                index_b=index_b
+            ).update(resolved=True)
         else:
             # For single-user projects, maintain backward compatibility
             comparison, created = Comparison.objects.update_or_create(
@@ -306,22 +492,74 @@ class ProjectViewSet(viewsets.ModelViewSet):
                 defaults=defaults
             )
 
-        # Update project status (check completion per user in collaborative mode)
+        # Update project status (collaborative users track their own completion)
+        if not project.is_collaborative:
+            n = len(project.alternatives)
+            total_needed = n * (n - 1) // 2
+
+            # For single-user projects, maintain backward compatibility
+            project.refresh_from_db(fields=['comparison_count'])
+            if project.comparison_count >= total_needed:
+                project.status = 'completed'
+                project.save()
+
+        return Response(ComparisonSerializer(comparison).data)
+
+    @action(detail=True, methods=['post'])
+    def bulk_comparisons(self, request, pk=None):
+        """Add or update many pairwise comparisons at once and return the progress."""
+        project = self.get_object()
+
+        try:
+            pairs = save_comparisons(project, request.user, request.data.get('comparisons'))
+        except ValueError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         n = len(project.alternatives)
         total_needed = n * (n - 1) // 2
 
         if project.is_collaborative:
-            # For collaborative projects, count only current user's comparisons
-            user_completed_count = project.comparisons.filter(user=request.user).count()
-            # Don't change project status - each user tracks their own completion
+            collaborator = ProjectCollaborator.objects.filter(
+                project=project, user=request.user
+            ).first()
+            completed_count = collaborator.comparison_count if collaborator else 0
+
+            # Auto-transition collaborator from 'invited' to 'active' on first comparison
+            if collaborator and collaborator.status == 'invited':
+                collaborator.status = 'active'
+                collaborator.save()
+
+            # Re-answering pairs sent back as consensus feedback resolves them;
+            # feedback pairs are canonical like the saved ones
+            saved_pairs = set(pairs)
+            feedback_ids = [
+                feedback_id for feedback_id, index_a, index_b in Feedback.objects.filter(
+                    consensus_round__project=project,
+                    consensus_round__status='open',
+                    user=request.user,
+                    resolved=False
+                ).values_list('id', 'index_a', 'index_b')
+                if (index_a, index_b) in saved_pairs
+            ]
+            if feedback_ids:
+                Feedback.objects.filter(id__in=feedback_ids).update(resolved=True)
         else:
-            # For single-user projects, maintain backward compatibility
-            completed_count = project.comparisons.count()
-            if completed_count >= total_needed:
+            project.refresh_from_db(fields=['comparison_count'])
+            completed_count = project.comparison_count
+            if completed_count >= total_needed and project.status != 'completed':
                 project.status = 'completed'
                 project.save()
 
-        return Response(ComparisonSerializer(comparison).data)
+        return Response({
+            'saved': len(pairs),
+            'total_needed': total_needed,
+            'completed': completed_count,
+            'progress_percentage': (completed_count / total_needed * 100) if total_needed > 0 else 0,
+            'is_complete': completed_count >= total_needed,
+        })
 
     @action(detail=True, methods=['post'])
     def calculate_results(self, request, pk=None):
@@ -331,15 +569,8 @@ class ProjectViewSet(viewsets.ModelViewSet):
         # CRITICAL: In collaborative mode, check if all experts completed
         if project.is_collaborative:
             # Check if all collaborators have completed
-            total_collaborators = ProjectCollaborator.objects.filter(
-                project=project,
-                status__in=['active', 'completed']
-            ).count()
-
-            completed_collaborators = ProjectCollaborator.objects.filter(
-                project=project,
-                status='completed'
-            ).count()
+            total_collaborators = project.active_experts + project.completed_experts
+            completed_collaborators = project.completed_experts
 
             if completed_collaborators < total_collaborators:
                 # Not all experts finished yet
@@ -349,7 +580,8 @@ class ProjectViewSet(viewsets.ModelViewSet):
                         'message': 'Очікування результатів інших експертів',
                         'completed_experts': completed_collaborators,
                         'total_experts': total_collaborators,
-                        'help': 'Результати будуть доступні після завершення роботи всіх експертів'
+                        'help': 'Результати будуть доступні після завершення роботи всіх експертів',
+                        'interim_help': 'POST /api/projects/{id}/aggregate/ з include_partial=true'
                     },
                     status=status.HTTP_200_OK  # Not an error - it's a valid state
                 )
@@ -368,7 +600,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
         # Single-user mode: calculate results normally
         n = len(project.alternatives)
         total_needed = n * (n - 1) // 2
-        completed_count = project.comparisons.count()
+        completed_count = project.comparison_count
 
         if completed_count < total_needed:
             return Response(
@@ -377,28 +609,23 @@ class ProjectViewSet(viewsets.ModelViewSet):
             )
 
         # Build comparison matrix from user's comparisons
-        comparisons_list = [
-            (c.index_a, c.index_b, c.value)
-            for c in project.comparisons.all()
-        ]
-        matrix = build_comparison_matrix(n, comparisons_list)
+        comparisons_list = list(project.comparisons.values_list('index_a', 'index_b', 'value'))
 
-        # Calculate weights
-        weights = calculate_weights_eigenvector(matrix)
-
-        # Calculate rankings
-        rankings = calculate_rankings(weights)
+        # Calculate weights, rankings and consistency (in the compute pool for large n)
+        try:
+            solution = dispatch(solve_comparisons, n, comparisons_list, size=n * n)
+        except (ComputeBusy, ComputeTimeout) as e:
+            return compute_unavailable(e)
 
-        # Check consistency
-        consistency = check_consistency(matrix, weights)
+        consistency = solution['consistency']
 
         # Create or update result
         result, created = Result.objects.update_or_create(
             project=project,
             defaults={
-                'matrix': matrix.tolist(),
-                'weights': weights.tolist(),
-                'rankings': rankings.tolist(),
+                'matrix': solution['matrix'],
+                'weights': solution['weights'],
+                'rankings': solution['rankings'],
                 'lambda_max': consistency['lambda_max'],
                 'consistency_index': consistency['CI'],
                 'consistency_ratio': consistency['CR'],
@@ -454,6 +681,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
             )
 
     @action(detail=True, methods=['get'])
+    @conditional('progress_version')
     def my_progress(self, request, pk=None):
         """Get current user's completion progress and comparisons."""
         project = self.get_object()
@@ -468,12 +696,12 @@ class ProjectViewSet(viewsets.ModelViewSet):
                 project=project,
                 user=user
             )
-            completed_count = user_comparisons.count()
 
             # Get collaborator status
             try:
                 collaborator = ProjectCollaborator.objects.get(project=project, user=user)
                 collab_status = collaborator.status
+                completed_count = collaborator.comparison_count
 
                 # Auto-transition from 'invited' to 'active' when user first accesses project
                 if collaborator.status == 'invited':
@@ -482,10 +710,11 @@ class ProjectViewSet(viewsets.ModelViewSet):
                     collab_status = 'active'
             except ProjectCollaborator.DoesNotExist:
                 collab_status = 'owner' if project.user == user else 'unknown'
+                completed_count = user_comparisons.count()
         else:
             # Single-user mode
             user_comparisons = project.comparisons.all()
-            completed_count = user_comparisons.count()
+            completed_count = project.comparison_count
             collab_status = 'owner'
 
         return Response({
@@ -495,10 +724,11 @@ class ProjectViewSet(viewsets.ModelViewSet):
             'is_complete': completed_count >= total_needed,
             'is_collaborative': project.is_collaborative,
             'status': collab_status,
-            'comparisons': ComparisonSerializer(user_comparisons, many=True).data
+            'comparisons': comparison_values.serialize(user_comparisons)
         })
 
     @action(detail=True, methods=['get'])
+    @conditional('collaboration_version')
     def collaboration_status(self, request, pk=None):
         """Get collaboration status for current user."""
         project = self.get_object()
@@ -511,25 +741,18 @@ class ProjectViewSet(viewsets.ModelViewSet):
                 'message': 'Проект в режимі одного користувача'
             })
 
-        # Get current user's completion status
+        # Get current user's completion status (from the progress counters)
         n = len(project.alternatives)
         total_needed = n * (n - 1) // 2
-        user_comparisons_count = Comparison.objects.filter(
+        user_comparisons_count = ProjectCollaborator.objects.filter(
             project=project,
             user=user
-        ).count()
+        ).values_list('comparison_count', flat=True).first() or 0
         user_is_complete = user_comparisons_count >= total_needed
 
         # Get overall collaboration status
-        total_collaborators = ProjectCollaborator.objects.filter(
-            project=project,
-            status__in=['active', 'completed']
-        ).count()
-
-        completed_collaborators = ProjectCollaborator.objects.filter(
-            project=project,
-            status='completed'
-        ).count()
+        total_collaborators = project.active_experts + project.completed_experts
+        completed_collaborators = project.completed_experts
 
         all_experts_done = completed_collaborators >= total_collaborators
 
@@ -666,11 +889,12 @@ class ProjectViewSet(viewsets.ModelViewSet):
         })
 
     @action(detail=True, methods=['get'])
+    @conditional('collaborators_version')
     def collaborators(self, request, pk=None):
         """Get list of collaborators for a project."""
         project = self.get_object()
 
-        collaborators = ProjectCollaborator.objects.filter(project=project)
+        collaborators = ProjectCollaborator.objects.filter(project=project).select_related('user')
         data = []
         for collab in collaborators:
             data.append({
@@ -678,12 +902,82 @@ class ProjectViewSet(viewsets.ModelViewSet):
                 'username': collab.user.username,
                 'role': collab.role,
                 'status': collab.status,
+                'competence': collab.competence,
+                'group': collab.group,
                 'invited_at': collab.invited_at,
                 'completed_at': collab.completed_at,
             })
 
         return Response({'collaborators': data})
 
+    @action(detail=True, methods=['post'])
+    def set_competence(self, request, pk=None):
+        """Set an expert's competence for competence-weighted aggregation."""
+        project = self.get_object()
+
+        if project.user != request.user:
+            return Response(
+                {'error': 'Only the project owner can set expert competence'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        user_id = request.data.get('user_id')
+        competence = request.data.get('competence')
+
+        try:
+            competence = float(competence)
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'user_id and numeric competence are required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if competence < 0:
+            return Response(
+                {'error': 'Competence must be non-negative'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            collaborator = ProjectCollaborator.objects.get(project=project, user_id=user_id)
+        except ProjectCollaborator.DoesNotExist:
+            return Response(
+                {'error': 'Collaborator not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        collaborator.competence = competence
+        collaborator.save(update_fields=['competence'])
+
+        return Response({'user_id': collaborator.user_id, 'competence': collaborator.competence})
+
+    @action(detail=True, methods=['post'])
+    def set_group(self, request, pk=None):
+        """Assign an expert to a group (team) for hierarchical aggregation."""
+        project = self.get_object()
+
+        if project.user != request.user:
+            return Response(
+                {'error': 'Only the project owner can assign expert groups'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        user_id = request.data.get('user_id')
+        group = str(request.data.get('group') or '').strip()
+
+        try:
+            collaborator = ProjectCollaborator.objects.get(project=project, user_id=user_id)
+        except ProjectCollaborator.DoesNotExist:
+            return Response(
+                {'error': 'Collaborator not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        collaborator.group = group
+        collaborator.save(update_fields=['group'])
+
+        return Response({'user_id': collaborator.user_id, 'group': collaborator.group})
+
     @action(detail=True, methods=['post'])
     def mark_completed(self, request, pk=None):
         """Mark user's comparisons as completed."""
@@ -695,12 +989,12 @@ class ProjectViewSet(viewsets.ModelViewSet):
         total_needed = n * (n - 1) // 2
 
         if project.is_collaborative:
-            completed_count = Comparison.objects.filter(
+            completed_count = ProjectCollaborator.objects.filter(
                 project=project,
                 user=user
-            ).count()
+            ).values_list('comparison_count', flat=True).first() or 0
         else:
-            completed_count = project.comparisons.count()
+            completed_count = project.comparison_count
 
         if completed_count < total_needed:
             return Response(
@@ -730,19 +1024,45 @@ class ProjectViewSet(viewsets.ModelViewSet):
             )
 
         method = request.data.get('method', 'AIJ')
+        weighting = request.data.get('weighting', 'equal')
+        robust = parse_flag(request.data.get('robust', False))
+        include_partial = parse_flag(request.data.get('include_partial', False))
+        hierarchical = parse_flag(request.data.get('hierarchical', False))
+
+        try:
+            bootstrap_samples = int(request.data.get('bootstrap', 0))
+            confidence = float(request.data.get('confidence', 0.95))
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'bootstrap must be an integer and confidence a number'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
         try:
-            aggregated_result = save_aggregated_result(project.id, method)
+            aggregated_result = save_aggregated_result(
+                project.id, method, weighting, bootstrap_samples, confidence,
+                robust, include_partial, hierarchical
+            )
             return Response({
                 'id': aggregated_result.id,
                 'method': aggregated_result.aggregation_method,
+                'weighting': aggregated_result.weighting,
+                'expert_weights': aggregated_result.expert_weights,
                 'num_experts': aggregated_result.num_experts,
                 'aggregated_matrix': aggregated_result.aggregated_matrix,
                 'final_weights': aggregated_result.final_weights,
                 'consistency_ratio': aggregated_result.consistency_ratio,
                 'lambda_max': aggregated_result.lambda_max,
                 'consistency_index': aggregated_result.consistency_index,
+                'consensus': aggregated_result.consensus,
+                'bootstrap': aggregated_result.bootstrap,
+                'outliers': aggregated_result.outliers,
+                'include_partial': aggregated_result.include_partial,
+                'coverage': aggregated_result.coverage,
+                'group_results': aggregated_result.group_results,
             })
+        except (ComputeBusy, ComputeTimeout) as e:
+            return compute_unavailable(e)
         except ValueError as e:
             return Response(
                 {'error': str(e)},
@@ -750,8 +1070,181 @@ class ProjectViewSet(viewsets.ModelViewSet):
             )
 
     @action(detail=True, methods=['get'])
+    def outliers(self, request, pk=None):
+        """Score completed experts against the leave-one-out group matrix."""
+        project = self.get_object()
+
+        if not project.is_collaborative:
+            return Response(
+                {'error': 'Project must have collaboration enabled'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        include_partial = parse_flag(request.query_params.get('include_partial', False))
+
+        try:
+            return Response(analyze_outliers(project.id, include_partial))
+        except ValueError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+    @action(detail=True, methods=['get'])
+    def clusters(self, request, pk=None):
+        """Cluster experts into opinion blocs with per-cluster weights."""
+        project = self.get_object()
+
+        if not project.is_collaborative:
+            return Response(
+                {'error': 'Project must have collaboration enabled'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        method = request.query_params.get('method', 'kmeans')
+        include_partial = parse_flag(request.query_params.get('include_partial', False))
+
+        try:
+            num_clusters = int(request.query_params.get('num_clusters', 3))
+        except ValueError:
+            return Response(
+                {'error': 'num_clusters must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            return Response(cluster_expert_opinions(project.id, num_clusters, method, include_partial))
+        except ValueError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+    @action(detail=True, methods=['post'])
+    def rescale(self, request, pk=None):
+        """Change the project's scale type and convert all stored judgments to it."""
+        project = self.get_object()
+
+        if project.user != request.user:
+            return Response(
+                {'error': 'Only the project owner can change the scale'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        try:
+            scale_type = int(request.data.get('scale_type'))
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'scale_type must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            return Response(rescale_project(project.id, scale_type))
+        except ValueError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+    @action(detail=True, methods=['post'])
+    def consensus_round(self, request, pk=None):
+        """Close the current consensus round and open the next one with feedback."""
+        project = self.get_object()
+
+        if project.user != request.user:
+            return Response(
+                {'error': 'Only the project owner can start consensus rounds'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        if not project.is_collaborative:
+            return Response(
+                {'error': 'Project must have collaboration enabled'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            num_pairs = int(request.data.get('num_pairs', 3))
+            min_distance = request.data.get('min_distance')
+            min_distance = float(min_distance) if min_distance is not None else None
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'num_pairs must be an integer and min_distance a number'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            consensus_round = open_consensus_round(project.id, num_pairs, min_distance)
+        except ValueError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        feedback_counts = {
+            str(user_id): 0 for user_id in consensus_round.expert_ids
+        }
+        for user_id in consensus_round.feedback.values_list('user_id', flat=True):
+            feedback_counts[str(user_id)] += 1
+
+        return Response({
+            'round': consensus_round.number,
+            'status': consensus_round.status,
+            'num_experts': len(consensus_round.expert_ids),
+            'final_weights': consensus_round.final_weights,
+            'consistency_ratio': consensus_round.consistency_ratio,
+            'consensus_score': consensus_round.consensus_score,
+            'feedback': feedback_counts,
+        }, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=['get'])
+    def consensus_status(self, request, pk=None):
+        """Current group result of the latest consensus round."""
+        project = self.get_object()
+
+        consensus_round = project.consensus_rounds.first()
+        if consensus_round is None:
+            return Response(
+                {'error': 'No consensus rounds yet'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        try:
+            return Response(consensus_round_status(consensus_round))
+        except ValueError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+    @action(detail=True, methods=['get'])
+    def my_feedback(self, request, pk=None):
+        """Judgments the current user is asked to reconsider in the open round."""
+        project = self.get_object()
+
+        consensus_round = project.consensus_rounds.filter(status='open').first()
+        if consensus_round is None:
+            return Response({'round': None, 'feedback': []})
+
+        feedback = consensus_round.feedback.filter(user=request.user).values(
+            'index_a', 'index_b', 'previous_value', 'group_value', 'distance', 'resolved'
+        )
+
+        return Response({
+            'round': consensus_round.number,
+            'feedback': list(feedback),
+        })
+
+    @action(detail=True, methods=['get'])
+    @conditional('aggregated_results_version')
     def aggregated_results(self, request, pk=None):
-        """Get aggregated results for a collaborative project."""
+        """
+        Get aggregated results for a collaborative project.
+
+        Accepts the compact, precision and fields parameters (see compact.py);
+        individual results are only solved when they are requested.
+        """
         project = self.get_object()
 
         if not project.is_collaborative:
@@ -760,15 +1253,39 @@ class ProjectViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        try:
+            options = response_options(request.query_params)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
         # Get latest aggregated result
         try:
             result = AggregatedResult.objects.filter(project=project).latest('created_at')
 
             # Get expert breakdown with individual results
-            collaborators = ProjectCollaborator.objects.filter(project=project)
+            collaborators = ProjectCollaborator.objects.filter(project=project).select_related('user')
             expert_breakdown = []
             individual_results = []
 
+            completed_ids = [
+                collab.user_id for collab in collaborators if collab.status == 'completed'
+            ]
+
+            if wants_arrays(request):
+                try:
+                    data = aggregated_result_arrays(project, result, completed_ids, options)
+                except (ComputeBusy, ComputeTimeout, ComputeServiceError) as e:
+                    return compute_unavailable(e)
+                return Response(data if options is None else shape(data, options))
+
+            # Individual experts' results in one batched solve
+            individual = {}
+            if options is None or options.wants('individual_results'):
+                try:
+                    individual = calculate_individual_results(project, completed_ids)
+                except (ComputeBusy, ComputeTimeout, ComputeServiceError) as e:
+                    return compute_unavailable(e)
+
             for collab in collaborators:
                 expert_breakdown.append({
                     'user_id': collab.user.id,
@@ -778,61 +1295,88 @@ class ProjectViewSet(viewsets.ModelViewSet):
                 })
 
                 # Get individual expert's results if they completed
-                if collab.status == 'completed':
-                    try:
-                        from .calculations import build_comparison_matrix
-                        from .aggregation import calculate_eigenvector_weights
-
-                        # Build matrix from this expert's comparisons
-                        comparisons = Comparison.objects.filter(
-                            project=project,
-                            user=collab.user
-                        )
-
-                        if comparisons.exists():
-                            # Convert queryset to list of tuples (index_a, index_b, value)
-                            comp_data = [(c['index_a'], c['index_b'], c['value'])
-                                        for c in comparisons.values('index_a', 'index_b', 'value')]
-
-                            matrix = build_comparison_matrix(
-                                len(project.alternatives),  # Pass integer, not list
-                                comp_data  # Pass list of tuples
-                            )
-
-                            # Calculate weights for this expert
-                            weights, lambda_max, ci, cr = calculate_eigenvector_weights(matrix)  # Returns 4 values
-
-                            individual_results.append({
-                                'user_id': collab.user.id,
-                                'username': collab.user.username,
-                                'matrix': matrix.tolist(),
-                                'weights': weights.tolist(),
-                                'consistency_ratio': float(cr),
-                                'lambda_max': float(lambda_max),
-                                'consistency_index': float(ci),
-                            })
-                    except Exception as e:
-                        print(f"Error calculating individual result for {collab.user.username}: {e}")
-                        continue
-
-            return Response({
+                if collab.user_id in individual:
+                    individual_results.append({
+                        'user_id': collab.user.id,
+                        'username': collab.user.username,
+                        **individual[collab.user_id],
+                    })
+
+            data = {
                 'method': result.aggregation_method,
+                'weighting': result.weighting,
+                'expert_weights': result.expert_weights,
                 'num_experts': result.num_experts,
                 'aggregated_matrix': result.aggregated_matrix,
                 'weights': result.final_weights,
                 'consistency_ratio': result.consistency_ratio,
                 'lambda_max': result.lambda_max,
                 'consistency_index': result.consistency_index,
+                'consensus': result.consensus,
+                'bootstrap': result.bootstrap,
+                'outliers': result.outliers,
+                'include_partial': result.include_partial,
+                'coverage': result.coverage,
+                'group_results': result.group_results,
                 'expert_breakdown': expert_breakdown,
                 'individual_results': individual_results,
                 'created_at': result.created_at,
-            })
+            }
         except AggregatedResult.DoesNotExist:
             return Response(
                 {'error': 'No aggregated results found. Run aggregation first.'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
+        if options is None:
+            return Response(data)
+
+        data = shape(data, options)
+        if options.compact:
+            if data.get('aggregated_matrix'):
+                data['aggregated_matrix'] = pack_matrix(data['aggregated_matrix'])
+            for individual_result in data.get('individual_results', []):
+                individual_result['matrix'] = pack_matrix(individual_result['matrix'])
+        return Response(data)
+
+
+def aggregated_result_arrays(project, result, completed_ids, options):
+    """
+    Matrices and weights of aggregated_results as NumPy arrays, for the
+    binary renderers; individual results are stacked in individual_user_ids order.
+    """
+    data = {
+        'aggregated_matrix': np.asarray(result.aggregated_matrix, dtype=float),
+        'weights': np.asarray(result.final_weights, dtype=float),
+        'consistency_ratio': result.consistency_ratio,
+        'num_experts': result.num_experts,
+    }
+
+    if options is None or options.fields is None or any(
+        name.startswith('individual_') for name in options.fields
+    ):
+        n = len(project.alternatives)
+        judged_ids, matrices, solutions = individual_result_arrays(project, completed_ids)
+        data.update({
+            'individual_user_ids': np.asarray(judged_ids, dtype=np.int64),
+            'individual_matrices': matrices,
+            'individual_weights': np.asarray(
+                [solution['weights'] for solution in solutions], dtype=float
+            ).reshape(len(solutions), n),
+            'individual_consistency_ratios': np.asarray(
+                [solution['consistency_ratio'] for solution in solutions], dtype=float
+            ),
+        })
+
+    return data
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def compute_metrics(request):
+    """Usage and saturation of the compute pool of this server process."""
+    return Response(compute.metrics())
+
 
 # Friends and Messages endpoints
 
@@ -844,14 +1388,14 @@ def get_friends(request):
 
     # Get accepted friendships where user is either the requester or recipient
     from .models import Friendship
-    from .serializers import FriendshipSerializer
+    from .serializers import friendship_values
 
     friendships = Friendship.objects.filter(
         Q(user=user) | Q(friend=user),
         status='accepted'
     )
 
-    return Response(FriendshipSerializer(friendships, many=True).data)
+    return Response(friendship_values.serialize(friendships))
 
 
 @api_view(['GET'])
@@ -860,12 +1404,12 @@ def get_friend_requests(request):
     """Get pending friend requests."""
     user = request.user
     from .models import Friendship
-    from .serializers import FriendshipSerializer
+    from .serializers import friendship_values
 
     # Get pending requests where current user is the recipient
     requests = Friendship.objects.filter(friend=user, status='pending')
 
-    return Response(FriendshipSerializer(requests, many=True).data)
+    return Response(friendship_values.serialize(requests))
 
 
 @api_view(['POST'])
@@ -935,7 +1479,7 @@ def decline_friend_request(request, friendship_id):
 def get_messages(request, user_id):
     """Get messages between current user and another user."""
     from .models import Message
-    from .serializers import MessageSerializer
+    from .serializers import message_values
     from django.contrib.auth.models import User as DjangoUser
 
     try:
@@ -949,9 +1493,14 @@ def get_messages(request, user_id):
     ).order_by('created_at')
 
     # Mark messages as read
-    Message.objects.filter(sender=other_user, recipient=request.user, is_read=False).update(is_read=True)
+    marked = Message.objects.filter(
+        sender=other_user, recipient=request.user, is_read=False
+    ).update(is_read=True)
+    if marked:
+        # Bulk update sends no signal; let the user's other tabs update their unread count
+        publish_user_event(request.user.id, 'messages_read', sender_id=other_user.id, count=marked)
 
-    return Response(MessageSerializer(messages, many=True).data)
+    return Response(message_values.serialize(messages))
 
 
 @api_view(['POST'])
@@ -983,3 +1532,26 @@ def get_unread_count(request):
 
     count = Message.objects.filter(recipient=request.user, is_read=False).count()
     return Response({'unread_count': count})
+
+
+# Notifications
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def notifications_snapshot(request):
+    """
+    Current notification state of the user, in one call.
+
+    Clients load it once and on every (re)connect of the notification
+    stream, whose events then report changes as they happen.
+    """
+    from .models import Friendship, Message
+    from .serializers import friendship_values
+
+    friend_requests = Friendship.objects.filter(friend=request.user, status='pending')
+
+    return Response({
+        'invitations': invitation_list(request.user),
+        'friend_requests': friendship_values.serialize(friend_requests),
+        'unread_count': Message.objects.filter(recipient=request.user, is_read=False).count(),
+    })
@@ -2,6 +2,7 @@ import React from 'react'
 import { BrowserRouter as Router, Routes, Route, Navigate } from 'react-router-dom'
 import { AuthProvider, useAuth } from './contexts/AuthContext'
 import { LanguageProvider } from './contexts/LanguageContext'
+import { NotificationProvider } from './contexts/NotificationContext'
 import Login from './components/auth/Login'
 import Register from './components/auth/Register'
 import Dashboard from './components/Dashboard'
@@ -27,51 +28,53 @@ function App() {
     <Router>
       <LanguageProvider>
         <AuthProvider>
-          <div className="App">
-            <Routes>
-              <Route path="/login" element={
-                <PublicRoute>
-                  <Login />
-                </PublicRoute>
-              } />
-              <Route path="/register" element={
-                <PublicRoute>
-                  <Register />
-                </PublicRoute>
-              } />
-              <Route path="/dashboard" element={
-                <PrivateRoute>
-                  <Dashboard />
-                </PrivateRoute>
-              } />
-              <Route path="/project/:id" element={
-                <PrivateRoute>
-                  <ProjectDetail />
-                </PrivateRoute>
-              } />
-              <Route path="/project/:id/compare" element={
-                <PrivateRoute>
-                  <ComparisonWorkflow />
-                </PrivateRoute>
-              } />
-              <Route path="/project/:id/settings" element={
-                <PrivateRoute>
-                  <ProjectSettings />
-                </PrivateRoute>
-              } />
-              <Route path="/project/:id/aggregated" element={
-                <PrivateRoute>
-                  <AggregatedResults />
-                </PrivateRoute>
-              } />
-              <Route path="/friends" element={
-                <PrivateRoute>
-                  <Friends />
-                </PrivateRoute>
-              } />
-              <Route path="/" element={<Navigate to="/dashboard" />} />
-            </Routes>
-          </div>
+          <NotificationProvider>
+            <div className="App">
+              <Routes>
+                <Route path="/login" element={
+                  <PublicRoute>
+                    <Login />
+                  </PublicRoute>
+                } />
+                <Route path="/register" element={
+                  <PublicRoute>
+                    <Register />
+                  </PublicRoute>
+                } />
+                <Route path="/dashboard" element={
+                  <PrivateRoute>
+                    <Dashboard />
+                  </PrivateRoute>
+                } />
+                <Route path="/project/:id" element={
+                  <PrivateRoute>
+                    <ProjectDetail />
+                  </PrivateRoute>
+                } />
+                <Route path="/project/:id/compare" element={
+                  <PrivateRoute>
+                    <ComparisonWorkflow />
+                  </PrivateRoute>
+                } />
+                <Route path="/project/:id/settings" element={
+                  <PrivateRoute>
+                    <ProjectSettings />
+                  </PrivateRoute>
+                } />
+                <Route path="/project/:id/aggregated" element={
+                  <PrivateRoute>
+                    <AggregatedResults />
+                  </PrivateRoute>
+                } />
+                <Route path="/friends" element={
+                  <PrivateRoute>
+                    <Friends />
+                  </PrivateRoute>
+                } />
+                <Route path="/" element={<Navigate to="/dashboard" />} />
+              </Routes>
+            </div>
+          </NotificationProvider>
         </AuthProvider>
       </LanguageProvider>
     </Router>
@@ -1,6 +1,7 @@
 import React, { useState, useEffect, useCallback } from 'react'
 import { useLanguage } from '../contexts/LanguageContext'
 import { useAuth } from '../contexts/AuthContext'
+import { useNotifications } from '../contexts/NotificationContext'
 import { friendsAPI, messagesAPI, invitationAPI } from '../utils/api'
 import Header from './Header'
 import './Friends.css'
@@ -8,10 +9,14 @@ import './Friends.css'
 export default function Friends() {
   const { t } = useLanguage()
   const { user: currentUser } = useAuth()
+  const {
+    friendRequests,
+    invitations: projectInvitations,
+    lastEvent,
+    refresh: refreshNotifications,
+  } = useNotifications()
   const [activeTab, setActiveTab] = useState('friends') // 'friends', 'requests', 'chat', 'invitations'
   const [friends, setFriends] = useState([])
-  const [friendRequests, setFriendRequests] = useState([])
-  const [projectInvitations, setProjectInvitations] = useState([])
   const [selectedFriend, setSelectedFriend] = useState(null)
   const [messages, setMessages] = useState([])
   const [newMessage, setNewMessage] = useState('')
@@ -26,25 +31,21 @@ export default function Friends() {
     loadData()
   }, [])
 
+  // Friend requests and invitations come from the notification snapshot
   const loadData = useCallback(async () => {
     try {
-      const [friendsRes, requestsRes, invitationsRes] = await Promise.all([
+      const [friendsRes] = await Promise.all([
         friendsAPI.getFriends(),
-        friendsAPI.getRequests(),
-        invitationAPI.getPending(),
+        refreshNotifications(),
       ])
       setFriends(Array.isArray(friendsRes.data) ? friendsRes.data : [])
-      setFriendRequests(Array.isArray(requestsRes.data) ? requestsRes.data : [])
-      setProjectInvitations(Array.isArray(invitationsRes.data) ? invitationsRes.data : [])
       setLoading(false)
     } catch (err) {
       console.error('Failed to load data:', err)
       setFriends([])
-      setFriendRequests([])
-      setProjectInvitations([])
       setLoading(false)
     }
-  }, [])
+  }, [refreshNotifications])
 
   const loadMessages = useCallback(async (friendId) => {
     try {
@@ -55,6 +56,18 @@ export default function Friends() {
     }
   }, [])
 
+  // Follow notifications: accepted friend requests and messages in the open chat
+  useEffect(() => {
+    if (!lastEvent) return
+
+    if (lastEvent.type === 'friend_request' && lastEvent.status === 'accepted') {
+      loadData()
+    } else if (lastEvent.type === 'message' && selectedFriend && currentUser) {
+      const otherUserId = selectedFriend.user.id === currentUser.id ? selectedFriend.friend.id : selectedFriend.user.id
+      if (lastEvent.sender_id === otherUserId) loadMessages(otherUserId)
+    }
+  }, [lastEvent])
+
   const handleSelectFriend = useCallback((friendship) => {
     setSelectedFriend(friendship)
     setActiveTab('chat')
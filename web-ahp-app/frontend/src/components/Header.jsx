@@ -2,12 +2,15 @@ import React, { useState, useCallback } from 'react'
 import { useNavigate, useLocation } from 'react-router-dom'
 import { useAuth } from '../contexts/AuthContext'
 import { useLanguage } from '../contexts/LanguageContext'
+import { useNotifications } from '../contexts/NotificationContext'
 import ProfilePanel from './ProfilePanel'
 import './Header.css'
 
 function Header({ title, subtitle, showBackButton = true }) {
   const [showProfilePanel, setShowProfilePanel] = useState(false)
   const { user } = useAuth()
+  const { invitations, friendRequests, unreadCount } = useNotifications()
+  const pendingCount = invitations.length + friendRequests.length + unreadCount
   const { t } = useLanguage()
   const navigate = useNavigate()
   const location = useLocation()
@@ -87,6 +90,7 @@ function Header({ title, subtitle, showBackButton = true }) {
                   <path d="M16 3.13a4 4 0 0 1 0 7.75"/>
                 </svg>
                 <span>Друзі</span>
+                {pendingCount > 0 && <b className="nav-badge">{pendingCount}</b>}
               </button>
 
               <button
@@ -25,16 +25,47 @@ export default function ProjectDetail() {
     loadUserProgress()
   }, [id])
 
-  // Reload collaboration status periodically in collaborative mode
+  // Reload collaboration status when the server reports a change in collaborative
+  // mode, or periodically if the event stream is unavailable
   useEffect(() => {
     if (!project?.is_collaborative) return
 
-    const interval = setInterval(() => {
+    const refresh = () => {
       loadCollaborationStatus()
       loadCollaborators()
-    }, 5000) // Reload every 5 seconds
+    }
+
+    let interval = null
+    const startPolling = () => {
+      if (!interval) interval = setInterval(refresh, 5000) // Reload every 5 seconds
+    }
+    const stopPolling = () => {
+      clearInterval(interval)
+      interval = null
+    }
+
+    if (typeof EventSource === 'undefined') {
+      startPolling()
+      return stopPolling
+    }
 
-    return () => clearInterval(interval)
+    const events = projectAPI.openEvents(id)
+    events.onopen = () => {
+      // Catch up on changes made while (re)connecting
+      stopPolling()
+      refresh()
+    }
+    events.onmessage = refresh
+    events.onerror = () => {
+      // The browser reconnects by itself unless the stream was refused
+      // (WSGI server, expired token), so only then fall back to polling
+      if (events.readyState === EventSource.CLOSED) startPolling()
+    }
+
+    return () => {
+      events.close()
+      stopPolling()
+    }
   }, [project?.is_collaborative, id])
 
   const loadProject = async () => {
@@ -0,0 +1,88 @@
+import React, { createContext, useState, useContext, useEffect, useCallback } from 'react'
+import { notificationsAPI } from '../utils/api'
+import { useAuth } from './AuthContext'
+
+const NotificationContext = createContext()
+
+const EMPTY_SNAPSHOT = { invitations: [], friend_requests: [], unread_count: 0 }
+
+export function useNotifications() {
+  return useContext(NotificationContext)
+}
+
+export function NotificationProvider({ children }) {
+  const { user } = useAuth()
+  const [snapshot, setSnapshot] = useState(EMPTY_SNAPSHOT)
+  const [lastEvent, setLastEvent] = useState(null)
+
+  const refresh = useCallback(async () => {
+    try {
+      const response = await notificationsAPI.getSnapshot()
+      setSnapshot(response.data)
+    } catch (error) {
+      console.error('Failed to load notifications:', error)
+    }
+  }, [])
+
+  // One stream per logged-in user: reload the snapshot when the server reports
+  // a change, or periodically if the stream is unavailable
+  useEffect(() => {
+    if (!user) {
+      setSnapshot(EMPTY_SNAPSHOT)
+      return
+    }
+
+    let interval = null
+    const startPolling = () => {
+      if (!interval) interval = setInterval(refresh, 30000) // Reload every 30 seconds
+    }
+    const stopPolling = () => {
+      clearInterval(interval)
+      interval = null
+    }
+
+    if (typeof EventSource === 'undefined') {
+      refresh()
+      startPolling()
+      return stopPolling
+    }
+
+    const events = notificationsAPI.openEvents()
+    events.onopen = () => {
+      // Catch up on changes made while (re)connecting
+      stopPolling()
+      refresh()
+    }
+    events.onmessage = (message) => {
+      setLastEvent(JSON.parse(message.data))
+      refresh()
+    }
+    events.onerror = () => {
+      // The browser reconnects by itself unless the stream was refused
+      // (WSGI server, expired token), so only then fall back to polling
+      if (events.readyState === EventSource.CLOSED) {
+        refresh()
+        startPolling()
+      }
+    }
+
+    return () => {
+      events.close()
+      stopPolling()
+    }
+  }, [user?.id, refresh])
+
+  const value = {
+    invitations: snapshot.invitations,
+    friendRequests: snapshot.friend_requests,
+    unreadCount: snapshot.unread_count,
+    lastEvent,
+    refresh,
+  }
+
+  return (
+    <NotificationContext.Provider value={value}>
+      {children}
+    </NotificationContext.Provider>
+  )
+}
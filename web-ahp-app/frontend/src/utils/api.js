@@ -90,6 +90,16 @@ export const messagesAPI = {
   getUnreadCount: () => api.get('/messages/unread/'),
 }
 
+// Notification endpoints
+export const notificationsAPI = {
+  getSnapshot: () => api.get('/notifications/snapshot/'),
+  // Server-Sent Events of invitations, friend requests and messages; EventSource
+  // cannot send headers, so the access token goes in the query string
+  openEvents: () => new EventSource(
+    `${API_URL}/notifications/events/?token=${encodeURIComponent(localStorage.getItem('access_token') || '')}`
+  ),
+}
+
 // Project endpoints
 export const projectAPI = {
   list: () => api.get('/projects/'),
@@ -98,6 +108,7 @@ export const projectAPI = {
   update: (id, data) => api.patch(`/projects/${id}/`, data),
   delete: (id) => api.delete(`/projects/${id}/`),
   addComparison: (id, data) => api.post(`/projects/${id}/add_comparison/`, data),
+  bulkComparisons: (id, comparisons) => api.post(`/projects/${id}/bulk_comparisons/`, { comparisons }),
   deleteComparison: (id, data) => api.delete(`/projects/${id}/delete_comparison/`, { data }),
   calculateResults: (id) => api.post(`/projects/${id}/calculate_results/`),
 
@@ -108,8 +119,22 @@ export const projectAPI = {
   getCollaborationStatus: (id) => api.get(`/projects/${id}/collaboration_status/`),
   getMyProgress: (id) => api.get(`/projects/${id}/my_progress/`),
   markCompleted: (id) => api.post(`/projects/${id}/mark_completed/`),
-  aggregate: (id, method) => api.post(`/projects/${id}/aggregate/`, { method }),
+  aggregate: (id, method, options = {}) => api.post(`/projects/${id}/aggregate/`, { method, ...options }),
+  setCompetence: (id, userId, competence) => api.post(`/projects/${id}/set_competence/`, { user_id: userId, competence }),
+  setGroup: (id, userId, group) => api.post(`/projects/${id}/set_group/`, { user_id: userId, group }),
+  getOutliers: (id) => api.get(`/projects/${id}/outliers/`),
+  getClusters: (id, params = {}) => api.get(`/projects/${id}/clusters/`, { params }),
+  rescale: (id, scaleType) => api.post(`/projects/${id}/rescale/`, { scale_type: scaleType }),
+  startConsensusRound: (id, options = {}) => api.post(`/projects/${id}/consensus_round/`, options),
+  getConsensusStatus: (id) => api.get(`/projects/${id}/consensus_status/`),
+  getMyFeedback: (id) => api.get(`/projects/${id}/my_feedback/`),
   getAggregatedResults: (id) => api.get(`/projects/${id}/aggregated_results/`),
+
+  // Server-Sent Events of collaboration changes; EventSource cannot send headers,
+  // so the access token goes in the query string
+  openEvents: (id) => new EventSource(
+    `${API_URL}/projects/${id}/events/?token=${encodeURIComponent(localStorage.getItem('access_token') || '')}`
+  ),
 }
 
 export default api